@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+r"""Benchmark agentskills operations against synthetic skill repositories.
+
+Usage:
+    uv run python benchmarks/run.py --sizes 10,1000,10000 \\
+        --output benchmarks/results/$(git rev-parse --short HEAD).json
+    uv run python benchmarks/run.py --sizes 10,1000 --compare old.json
+
+Each size gets a freshly generated repo (see synthetic.py) in a temporary
+directory. Results are written as JSON so runs on different commits can
+be compared with --compare.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from synthetic import RepoSpec, generate_repo
+
+from agentskills import SkillCatalog, discover_all_skills
+from agentskills.bootstrap import install_skill
+from agentskills.cache import load_catalog
+from agentskills.link import main as link_main
+from agentskills.package import package_skill
+
+DEFAULT_SIZES = "10,1000,10000"
+
+
+def _timed(fn: Callable[[], object], repeat: int = 1) -> float:
+    """Return the best wall time of fn over repeat runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _install_all(skills_root: Path, project: Path, mode: str) -> None:
+    """Install every skill in the catalog into project/.agents/skills."""
+    catalog = SkillCatalog.scan(skills_root)
+    destination = project / ".agents" / "skills"
+    destination.mkdir(parents=True)
+    for name in catalog.names:
+        install_skill(name, skills_root, destination, mode, False, catalog=catalog)
+
+
+def _link(project: Path) -> None:
+    """Run `agentskills link --force` against project with output suppressed."""
+    argv = sys.argv
+    sys.argv = ["agentskills link", "--project", str(project), "--force"]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            if link_main() != 0:
+                raise RuntimeError(f"link failed for {project}")
+    finally:
+        sys.argv = argv
+
+
+def _package_all(repo: Path) -> None:
+    """Package every skill in the repo into repo/dist."""
+    catalog = SkillCatalog.scan(repo / "skills")
+    for name in catalog.names:
+        package_skill(name, repo, overwrite=True, catalog=catalog)
+
+
+def bench_size(spec: RepoSpec, workdir: Path, repeat: int) -> list[dict[str, Any]]:
+    """Run every benchmark against one generated repo."""
+    repo = workdir / "repo"
+    skills_root = generate_repo(repo, spec)
+    os.environ["AGENTSKILLS_CACHE_DIR"] = str(workdir / "cache")
+    count = len(SkillCatalog.scan(skills_root))
+
+    timings: dict[str, float] = {
+        "discover_all_skills": _timed(lambda: discover_all_skills(skills_root), repeat),
+        "load_catalog_cold": _timed(
+            lambda: load_catalog(skills_root, frontmatter=True, use_cache=False),
+        ),
+    }
+    load_catalog(skills_root, frontmatter=True)
+    timings["load_catalog_warm"] = _timed(
+        lambda: load_catalog(skills_root, frontmatter=True), repeat
+    )
+    timings["install_skill_copy"] = _timed(
+        lambda: _install_all(skills_root, workdir / "copy-project", "copy")
+    )
+    timings["install_skill_symlink"] = _timed(
+        lambda: _install_all(skills_root, workdir / "symlink-project", "symlink")
+    )
+    timings["link_main"] = _timed(lambda: _link(workdir / "copy-project"), repeat)
+    timings["package_skill"] = _timed(lambda: _package_all(repo))
+
+    return [
+        {
+            "skills": spec.skills,
+            "catalog_size": count,
+            "operation": operation,
+            "seconds": round(seconds, 6),
+            "per_skill_us": round(seconds / max(count, 1) * 1e6, 2),
+        }
+        for operation, seconds in timings.items()
+    ]
+
+
+def _git_commit() -> str | None:
+    """Return the current commit of the working tree, if any."""
+    result = subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=Path(__file__).resolve().parent,
+    )
+    return result.stdout.strip() or None
+
+
+def compare(current: list[dict[str, Any]], baseline_path: Path) -> list[str]:
+    """Return one line per operation comparing timings with a previous run."""
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    previous = {
+        (row["skills"], row["operation"]): row["seconds"]
+        for row in baseline.get("results", [])
+    }
+    lines = []
+    for row in current:
+        old = previous.get((row["skills"], row["operation"]))
+        if not old:
+            continue
+        ratio = row["seconds"] / old
+        lines.append(
+            f"{row['operation']:24s} {row['skills']:>6d}  "
+            f"{old:10.4f}s -> {row['seconds']:10.4f}s  x{ratio:.2f}"
+        )
+    return lines
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse CLI arguments for the benchmark runner."""
+    parser = argparse.ArgumentParser(description="Benchmark agentskills.")
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"Comma-separated skill counts (default: {DEFAULT_SIZES}).",
+    )
+    parser.add_argument("--curated-ratio", type=float, default=0.2)
+    parser.add_argument("--references", type=int, default=2)
+    parser.add_argument("--reference-bytes", type=int, default=2048)
+    parser.add_argument("--body-bytes", type=int, default=1024)
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Repeats for read-only operations; the best run is kept.",
+    )
+    parser.add_argument("--output", help="Write results JSON to this path.")
+    parser.add_argument("--compare", help="Previous results JSON to compare with.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the benchmark suite and print or write results."""
+    args = parse_args()
+    results: list[dict[str, Any]] = []
+    for size in (int(part) for part in args.sizes.split(",") if part.strip()):
+        spec = RepoSpec(
+            skills=size,
+            curated_ratio=args.curated_ratio,
+            references=args.references,
+            reference_bytes=args.reference_bytes,
+            body_bytes=args.body_bytes,
+        )
+        with tempfile.TemporaryDirectory(prefix="agentskills-bench-") as tmp:
+            rows = bench_size(spec, Path(tmp), args.repeat)
+        for row in rows:
+            print(
+                f"{row['operation']:24s} {row['skills']:>6d}  "
+                f"{row['seconds']:10.4f}s  {row['per_skill_us']:10.1f}us/skill"
+            )
+        results.extend(rows)
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "spec": {
+                "curated_ratio": args.curated_ratio,
+                "references": args.references,
+                "reference_bytes": args.reference_bytes,
+                "body_bytes": args.body_bytes,
+            },
+        },
+        "results": results,
+    }
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"results: {output}")
+    if args.compare:
+        print(f"compare: {args.compare}")
+        for line in compare(results, Path(args.compare)):
+            print(f"  {line}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+r"""Generate synthetic skill repositories for benchmarking.
+
+Usage:
+    python benchmarks/synthetic.py /tmp/bench-repo --skills 1000 \\
+        --curated-ratio 0.2 --references 3 --reference-bytes 4096
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+WORDS = (
+    "agent",
+    "architecture",
+    "boundary",
+    "cache",
+    "commit",
+    "database",
+    "deploy",
+    "gateway",
+    "handoff",
+    "harness",
+    "install",
+    "lesson",
+    "module",
+    "package",
+    "plan",
+    "release",
+    "review",
+    "schema",
+    "search",
+    "session",
+    "skill",
+    "spec",
+    "test",
+    "workflow",
+)
+
+
+@dataclass(frozen=True)
+class RepoSpec:
+    """Shape of a synthetic skills repository."""
+
+    skills: int
+    curated_ratio: float = 0.2
+    references: int = 2
+    reference_bytes: int = 2048
+    body_bytes: int = 1024
+    seed: int = 0
+
+
+# Generated files are backdated to a fixed time so their timestamps fall
+# outside the racy window of the catalog cache and search index.
+FIXED_MTIME_NS = 1_577_836_800 * 10**9  # 2020-01-01T00:00:00Z
+
+
+def _text(rng: random.Random, size: int) -> str:
+    """Return roughly size bytes of line-wrapped pseudo-prose."""
+    lines: list[str] = []
+    written = 0
+    while written < size:
+        line = " ".join(rng.choice(WORDS) for _ in range(12))
+        lines.append(line)
+        written += len(line) + 1
+    return "\n".join(lines) + "\n"
+
+
+def generate_repo(root: Path, spec: RepoSpec) -> Path:
+    """Write a synthetic repo under root and return its skills/ directory.
+
+    Skill names are zero-padded so sorted order is stable. Every fifth
+    curated skill reuses an own skill's name to exercise shadowing. All
+    files and directories get the same fixed mtime.
+    """
+    rng = random.Random(spec.seed)
+    skills_root = root / "skills"
+    curated_count = round(spec.skills * spec.curated_ratio)
+    own_count = spec.skills - curated_count
+    width = len(str(spec.skills))
+
+    for index in range(spec.skills):
+        curated = index >= own_count
+        if curated and (index - own_count) % 5 == 4 and own_count:
+            name = f"skill-{(index - own_count) % own_count:0{width}d}"
+        else:
+            name = f"skill-{index:0{width}d}"
+        skill_dir = skills_root / ("curated" if curated else "") / name
+        skill_dir.mkdir(parents=True, exist_ok=True)
+
+        description = " ".join(rng.choice(WORDS) for _ in range(8))
+        (skill_dir / "SKILL.md").write_text(
+            "---\n"
+            f"name: {name}\n"
+            f"description: {description}\n"
+            "metadata:\n"
+            f"  version: 1.{index % 10}.0\n"
+            "---\n"
+            f"# {name}\n\n" + _text(rng, spec.body_bytes),
+            encoding="utf-8",
+        )
+
+        if spec.references:
+            references = skill_dir / "references"
+            references.mkdir(exist_ok=True)
+            for ref in range(spec.references):
+                (references / f"ref-{ref}.md").write_text(
+                    _text(rng, spec.reference_bytes), encoding="utf-8"
+                )
+
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        for name in (*filenames, *dirnames):
+            os.utime(os.path.join(dirpath, name), ns=(FIXED_MTIME_NS, FIXED_MTIME_NS))
+    os.utime(root, ns=(FIXED_MTIME_NS, FIXED_MTIME_NS))
+    return skills_root
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse CLI arguments for the generator."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic skills repo.")
+    parser.add_argument("root", help="Directory to create the repo in.")
+    parser.add_argument("--skills", type=int, default=100)
+    parser.add_argument("--curated-ratio", type=float, default=0.2)
+    parser.add_argument("--references", type=int, default=2)
+    parser.add_argument("--reference-bytes", type=int, default=2048)
+    parser.add_argument("--body-bytes", type=int, default=1024)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Generate a synthetic repo from CLI arguments."""
+    args = parse_args()
+    skills_root = generate_repo(
+        Path(args.root).expanduser().resolve(),
+        RepoSpec(
+            skills=args.skills,
+            curated_ratio=args.curated_ratio,
+            references=args.references,
+            reference_bytes=args.reference_bytes,
+            body_bytes=args.body_bytes,
+            seed=args.seed,
+        ),
+    )
+    print(f"skills: {skills_root}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,37 +2,144 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import Any, NamedTuple
 
 CURATED_DIR = "curated"
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+CACHE_DIR_ENV = "AGENTSKILLS_CACHE_DIR"
 
 
-def discover_all_skills(skills_root: Path) -> list[str]:
-    """Return names of skill directories under skills/ and skills/curated/.
+def cache_root() -> Path:
+    """Return the agentskills cache directory (~/.cache/agentskills by default)."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".cache" / "agentskills"
 
-    Own skills (directly under skills_root) take precedence over curated
-    skills with the same name.
+
+class SkillEntry(NamedTuple):
+    """A skill directory discovered under a skills root.
+
+    mtime_ns and size describe the skill's SKILL.md; frontmatter is only
+    populated when the catalog was loaded with frontmatter parsing enabled.
     """
-    if not skills_root.exists():
+
+    name: str
+    path: Path
+    curated: bool
+    mtime_ns: int | None = None
+    size: int | None = None
+    frontmatter: dict[str, Any] | None = None
+
+
+def list_skill_candidates(root: Path, skip: str | None = None) -> list[str]:
+    """Return sorted names of the subdirectories of root, or [] if root is missing."""
+    try:
+        with os.scandir(root) as it:
+            return sorted(
+                entry.name for entry in it if entry.name != skip and entry.is_dir()
+            )
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
-    own = [
-        p.name
-        for p in sorted(skills_root.iterdir())
-        if p.is_dir() and p.name != CURATED_DIR and (p / "SKILL.md").exists()
-    ]
 
-    curated_root = skills_root / CURATED_DIR
-    curated = []
-    if curated_root.is_dir():
-        curated = [
-            p.name
-            for p in sorted(curated_root.iterdir())
-            if p.is_dir() and (p / "SKILL.md").exists() and p.name not in own
-        ]
+def stat_skill_md(skill_dir: Path) -> os.stat_result | None:
+    """Stat skill_dir/SKILL.md, returning None if it does not exist."""
+    try:
+        return os.stat(os.path.join(skill_dir, "SKILL.md"))
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _scan_skill_dirs(
+    root: Path,
+    curated: bool,
+    skip: str | None = None,
+) -> list[SkillEntry]:
+    """Return sorted entries for subdirectories of root with a SKILL.md."""
+    found: list[SkillEntry] = []
+    for name in list_skill_candidates(root, skip):
+        path = root / name
+        st = stat_skill_md(path)
+        if st is not None:
+            found.append(SkillEntry(name, path, curated, st.st_mtime_ns, st.st_size))
+    return found
+
+
+class SkillCatalog:
+    """Index of the skills under a skills root, built from a single scan.
+
+    Own skills (directly under skills_root) take precedence over curated
+    skills with the same name. Name lookups are O(1).
+    """
 
-    return own + curated
+    def __init__(self, skills_root: Path, entries: Iterable[SkillEntry]) -> None:
+        """Index entries by name, preserving own-before-curated order."""
+        self.skills_root = skills_root
+        self._entries: dict[str, SkillEntry] = {}
+        for entry in entries:
+            self._entries.setdefault(entry.name, entry)
+
+    @classmethod
+    def scan(cls, skills_root: Path) -> SkillCatalog:
+        """Walk skills_root and skills_root/curated/ once and build a catalog."""
+        own = _scan_skill_dirs(skills_root, curated=False, skip=CURATED_DIR)
+        curated = _scan_skill_dirs(skills_root / CURATED_DIR, curated=True)
+        return cls(skills_root, own + curated)
+
+    def __contains__(self, name: object) -> bool:
+        """Return True if a skill with this name is in the catalog."""
+        return name in self._entries
+
+    def __iter__(self) -> Iterator[SkillEntry]:
+        """Iterate entries, own skills first, each group sorted by name."""
+        return iter(self._entries.values())
+
+    def __len__(self) -> int:
+        """Return the number of skills in the catalog."""
+        return len(self._entries)
+
+    @property
+    def names(self) -> list[str]:
+        """All skill names, own skills first."""
+        return [*self._entries]
+
+    @property
+    def own(self) -> list[str]:
+        """Names of own skills."""
+        return [e.name for e in self._entries.values() if not e.curated]
+
+    @property
+    def curated(self) -> list[str]:
+        """Names of curated skills not shadowed by an own skill."""
+        return [e.name for e in self._entries.values() if e.curated]
+
+    def get(self, name: str) -> SkillEntry | None:
+        """Return the entry for name, or None if it is not in the catalog."""
+        return self._entries.get(name)
+
+    def resolve(self, name: str) -> Path:
+        """Resolve a skill name to its directory."""
+        entry = self._entries.get(name)
+        if entry is None:
+            raise RuntimeError(
+                f"Skill not found: {name} "
+                f"(checked {self.skills_root / name} and "
+                f"{self.skills_root / CURATED_DIR / name})"
+            )
+        return entry.path
+
+
+def discover_all_skills(skills_root: Path) -> list[str]:
+    """Return names of skill directories under skills/ and skills/curated/.
+
+    Own skills (directly under skills_root) take precedence over curated
+    skills with the same name.
+    """
+    return SkillCatalog.scan(skills_root).names
 
 
 def categorize_skills(skills_root: Path) -> tuple[list[str], list[str]]:
@@ -41,29 +148,16 @@ def categorize_skills(skills_root: Path) -> tuple[list[str], list[str]]:
     Own skills are directly under skills_root; curated are under
     skills_root/curated/ and not shadowed by an own skill.
     """
-    if not skills_root.exists():
-        return [], []
-
-    own = [
-        p.name
-        for p in sorted(skills_root.iterdir())
-        if p.is_dir() and p.name != CURATED_DIR and (p / "SKILL.md").exists()
-    ]
-
-    curated_root = skills_root / CURATED_DIR
-    curated: list[str] = []
-    if curated_root.is_dir():
-        curated = [
-            p.name
-            for p in sorted(curated_root.iterdir())
-            if p.is_dir() and (p / "SKILL.md").exists() and p.name not in own
-        ]
-
-    return own, curated
+    catalog = SkillCatalog.scan(skills_root)
+    return catalog.own, catalog.curated
 
 
 def resolve_skill_dir(skills_root: Path, skill_name: str) -> Path:
-    """Resolve a skill name to its directory, checking own then curated."""
+    """Resolve a skill name to its directory, checking own then curated.
+
+    Probes the two candidate paths directly, which is cheaper than a full
+    scan for a single lookup. Use SkillCatalog for repeated lookups.
+    """
     own = skills_root / skill_name
     if own.is_dir() and (own / "SKILL.md").exists():
         return own
@@ -0,0 +1,222 @@
+"""Install skills straight from packaged .skill archives.
+
+Backs `bootstrap --from-archive`. Archives are the zip files written by
+`agentskills package`, named <name>-v<version>.skill, with every entry
+under a top-level <name>/ directory. Before anything is written, each
+entry in the central directory is checked: no absolute paths, no `..`
+components, no symlinks, and everything under <name>/. Entries are then
+streamed to disk one by one, and reads are checked against the recorded
+CRC as they go. Files whose size and CRC already match on disk are not
+rewritten.
+
+Bootstrap extracts every selected archive into a staging directory,
+seeded with hardlinks to the installed copies, and only swaps the skills
+into place once all of them extracted cleanly.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import stat
+import zlib
+from pathlib import Path, PurePosixPath
+from typing import NamedTuple
+from zipfile import ZipFile, ZipInfo
+
+ARCHIVE_RE = re.compile(
+    r"^(?P<name>.+)-v(?P<version>\d+\.\d+\.\d+(?:-[0-9A-Za-z.-]+)?"
+    r"(?:\+[0-9A-Za-z.-]+)?)\.skill$"
+)
+CHUNK_SIZE = 1 << 20
+
+
+class ExtractReport(NamedTuple):
+    """Relative paths written, skipped as unchanged, and removed."""
+
+    written: list[str]
+    skipped: list[str]
+    removed: list[str]
+
+    def summary(self) -> str:
+        """Return a short 'written/skipped/removed' summary."""
+        return (
+            f"{len(self.written)} written, {len(self.skipped)} unchanged, "
+            f"{len(self.removed)} removed"
+        )
+
+
+def version_key(version: str) -> tuple:
+    """Sort key for a semver string; pre-releases sort before the release."""
+    core, _, _build = version.partition("+")
+    core, _, prerelease = core.partition("-")
+    numbers = tuple(int(part) for part in core.split("."))
+    if not prerelease:
+        return (numbers, 1, ())
+    ids = tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in prerelease.split(".")
+    )
+    return (numbers, 0, ids)
+
+
+def find_archives(path: Path) -> dict[str, Path]:
+    """Map skill name to archive for a .skill file or a directory of them.
+
+    When a directory holds several versions of a skill, the highest
+    version wins.
+    """
+    if path.is_file():
+        if path.name.endswith(".tar.xz"):
+            raise RuntimeError(
+                f"Cannot install from a tar.xz archive: {path} "
+                "(package with a zip codec to get a .skill file)"
+            )
+        match = ARCHIVE_RE.match(path.name)
+        if not match:
+            raise RuntimeError(f"Not a <name>-v<version>.skill archive: {path}")
+        return {match["name"]: path}
+    if not path.is_dir():
+        raise RuntimeError(f"Archive path does not exist: {path}")
+
+    best: dict[str, tuple[tuple, Path]] = {}
+    with os.scandir(path) as it:
+        for entry in it:
+            match = ARCHIVE_RE.match(entry.name)
+            if not match or not entry.is_file():
+                continue
+            key = version_key(match["version"])
+            current = best.get(match["name"])
+            if current is None or key > current[0]:
+                best[match["name"]] = (key, Path(entry.path))
+    return {name: best[name][1] for name in sorted(best)}
+
+
+def _checked_entries(zf: ZipFile, name: str, archive: Path) -> list[ZipInfo]:
+    """Return the file entries of zf, refusing any that could escape name/."""
+    entries: list[ZipInfo] = []
+    seen: set[str] = set()
+    for info in zf.infolist():
+        parts = PurePosixPath(info.filename).parts
+        mode = info.external_attr >> 16
+        if (
+            "\\" in info.filename
+            or info.filename.startswith("/")
+            or not parts
+            or parts[0] != name
+            or (len(parts) < 2 and not info.is_dir())
+            or any(part in ("", ".", "..") for part in parts)
+        ):
+            raise RuntimeError(f"Unsafe entry {info.filename!r} in {archive}")
+        if stat.S_ISLNK(mode):
+            raise RuntimeError(f"Symlink entry {info.filename!r} in {archive}")
+        if info.is_dir():
+            continue
+        if info.filename in seen:
+            raise RuntimeError(f"Duplicate entry {info.filename!r} in {archive}")
+        seen.add(info.filename)
+        entries.append(info)
+    if not entries:
+        raise RuntimeError(f"Archive has no files under {name}/: {archive}")
+    return entries
+
+
+def _matches(path: Path, info: ZipInfo) -> bool:
+    """Return True if path already has info's size and CRC."""
+    try:
+        if path.is_symlink() or path.stat().st_size != info.file_size:
+            return False
+        crc = 0
+        with open(path, "rb") as handle:
+            while chunk := handle.read(CHUNK_SIZE):
+                crc = zlib.crc32(chunk, crc)
+    except OSError:
+        return False
+    return crc == info.CRC
+
+
+def _remove_extra(root: Path, keep: set[str]) -> list[str]:
+    """Delete files under root that are not in keep; return them relative."""
+    removed: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            rel = os.path.relpath(path, root).replace(os.sep, "/")
+            if rel not in keep:
+                os.unlink(path)
+                removed.append(rel)
+        for dirname in dirnames:
+            path = os.path.join(dirpath, dirname)
+            if os.path.islink(path):
+                os.unlink(path)
+            elif not os.listdir(path):
+                os.rmdir(path)
+    return sorted(removed)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink src to dst, copying if the filesystem cannot link."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def extract_skill(
+    archive: Path,
+    name: str,
+    destination_root: Path,
+    installed: Path | None = None,
+) -> ExtractReport:
+    """Stream archive's name/ tree into destination_root/name.
+
+    The destination ends up holding exactly the files in the archive.
+    Unchanged files are left in place and stale ones are deleted. With
+    installed (a current copy of the skill elsewhere), a missing
+    destination is first seeded with hardlinks to its files, so only
+    changed files are written and installed itself is never modified.
+    """
+    report = ExtractReport([], [], [])
+    destination = destination_root / name
+    with ZipFile(archive) as zf:
+        entries = _checked_entries(zf, name, archive)
+        if (
+            installed is not None
+            and installed.is_dir()
+            and not installed.is_symlink()
+            and not os.path.lexists(destination)
+        ):
+            shutil.copytree(
+                installed, destination, symlinks=True, copy_function=_link_or_copy
+            )
+        if destination.is_symlink() or destination.is_file():
+            destination.unlink()
+        destination.mkdir(parents=True, exist_ok=True)
+
+        keep: set[str] = set()
+        for info in entries:
+            rel = info.filename.split("/", 1)[1]
+            keep.add(rel)
+            target = destination / rel
+            if _matches(target, info):
+                report.skipped.append(rel)
+                continue
+            if target.is_dir() and not target.is_symlink():
+                shutil.rmtree(target)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            try:
+                with zf.open(info) as src, open(tmp, "wb") as dst:
+                    shutil.copyfileobj(src, dst, CHUNK_SIZE)
+                mode = (info.external_attr >> 16) & 0o777
+                if mode:
+                    os.chmod(tmp, mode)
+                os.replace(tmp, target)
+            except BaseException:
+                tmp.unlink(missing_ok=True)
+                raise
+            report.written.append(rel)
+
+    report.removed.extend(_remove_extra(destination, keep))
+    return report
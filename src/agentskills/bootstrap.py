@@ -4,15 +4,42 @@
 from __future__ import annotations
 
 import argparse
-import shutil
-import subprocess
+import os
+import re
 import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from agentskills import REPO_ROOT, categorize_skills, discover_all_skills, resolve_skill_dir
+from agentskills import (
+    CURATED_DIR,
+    REPO_ROOT,
+    SkillCatalog,
+    cache_root,
+    discover_all_skills,
+    resolve_skill_dir,
+)
+from agentskills.cache import load_catalog
+from agentskills.timings import span
 
-DEFAULT_CACHE_DIR = Path.home() / ".cache" / "agentskills" / "repos"
+if TYPE_CHECKING:
+    import subprocess
+
+    from agentskills.reflink import Cloner
+    from agentskills.store import ObjectStore
+    from agentskills.sync import SyncReport
+
+REPOS_DIR = "repos"
 PROJECT_SKILLS_DIR = Path(".agents") / "skills"
+FETCH_STATE_FILE = "agentskills-fetch.json"
+SHA_RE = re.compile(r"^[0-9a-f]{7,40}$")
+WORKTREES_SUFFIX = "-worktrees"
+WORKTREE_MAX_AGE = 7 * 24 * 3600
+REFS_DIR = "refs"
+STAGING_PREFIX = ".skills-staging-"
+INSTALL_WORKERS = 8
 
 
 def run_command(
@@ -21,13 +48,16 @@ def run_command(
     check: bool = True,
 ) -> subprocess.CompletedProcess[str]:
     """Run a shell command, raising on failure when check is True."""
-    result = subprocess.run(
-        cmd,
-        cwd=str(cwd) if cwd else None,
-        check=False,
-        text=True,
-        capture_output=True,
-    )
+    import subprocess
+
+    with span(" ".join(cmd[:2])):
+        result = subprocess.run(
+            cmd,
+            cwd=str(cwd) if cwd else None,
+            check=False,
+            text=True,
+            capture_output=True,
+        )
     if check and result.returncode != 0:
         joined = " ".join(cmd)
         raise RuntimeError(f"Command failed ({joined}): {result.stderr.strip()}")
@@ -57,28 +87,407 @@ def repo_cache_name(repo_url: str) -> str:
     return safe or "skills-repo"
 
 
-def clone_or_update_repo(repo_url: str, ref: str, cache_dir: Path) -> Path:
-    """Clone or fetch+checkout a repo into the local cache."""
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    repo_path = cache_dir / repo_cache_name(repo_url)
+def sparse_skill_paths(skill_names: list[str]) -> list[str]:
+    """Return sparse-checkout paths covering the own and curated candidates.
 
-    if not repo_path.exists():
-        run_command(["git", "clone", repo_url, str(repo_path)])
+    With no skill names the whole skills/ tree is checked out, since
+    discovery (for --all or the picker) needs every SKILL.md.
+    """
+    if not skill_names:
+        return ["skills"]
+    paths: list[str] = []
+    for name in skill_names:
+        paths += [f"skills/{name}", f"skills/{CURATED_DIR}/{name}"]
+    return paths
+
+
+def read_fetch_state(repo_path: Path) -> dict:
+    """Return the per-ref fetch record kept in the clone's .git directory."""
+    import json
+
+    try:
+        state = json.loads(
+            (repo_path / ".git" / FETCH_STATE_FILE).read_text(encoding="utf-8")
+        )
+    except (OSError, ValueError):
+        return {"refs": {}}
+    if not isinstance(state, dict) or not isinstance(state.get("refs"), dict):
+        return {"refs": {}}
+    return state
+
+
+def write_fetch_state(repo_path: Path, state: dict) -> None:
+    """Atomically persist the fetch record; failures are ignored."""
+    import json
+
+    path = repo_path / ".git" / FETCH_STATE_FILE
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def local_commit(repo_path: Path, rev: str) -> str | None:
+    """Resolve rev to a commit in repo_path without touching the network."""
+    result = run_command(
+        ["git", "rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}"],
+        cwd=repo_path,
+        check=False,
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def immutable_commit(repo_path: Path, ref: str, state: dict) -> str | None:
+    """Return the local commit for ref if ref is a tag or SHA already present.
+
+    Tags are found under refs/tags or, for shallow clones that only keep
+    FETCH_HEAD, in the fetch record. Branches always return None.
+    """
+    if SHA_RE.match(ref):
+        commit = local_commit(repo_path, ref)
+        return commit if commit and commit.startswith(ref) else None
+    tag = run_command(
+        ["git", "show-ref", "--verify", "--quiet", f"refs/tags/{ref}"],
+        cwd=repo_path,
+        check=False,
+    )
+    if tag.returncode == 0:
+        return local_commit(repo_path, f"refs/tags/{ref}")
+    record = state["refs"].get(ref) or {}
+    if record.get("immutable") and record.get("commit"):
+        return local_commit(repo_path, record["commit"])
+    return None
+
+
+def fetched_within(state: dict, ref: str, ttl: int) -> str | None:
+    """Return ref's recorded commit if it was fetched less than ttl seconds ago."""
+    record = state["refs"].get(ref) or {}
+    fetched_at = record.get("fetched_at", 0)
+    if ttl > 0 and 0 <= time.time() - fetched_at < ttl:
+        return record.get("commit")
+    return None
+
+
+def record_fetch(
+    repo_path: Path,
+    state: dict,
+    ref: str,
+    commit: str,
+    immutable: bool,
+) -> None:
+    """Record that ref was just fetched and resolved to commit."""
+    state["refs"][ref] = {
+        "commit": commit,
+        "immutable": immutable,
+        "fetched_at": time.time(),
+    }
+    write_fetch_state(repo_path, state)
+
+
+@contextmanager
+def cache_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive flock on path, blocking until it is free."""
+    import fcntl
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as handle:
+        with span("cache_lock", path=path.name):
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _covers(existing: list[str], wanted: list[str]) -> bool:
+    """Return True if every sparse path in wanted is inside one in existing."""
+    return all(
+        any(path == have or path.startswith(f"{have}/") for have in existing)
+        for path in wanted
+    )
+
+
+def ensure_worktree(
+    repo_path: Path,
+    commit: str,
+    state: dict,
+    sparse_paths: list[str] | None = None,
+) -> Path:
+    """Return a detached worktree of repo_path at commit, creating it if needed.
+
+    Worktrees live in <repo>-worktrees/<commit> and are never moved to
+    another commit, so any number of processes can read different refs at
+    once. A sparse worktree only grows: paths not yet checked out are
+    added. Must be called with the cache lock held.
+    """
+    root = repo_path.with_name(f"{repo_path.name}{WORKTREES_SUFFIX}")
+    path = root / commit
+    worktrees = state.setdefault("worktrees", {})
+    if path.exists() and commit in worktrees:
+        have = worktrees[commit]
+        if sparse_paths is not None and not _covers(have, sparse_paths):
+            run_command(
+                ["git", "sparse-checkout", "add", "--", *sparse_paths], cwd=path
+            )
+            worktrees[commit] = sorted({*have, *sparse_paths})
+            write_fetch_state(repo_path, state)
+        os.utime(path)
+        return path
+
+    # A leftover from an interrupted run: drop it and start over.
+    root.mkdir(parents=True, exist_ok=True)
+    tmp_path = root / f"{commit}.tmp"
+    for stale in (tmp_path, path):
+        if stale.exists():
+            remove_path(stale)
+    run_command(["git", "worktree", "prune"], cwd=repo_path)
+
+    if sparse_paths is None:
+        run_command(
+            ["git", "worktree", "add", "--detach", str(tmp_path), commit],
+            cwd=repo_path,
+        )
     else:
         run_command(
-            ["git", "fetch", "--all", "--tags", "--prune"],
+            [
+                "git",
+                "worktree",
+                "add",
+                "--no-checkout",
+                "--detach",
+                str(tmp_path),
+                commit,
+            ],
             cwd=repo_path,
         )
+        run_command(
+            ["git", "sparse-checkout", "set", "--cone", "--", *sparse_paths],
+            cwd=tmp_path,
+        )
+        run_command(["git", "checkout", "--detach", commit], cwd=tmp_path)
+    run_command(
+        ["git", "worktree", "move", str(tmp_path), str(path)],
+        cwd=repo_path,
+    )
+    worktrees[commit] = [] if sparse_paths is None else sorted(sparse_paths)
+    write_fetch_state(repo_path, state)
+    return path
 
-    run_command(["git", "checkout", ref], cwd=repo_path)
-    pull_result = run_command(["git", "pull", "--ff-only"], cwd=repo_path, check=False)
-    not_on_branch = "not currently on a branch" not in pull_result.stderr.lower()
-    if pull_result.returncode != 0 and not_on_branch:
-        print(
-            f"warning: pull skipped: {pull_result.stderr.strip()}",
-            file=sys.stderr,
+
+def ref_link(worktrees_root: Path, ref: str) -> Path:
+    """Return the stable path for ref under a <repo>-worktrees directory."""
+    return worktrees_root / REFS_DIR / ref.replace("%", "%25").replace("/", "%2F")
+
+
+def point_ref(worktree: Path, ref: str) -> None:
+    """Atomically repoint ref's stable link at worktree; needs the cache lock.
+
+    Symlink installs link through <repo>-worktrees/refs/<ref>, so they
+    follow the ref to whichever commit it was last fetched at.
+    """
+    link = ref_link(worktree.parent, ref)
+    link.parent.mkdir(exist_ok=True)
+    tmp_link = link.with_name(f".{link.name}.{os.getpid()}.tmp")
+    tmp_link.unlink(missing_ok=True)
+    tmp_link.symlink_to(Path("..") / worktree.name, target_is_directory=True)
+    os.replace(tmp_link, link)
+
+
+def prune_worktrees(repo_path: Path, state: dict, keep: Path) -> None:
+    """Remove worktrees unused for WORKTREE_MAX_AGE; needs the cache lock.
+
+    A worktree that a ref link still points at is never removed, since
+    symlink installs may resolve through it.
+    """
+    root = keep.parent
+    cutoff = time.time() - WORKTREE_MAX_AGE
+    worktrees = state.get("worktrees", {})
+    pruned = False
+    try:
+        with os.scandir(root / REFS_DIR) as it:
+            linked = {
+                os.path.basename(os.readlink(entry.path))
+                for entry in it
+                if entry.is_symlink()
+            }
+    except FileNotFoundError:
+        linked = set()
+    with os.scandir(root) as it:
+        stale = [
+            entry.path
+            for entry in it
+            if entry.path != str(keep)
+            and entry.name != REFS_DIR
+            and entry.name not in linked
+            and entry.is_dir(follow_symlinks=False)
+            and entry.stat().st_mtime < cutoff
+        ]
+    for path in stale:
+        remove_path(Path(path))
+        worktrees.pop(os.path.basename(path), None)
+        pruned = True
+    if pruned:
+        run_command(["git", "worktree", "prune"], cwd=repo_path)
+        write_fetch_state(repo_path, state)
+
+
+def clone_or_update_repo(
+    repo_url: str,
+    ref: str,
+    cache_dir: Path,
+    sparse_paths: list[str] | None = None,
+    fetch_ttl: int = 0,
+    follow_ref: bool = False,
+) -> Path:
+    """Fetch ref into the clone cache and return a worktree checked out at it.
+
+    Updates are serialised with a lock file per cached repo; the returned
+    worktree is specific to the resolved commit, so concurrent runs with
+    different refs never share a working tree. When sparse_paths is given,
+    a separate shallow, blobless clone is used and only those paths are
+    checked out (see sparse_clone_or_update_repo). Tags and commit SHAs
+    already in the cache are never re-fetched; other refs are not
+    re-fetched within fetch_ttl seconds of the last fetch. With
+    follow_ref, ref's stable link (see point_ref) is returned instead of
+    the commit's worktree, for installs that keep pointing into the cache.
+    """
+    with span("clone_or_update_repo", repo=repo_url, ref=ref):
+        if sparse_paths is not None:
+            worktree = sparse_clone_or_update_repo(
+                repo_url, ref, cache_dir, sparse_paths, fetch_ttl
+            )
+        else:
+            worktree = _clone_or_update_repo(repo_url, ref, cache_dir, fetch_ttl)
+    return ref_link(worktree.parent, ref) if follow_ref else worktree
+
+
+def sparse_clone_or_update_repo(
+    repo_url: str,
+    ref: str,
+    cache_dir: Path,
+    sparse_paths: list[str],
+    fetch_ttl: int = 0,
+) -> Path:
+    """Shallow, blobless, sparse clone or update of ref into the cache.
+
+    The clone is made with --filter=blob:none --depth 1 and no checkout of
+    its own; the commit's worktree gets a cone-mode sparse checkout, so
+    only the blobs under sparse_paths are ever downloaded. It lives next
+    to the full clone, in <name>-sparse.
+    """
+    name = f"{repo_cache_name(repo_url)}-sparse"
+    repo_path = cache_dir / name
+
+    with cache_lock(cache_dir / f"{name}.lock"):
+        if not repo_path.exists():
+            run_command(
+                [
+                    "git",
+                    "clone",
+                    "--filter=blob:none",
+                    "--depth",
+                    "1",
+                    "--no-checkout",
+                    "--sparse",
+                    repo_url,
+                    str(repo_path),
+                ]
+            )
+        state = read_fetch_state(repo_path)
+
+        commit = immutable_commit(repo_path, ref, state) or fetched_within(
+            state, ref, fetch_ttl
         )
-    return repo_path
+        if not commit:
+            run_command(
+                ["git", "fetch", "--filter=blob:none", "--depth", "1", "origin", ref],
+                cwd=repo_path,
+            )
+            fetch_head = (repo_path / ".git" / "FETCH_HEAD").read_text(encoding="utf-8")
+            immutable = bool(SHA_RE.match(ref)) or "\ttag '" in fetch_head
+            commit = local_commit(repo_path, "FETCH_HEAD")
+            if not commit:
+                raise RuntimeError(f"Could not resolve {ref} in {repo_url}")
+            record_fetch(repo_path, state, ref, commit, immutable)
+
+        worktree = ensure_worktree(repo_path, commit, state, sparse_paths)
+        point_ref(worktree, ref)
+        prune_worktrees(repo_path, state, worktree)
+    return worktree
+
+
+def _clone_or_update_repo(
+    repo_url: str,
+    ref: str,
+    cache_dir: Path,
+    fetch_ttl: int = 0,
+) -> Path:
+    """Clone or fetch a repo and return ref's worktree; see clone_or_update_repo."""
+    name = repo_cache_name(repo_url)
+    repo_path = cache_dir / name
+
+    with cache_lock(cache_dir / f"{name}.lock"):
+        state, commit = _fetch_ref(repo_url, ref, repo_path, fetch_ttl)
+        worktree = ensure_worktree(repo_path, commit, state)
+        point_ref(worktree, ref)
+        prune_worktrees(repo_path, state, worktree)
+    return worktree
+
+
+def fetch_commit(
+    repo_url: str,
+    ref: str,
+    cache_dir: Path,
+    fetch_ttl: int = 0,
+) -> tuple[Path, str]:
+    """Fetch ref into the full clone cache; return (clone, commit).
+
+    Nothing is checked out, for callers that read straight from the
+    object database (see agentskills.gitexport).
+    """
+    name = repo_cache_name(repo_url)
+    repo_path = cache_dir / name
+    with (
+        span("fetch_commit", repo=repo_url, ref=ref),
+        cache_lock(cache_dir / f"{name}.lock"),
+    ):
+        _state, commit = _fetch_ref(repo_url, ref, repo_path, fetch_ttl)
+    return repo_path, commit
+
+
+def _fetch_ref(
+    repo_url: str,
+    ref: str,
+    repo_path: Path,
+    fetch_ttl: int,
+) -> tuple[dict, str]:
+    """Clone or fetch as needed and resolve ref; needs the cache lock."""
+    if not repo_path.exists():
+        run_command(["git", "clone", "--no-checkout", repo_url, str(repo_path)])
+        state = read_fetch_state(repo_path)
+        commit = None
+    else:
+        state = read_fetch_state(repo_path)
+        commit = immutable_commit(repo_path, ref, state) or fetched_within(
+            state, ref, fetch_ttl
+        )
+        if not commit:
+            run_command(
+                ["git", "fetch", "--all", "--tags", "--prune"],
+                cwd=repo_path,
+            )
+
+    if not commit:
+        commit = local_commit(repo_path, f"refs/remotes/origin/{ref}")
+        commit = commit or local_commit(repo_path, ref)
+        if not commit:
+            raise RuntimeError(f"Unknown ref {ref!r} in {repo_url}")
+        record_fetch(repo_path, state, ref, commit, immutable=False)
+    return state, commit
 
 
 def discover_available_skills(skills_root: Path) -> list[str]:
@@ -94,18 +503,56 @@ def remove_path(path: Path) -> None:
     if path.is_symlink() or path.is_file():
         path.unlink()
     elif path.exists():
+        import shutil
+
         shutil.rmtree(path)
 
 
-def install_skill(
+def install_skill(  # noqa: PLR0913
+    skill_name: str,
+    source_root: Path,
+    destination_root: Path,
+    mode: str,
+    force: bool,
+    catalog: SkillCatalog | None = None,
+    store: ObjectStore | None = None,
+    cloner: Cloner | None = None,
+) -> Path:
+    """Copy, symlink, hardlink or reflink a single skill into the destination.
+
+    When a catalog is given, the skill is looked up in it instead of
+    probing source_root on disk. Hardlink mode links files out of store
+    (the default object store under the cache directory if not given).
+    Reflink mode clones files with cloner, which records the method used.
+    """
+    with span("install_skill", skill=skill_name, mode=mode):
+        return _install_skill(
+            skill_name,
+            source_root,
+            destination_root,
+            mode,
+            force,
+            catalog,
+            store,
+            cloner,
+        )
+
+
+def _install_skill(  # noqa: PLR0913
     skill_name: str,
     source_root: Path,
     destination_root: Path,
     mode: str,
     force: bool,
+    catalog: SkillCatalog | None,
+    store: ObjectStore | None,
+    cloner: Cloner | None,
 ) -> Path:
-    """Copy or symlink a single skill into the destination."""
-    source_skill = resolve_skill_dir(source_root, skill_name)
+    """Install a single skill; see install_skill."""
+    if catalog is not None:
+        source_skill = catalog.resolve(skill_name)
+    else:
+        source_skill = resolve_skill_dir(source_root, skill_name)
 
     destination_skill = destination_root / skill_name
     if destination_skill.exists() or destination_skill.is_symlink():
@@ -117,12 +564,181 @@ def install_skill(
         remove_path(destination_skill)
 
     if mode == "copy":
+        import shutil
+
         shutil.copytree(source_skill, destination_skill)
+    elif mode == "hardlink":
+        from agentskills.store import ObjectStore
+
+        owned = store is None
+        store = store or ObjectStore()
+        store.link_tree(source_skill, destination_skill)
+        if owned:
+            store.save()
+    elif mode == "reflink":
+        from agentskills.reflink import Cloner
+
+        (cloner or Cloner()).clone_tree(source_skill, destination_skill)
     else:
-        destination_skill.symlink_to(source_skill.resolve(), target_is_directory=True)
+        # Not resolved: a cached repo's ref link must stay in the path.
+        destination_skill.symlink_to(source_skill.absolute(), target_is_directory=True)
     return destination_skill
 
 
+def install_skills(  # noqa: PLR0913
+    skill_names: list[str],
+    source_root: Path,
+    destination_root: Path,
+    mode: str,
+    force: bool,
+    catalog: SkillCatalog | None = None,
+    store: ObjectStore | None = None,
+    cloner: Cloner | None = None,
+    workers: int = INSTALL_WORKERS,
+) -> list[Path]:
+    """Install several skills as one all-or-nothing operation.
+
+    Skills are installed in parallel into a hidden staging directory next
+    to destination_root, then renamed into place. If any install or rename
+    fails, skills already renamed are removed, replaced ones are restored
+    and the staging directory is deleted, so destination_root is left as
+    it was.
+    """
+    if not force:
+        for name in skill_names:
+            existing = destination_root / name
+            if existing.exists() or existing.is_symlink():
+                raise RuntimeError(
+                    f"Destination already exists: {existing} (use --force to replace)"
+                )
+
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    staging = Path(
+        tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=destination_root.parent)
+    )
+    try:
+        with (
+            span("stage_skills", count=len(skill_names), mode=mode),
+            ThreadPoolExecutor(max_workers=max(1, workers)) as pool,
+        ):
+            futures = [
+                pool.submit(
+                    install_skill,
+                    name,
+                    source_root,
+                    staging,
+                    mode,
+                    False,
+                    catalog,
+                    store,
+                    cloner,
+                )
+                for name in skill_names
+            ]
+            staged = [future.result() for future in futures]
+        with span("commit_skills", count=len(staged)):
+            return _swap_into_place(staged, destination_root, staging / ".replaced")
+    finally:
+        remove_path(staging)
+
+
+def _swap_into_place(
+    staged: list[Path],
+    destination_root: Path,
+    backup_root: Path,
+) -> list[Path]:
+    """Rename staged skills into destination_root, rolling back on failure."""
+    placed: list[Path] = []
+    replaced: list[tuple[Path, Path]] = []
+    try:
+        for source in staged:
+            destination = destination_root / source.name
+            if destination.exists() or destination.is_symlink():
+                backup_root.mkdir(exist_ok=True)
+                backup = backup_root / source.name
+                os.replace(destination, backup)
+                replaced.append((destination, backup))
+            os.replace(source, destination)
+            placed.append(destination)
+    except BaseException:
+        for destination in reversed(placed):
+            remove_path(destination)
+        for destination, backup in reversed(replaced):
+            os.replace(backup, destination)
+        raise
+    return placed
+
+
+def sync_skill(
+    skill_name: str,
+    destination_root: Path,
+    catalog: SkillCatalog,
+    checksum: bool = False,
+) -> SyncReport:
+    """Bring an installed copy of a skill up to date, rewriting only changes."""
+    from agentskills.sync import sync_tree
+
+    with span("sync_skill", skill=skill_name):
+        return sync_tree(
+            catalog.resolve(skill_name), destination_root / skill_name, checksum
+        )
+
+
+def export_skills(  # noqa: PLR0913
+    skill_paths: dict[str, str],
+    repo: Path,
+    commit: str,
+    destination_root: Path,
+    force: bool,
+    expected: dict[str, Any] | None = None,
+    workers: int = INSTALL_WORKERS,
+) -> list[Path]:
+    """Export {name: path in commit} from repo's object database, all or nothing.
+
+    Like install_skills, skills are exported in parallel into a staging
+    directory and then renamed into place. With expected (the skills of a
+    lock), each staged skill must hash to its locked files before anything
+    is replaced.
+    """
+    if not force:
+        for name in skill_paths:
+            existing = destination_root / name
+            if existing.exists() or existing.is_symlink():
+                raise RuntimeError(
+                    f"Destination already exists: {existing} (use --force to replace)"
+                )
+
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    from agentskills.gitexport import export_tree
+    from agentskills.lockfile import hash_tree
+
+    def export_one(name: str) -> Path:
+        staged = staging / name
+        with span("export_skill", skill=name):
+            export_tree(repo, commit, skill_paths[name], staged)
+        if expected is not None and hash_tree(staged) != expected[name]["files"]:
+            raise RuntimeError(f"Source of {name} does not match skills.lock")
+        return staged
+
+    staging = Path(
+        tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=destination_root.parent)
+    )
+    try:
+        with (
+            span("stage_skills", count=len(skill_paths), mode="export"),
+            ThreadPoolExecutor(max_workers=max(1, workers)) as pool,
+        ):
+            staged = list(pool.map(export_one, skill_paths))
+        with span("commit_skills", count=len(staged)):
+            return _swap_into_place(staged, destination_root, staging / ".replaced")
+    finally:
+        remove_path(staging)
+
+
 def parse_args() -> argparse.Namespace:
     """Parse CLI arguments for the bootstrap command."""
     parser = argparse.ArgumentParser(
@@ -147,18 +763,43 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--mode",
-        choices=["copy", "symlink"],
+        choices=["copy", "symlink", "hardlink", "reflink"],
         default="copy",
         help="Install mode. 'copy' is safest — files live inside the project. "
         "'symlink' saves disk space but creates links outside the project tree, "
-        "which may cause permission prompts in Claude Code.",
+        "which may cause permission prompts in Claude Code. 'hardlink' links "
+        "read-only files from a shared content-addressed store in the cache "
+        "directory: copy semantics without duplicated bytes (falls back to "
+        "copying when the project is on another filesystem). 'reflink' makes "
+        "copy-on-write clones on btrfs/XFS and falls back to a regular copy.",
     )
     parser.add_argument(
         "--force",
         action="store_true",
         help="Replace destination skill if it already exists.",
     )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Update installed copies in place: write only new or changed files "
+        "and delete files removed from the source (copy mode only).",
+    )
+    parser.add_argument(
+        "--checksum",
+        action="store_true",
+        help="With --sync, compare file contents even when size and mtime match.",
+    )
     parser.add_argument("--repo-url", help="Git URL to clone/pull from.")
+    parser.add_argument(
+        "--source",
+        action="append",
+        default=[],
+        metavar="URL[#REF]|PATH",
+        help="A skills repo: git URL (optionally with #ref, default --ref) or "
+        "local path. Repeat to combine repos; they are fetched in parallel and "
+        "a skill in an earlier source shadows one with the same name in a "
+        "later source.",
+    )
     parser.add_argument(
         "--repo-path",
         help="Use a local repo path instead of cloning.",
@@ -168,15 +809,81 @@ def parse_args() -> argparse.Namespace:
         default="main",
         help="Git branch or tag when --repo-url is used.",
     )
+    parser.add_argument(
+        "--sparse",
+        action="store_true",
+        help="With --repo-url, use a shallow, blobless clone and check out only "
+        "the selected skills (all of skills/ for --all or the picker).",
+    )
+    parser.add_argument(
+        "--no-checkout",
+        action="store_true",
+        help="With --repo-url, export the selected skills straight from the "
+        "cached clone's git objects instead of checking out a worktree "
+        "(copy mode only).",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Check installed skills against .agents/skills.lock and exit.",
+    )
+    parser.add_argument(
+        "--frozen",
+        action="store_true",
+        help="Install exactly the skills, mode and commit pinned in "
+        ".agents/skills.lock, failing if the source differs from it.",
+    )
+    parser.add_argument(
+        "--projects-file",
+        metavar="PATH",
+        help="Bootstrap every project listed in PATH: one path per line, or a "
+        ".toml manifest with per-project skills. Overrides --project.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=INSTALL_WORKERS,
+        help=f"Projects to bootstrap in parallel with --projects-file "
+        f"(default: {INSTALL_WORKERS}).",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="With --projects-file, print the summary as JSON.",
+    )
+    parser.add_argument(
+        "--fetch-ttl",
+        type=int,
+        default=0,
+        metavar="SECONDS",
+        help="With --repo-url, skip fetching a branch that was fetched less than "
+        "SECONDS ago (default: 0, always fetch). Tags and commit SHAs already "
+        "in the cache are never re-fetched.",
+    )
+    parser.add_argument(
+        "--from-archive",
+        metavar="PATH",
+        help="Install from a .skill archive, or the newest archive of each skill "
+        "in a directory, instead of a repo (copy mode only).",
+    )
     parser.add_argument(
         "--cache-dir",
-        default=str(DEFAULT_CACHE_DIR),
-        help="Clone cache directory.",
+        default=str(cache_root() / REPOS_DIR),
+        help="Clone cache directory (default: repos/ under the agentskills "
+        "cache, which AGENTSKILLS_CACHE_DIR overrides).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rescan skills without reading or writing the catalog cache.",
     )
     return parser.parse_args()
 
 
-def pick_skills_interactive(skills_root: Path) -> list[str]:
+def pick_skills_interactive(
+    skills_root: Path,
+    catalog: SkillCatalog | None = None,
+) -> list[str]:
     """Show an interactive multi-select picker, or error if not a TTY."""
     if not sys.stdin.isatty():
         raise RuntimeError(
@@ -186,7 +893,9 @@ def pick_skills_interactive(skills_root: Path) -> list[str]:
 
     from pick import pick as pick_menu
 
-    own, curated = categorize_skills(skills_root)
+    if catalog is None:
+        catalog = SkillCatalog.scan(skills_root)
+    own, curated = catalog.own, catalog.curated
     options = [name for name in own] + [f"{name} (curated)" for name in curated]
 
     if not options:
@@ -208,11 +917,20 @@ def pick_skills_interactive(skills_root: Path) -> list[str]:
     return names
 
 
-def resolve_repo_root(args: argparse.Namespace) -> Path:
-    """Determine the repo root from CLI arguments."""
+def resolve_repo_root(
+    args: argparse.Namespace,
+    skill_names: list[str] | None = None,
+) -> Path:
+    """Determine the repo root from CLI arguments.
+
+    skill_names limits a --sparse checkout (default: the --skill names).
+    """
     if args.repo_path and args.repo_url:
         raise RuntimeError("Use either --repo-path or --repo-url, not both.")
 
+    if args.sparse and not args.repo_url:
+        raise RuntimeError("--sparse requires --repo-url.")
+
     if args.repo_path:
         repo_root = Path(args.repo_path).expanduser().resolve()
         if not repo_root.exists():
@@ -224,31 +942,477 @@ def resolve_repo_root(args: argparse.Namespace) -> Path:
             repo_url=args.repo_url,
             ref=args.ref,
             cache_dir=Path(args.cache_dir).expanduser().resolve(),
+            sparse_paths=(
+                sparse_skill_paths(
+                    parse_skill_list(args.skill)
+                    if skill_names is None
+                    else skill_names
+                )
+                if args.sparse
+                else None
+            ),
+            fetch_ttl=args.fetch_ttl,
+            follow_ref=args.mode == "symlink",
         )
 
     return REPO_ROOT
 
 
+def resolve_catalog(
+    args: argparse.Namespace,
+    skill_names: list[str] | None = None,
+) -> tuple[list[Path], SkillCatalog]:
+    """Resolve the skills source(s); return the repo roots and their catalog.
+
+    With several --source values the sources are opened in parallel and
+    their catalogs merged, earlier sources taking precedence.
+    """
+    if args.source:
+        from agentskills.sources import resolve_sources
+
+        if args.repo_path or args.repo_url:
+            raise RuntimeError("Use either --source or --repo-url/--repo-path.")
+        if skill_names is None:
+            skill_names = parse_skill_list(args.skill)
+        return resolve_sources(args, skill_names)
+    repo_root = resolve_repo_root(args, skill_names)
+    catalog = load_catalog(repo_root / "skills", use_cache=not args.no_cache)
+    return [repo_root], catalog
+
+
+def install_from_archives(args: argparse.Namespace) -> int:
+    """Extract skills from packaged archives into the target project."""
+    from agentskills.archive import extract_skill, find_archives
+    from agentskills.lockfile import lock_path, read_lock
+
+    if args.repo_url or args.repo_path:
+        raise RuntimeError("Use either --from-archive or a repo, not both.")
+    if args.mode != "copy" or args.sync:
+        raise RuntimeError("--from-archive installs in copy mode only.")
+
+    source = Path(args.from_archive).expanduser().resolve()
+    archives = find_archives(source)
+    if not archives:
+        raise RuntimeError(f"No .skill archives found under: {source}")
+
+    requested = parse_skill_list(args.skill)
+    if requested:
+        selected = requested
+    elif args.install_all or len(archives) == 1:
+        selected = list(archives)
+    else:
+        raise RuntimeError(
+            "No skills specified. Use --skill <name> or --all with a directory "
+            "of archives."
+        )
+    unknown = [name for name in selected if name not in archives]
+    if unknown:
+        raise RuntimeError(
+            f"No archive for skill(s): {', '.join(unknown)}. "
+            f"Available: {', '.join(archives)}"
+        )
+
+    project_root = Path(args.project).expanduser().resolve()
+    destination_root = project_root / PROJECT_SKILLS_DIR
+    destination_root.mkdir(parents=True, exist_ok=True)
+    if not args.force:
+        for name in selected:
+            existing = destination_root / name
+            if existing.exists() or existing.is_symlink():
+                raise RuntimeError(
+                    f"Destination already exists: {existing} (use --force to replace)"
+                )
+
+    import tempfile
+
+    # Like install_skills: extract everything into staging, then swap it
+    # into place, so a bad archive leaves the project as it was.
+    staging = Path(
+        tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=destination_root.parent)
+    )
+    try:
+        reports = {}
+        for name in selected:
+            with span("extract_skill", skill=name):
+                reports[name] = extract_skill(
+                    archives[name], name, staging, installed=destination_root / name
+                )
+        with span("commit_skills", count=len(selected)):
+            _swap_into_place(
+                [staging / name for name in selected],
+                destination_root,
+                staging / ".replaced",
+            )
+    finally:
+        remove_path(staging)
+
+    print(f"archives: {source}")
+    print(f"project: {project_root}")
+    print("installed:")
+    for name in selected:
+        status = f"{archives[name].name}: {reports[name].summary()}"
+        print(f"  - {destination_root / name} ({status})")
+    lock_file = lock_path(destination_root)
+    record = {"archive": str(source), "commit": None, "dirty": False}
+    write_project_lock(destination_root, read_lock(lock_file), record, "copy", selected)
+    print(f"lock: {lock_file}")
+    return 0
+
+
+def install_from_git(
+    args: argparse.Namespace,
+    requested: list[str],
+    frozen_lock: dict[str, Any] | None,
+) -> int:
+    """Install skills from the cached clone's objects, without a checkout."""
+    from agentskills.gitexport import list_skills
+    from agentskills.lockfile import lock_path, read_lock, verify_lock
+
+    if not args.repo_url:
+        raise RuntimeError("--no-checkout requires --repo-url.")
+    if args.mode != "copy" or args.sync or args.sparse:
+        raise RuntimeError(
+            "--no-checkout installs in copy mode; drop --sync and --sparse."
+        )
+
+    repo, commit = fetch_commit(
+        args.repo_url,
+        args.ref,
+        Path(args.cache_dir).expanduser().resolve(),
+        fetch_ttl=args.fetch_ttl,
+    )
+    with span("list_skills", commit=commit):
+        available = list_skills(repo, commit)
+    if not available:
+        raise RuntimeError(f"No skills found under skills/ at {commit}")
+
+    if requested:
+        selected = requested
+    elif args.install_all:
+        selected = list(available)
+    else:
+        raise RuntimeError("--no-checkout needs --skill <name> or --all.")
+    unknown = [name for name in selected if name not in available]
+    if unknown:
+        raise RuntimeError(
+            f"Unknown skill(s): {', '.join(unknown)}. "
+            f"Available: {', '.join(available)}"
+        )
+
+    project_root = Path(args.project).expanduser().resolve()
+    destination_root = project_root / PROJECT_SKILLS_DIR
+    destination_root.mkdir(parents=True, exist_ok=True)
+    lock_file = lock_path(destination_root)
+    previous_lock = frozen_lock or read_lock(lock_file)
+    source = {"url": args.repo_url, "ref": args.ref, "commit": commit, "dirty": False}
+    if frozen_lock is not None:
+        if not verify_lock(frozen_lock, destination_root):
+            print(f"up to date: {lock_file}")
+            return 0
+    elif not args.force and install_is_current(
+        previous_lock, destination_root, source, "copy", selected
+    ):
+        print(f"up to date: {lock_file}")
+        return 0
+
+    installed = export_skills(
+        {name: available[name] for name in selected},
+        repo,
+        commit,
+        destination_root,
+        force=args.force,
+        expected=frozen_lock["skills"] if frozen_lock is not None else None,
+    )
+    write_project_lock(destination_root, previous_lock, source, "copy", selected)
+
+    print(f"repo: {args.repo_url} @ {commit}")
+    print(f"project: {project_root}")
+    print("mode: copy (exported without checkout)")
+    print("installed:")
+    for path in installed:
+        print(f"  - {path}")
+    print(f"lock: {lock_file}")
+    return 0
+
+
+def warn_symlink_mode(args: argparse.Namespace) -> None:
+    """Warn on stderr that symlink installs point outside the project."""
+    if args.mode == "symlink":
+        print(
+            "warning: symlink mode creates links that resolve outside the "
+            "project directory. This may cause permission prompts in Claude "
+            "Code for every file read. Use --mode copy to avoid this.",
+            file=sys.stderr,
+        )
+
+
+def make_backends(
+    args: argparse.Namespace,
+) -> tuple[ObjectStore | None, Cloner | None]:
+    """Create the shared object store or cloner the install mode needs."""
+    if args.sync:
+        return None, None
+    if args.mode == "hardlink":
+        from agentskills.store import ObjectStore
+
+        return ObjectStore(), None
+    if args.mode == "reflink":
+        from agentskills.reflink import Cloner
+
+        return None, Cloner()
+    return None, None
+
+
+def bootstrap_from_manifest(args: argparse.Namespace, requested: list[str]) -> int:
+    """Resolve the repo and catalog once, then bootstrap every listed project."""
+    from agentskills.bulk import (
+        bootstrap_projects,
+        manifest_skills,
+        print_results,
+        resolve_selections,
+    )
+    from agentskills.manifest import read_projects_file
+
+    manifest = Path(args.projects_file).expanduser().resolve()
+    specs = read_projects_file(manifest)
+    if not specs:
+        raise RuntimeError(f"No projects listed in: {manifest}")
+
+    sparse_names = [] if args.install_all else manifest_skills(specs, requested)
+    roots, catalog = resolve_catalog(args, skill_names=sparse_names or [])
+    if not catalog.names:
+        raise RuntimeError(f"No skills found under: {catalog.skills_root}")
+    selections = resolve_selections(specs, catalog, requested, args.install_all)
+
+    source = source_record(args, roots)
+    warn_symlink_mode(args)
+    store, cloner = make_backends(args)
+    try:
+        results = bootstrap_projects(
+            selections, args, catalog, {"store": store, "cloner": cloner}, source
+        )
+    finally:
+        if store is not None:
+            store.save()
+    print_results(results, ", ".join(map(str, roots)), args)
+    return 0 if all(result["status"] == "ok" for result in results) else 1
+
+
+def describe_source(
+    repo_root: Path,
+    repo_url: str | None = None,
+    ref: str | None = None,
+) -> dict[str, Any]:
+    """Describe one skills source (repo, ref, commit) for skills.lock."""
+    if repo_url:
+        record: dict[str, Any] = {"url": repo_url, "ref": ref}
+    else:
+        record = {"path": str(repo_root)}
+    commit = local_commit(repo_root, "HEAD") if (repo_root / ".git").exists() else None
+    dirty = False
+    if commit:
+        status = run_command(
+            ["git", "status", "--porcelain", "--", "skills"],
+            cwd=repo_root,
+            check=False,
+        )
+        dirty = bool(status.stdout.strip())
+    record["commit"] = commit
+    record["dirty"] = dirty
+    return record
+
+
+def source_record(args: argparse.Namespace, roots: list[Path]) -> dict[str, Any]:
+    """Describe the skills source(s) for skills.lock."""
+    if args.source:
+        from agentskills.sources import sources_record
+
+        return sources_record(args, roots)
+    return describe_source(roots[0], args.repo_url, args.ref)
+
+
+def _pinned(source: dict[str, Any]) -> bool:
+    """Return True if every repo in a source record is at a known commit."""
+    return all(record.get("commit") for record in source.get("sources", [source]))
+
+
+def lock_is_current(
+    lock: dict[str, Any] | None,
+    source: dict[str, Any],
+    mode: str,
+    selected: list[str],
+) -> bool:
+    """Return True if lock already pins selected from this exact, clean commit."""
+    if lock is None or not _pinned(source) or source["dirty"]:
+        return False
+    locked = lock["source"]
+    keys = ("url", "path", "commit", "sources")
+    return (
+        not locked.get("dirty")
+        and all(locked.get(key) == source.get(key) for key in keys)
+        and lock["mode"] == mode
+        and set(selected) <= lock["skills"].keys()
+    )
+
+
+def install_is_current(
+    lock: dict[str, Any] | None,
+    destination_root: Path,
+    source: dict[str, Any],
+    mode: str,
+    selected: list[str],
+) -> bool:
+    """Return True if lock is current and selected are still installed as locked.
+
+    Only presence and sizes are checked, so nothing is read or copied.
+    """
+    if not lock_is_current(lock, source, mode, selected):
+        return False
+    from agentskills.lockfile import verify_lock
+
+    skills = lock["skills"]
+    pinned = {**lock, "skills": {name: skills[name] for name in selected}}
+    return not verify_lock(pinned, destination_root, deep=False)
+
+
+def verify_project(args: argparse.Namespace) -> int:
+    """Re-hash installed skills against skills.lock and report drift."""
+    from agentskills.lockfile import lock_path, read_lock, verify_lock
+
+    destination_root = Path(args.project).expanduser().resolve() / PROJECT_SKILLS_DIR
+    lock_file = lock_path(destination_root)
+    lock = read_lock(lock_file)
+    if lock is None:
+        raise RuntimeError(f"No lockfile: {lock_file}")
+    with span("verify_lock", skills=len(lock["skills"])):
+        problems = verify_lock(lock, destination_root)
+    print(f"lock: {lock_file}")
+    for problem in problems:
+        print(f"  ! {problem}")
+    if problems:
+        print(f"error: {len(problems)} file(s) differ from the lock", file=sys.stderr)
+        return 1
+    print(f"verified: {len(lock['skills'])} skill(s) match the lock")
+    return 0
+
+
+def apply_frozen(args: argparse.Namespace) -> dict[str, Any]:
+    """Point args at exactly what skills.lock pins and return the lock."""
+    from agentskills.lockfile import lock_path, read_lock
+
+    if args.skill or args.install_all or args.sync:
+        raise RuntimeError(
+            "--frozen installs what skills.lock pins; drop --skill, --all and --sync."
+        )
+    destination_root = Path(args.project).expanduser().resolve() / PROJECT_SKILLS_DIR
+    lock_file = lock_path(destination_root)
+    lock = read_lock(lock_file)
+    if lock is None:
+        raise RuntimeError(f"--frozen needs a lockfile: {lock_file}")
+
+    source = lock["source"]
+    if "archive" in source:
+        raise RuntimeError(
+            f"{lock_file} pins an archive install; rerun "
+            f"--from-archive {source['archive']} instead of --frozen."
+        )
+    if "sources" in source:
+        if not args.source:
+            from agentskills.sources import frozen_specs
+
+            args.source = frozen_specs(source)
+    elif not args.repo_url and not args.repo_path and not args.source:
+        if source.get("url"):
+            args.repo_url = source["url"]
+        elif source.get("path"):
+            args.repo_path = source["path"]
+    if args.repo_url:
+        args.ref = source.get("commit") or source.get("ref") or args.ref
+    args.skill = sorted(lock["skills"])
+    args.mode = lock["mode"]
+    args.force = True
+    return lock
+
+
+def check_sources_against_lock(lock: dict[str, Any], catalog: SkillCatalog) -> None:
+    """Raise if any locked skill's source files differ from the lock."""
+    from agentskills.lockfile import hash_tree
+
+    for name, entry in sorted(lock["skills"].items()):
+        if hash_tree(catalog.resolve(name)) != entry["files"]:
+            raise RuntimeError(f"Source of {name} does not match skills.lock")
+
+
+def write_project_lock(
+    destination_root: Path,
+    previous: dict[str, Any] | None,
+    source: dict[str, Any],
+    mode: str,
+    selected: list[str],
+) -> Path:
+    """Write skills.lock for selected, keeping other skills from the same source."""
+    from agentskills.lockfile import build_lock, lock_path, write_lock
+
+    lock = build_lock(
+        source, mode, {name: destination_root / name for name in selected}
+    )
+    if (
+        previous is not None
+        and previous["mode"] == mode
+        and previous["source"].get("commit") == source.get("commit")
+        and previous["source"].get("sources") == source.get("sources")
+        and previous["source"].get("archive") == source.get("archive")
+    ):
+        for name, entry in previous["skills"].items():
+            if name not in lock["skills"] and (destination_root / name).exists():
+                lock["skills"][name] = entry
+        lock["skills"] = dict(sorted(lock["skills"].items()))
+    path = lock_path(destination_root)
+    write_lock(path, lock)
+    return path
+
+
 def main() -> int:
     """Bootstrap skills into a target project."""
     try:
         args = parse_args()
-        repo_root = resolve_repo_root(args)
+        if args.from_archive:
+            return install_from_archives(args)
+        if args.sync and args.mode != "copy":
+            raise RuntimeError("--sync requires --mode copy.")
+        if args.checksum and not args.sync:
+            raise RuntimeError("--checksum requires --sync.")
+        if args.verify:
+            return verify_project(args)
+        frozen_lock = apply_frozen(args) if args.frozen else None
 
-        skills_root = repo_root / "skills"
-        available = discover_available_skills(skills_root)
+        requested = parse_skill_list(args.skill)
+        if args.projects_file:
+            if args.no_checkout:
+                raise RuntimeError("--no-checkout does not support --projects-file.")
+            return bootstrap_from_manifest(args, requested)
+        if args.json:
+            raise RuntimeError("--json requires --projects-file.")
+        if args.no_checkout:
+            if args.source:
+                raise RuntimeError("--no-checkout does not support --source.")
+            return install_from_git(args, requested, frozen_lock)
+        roots, catalog = resolve_catalog(args)
+        repo_label = ", ".join(map(str, roots))
+
+        skills_root = catalog.skills_root
+        available = catalog.names
         if not available:
             raise RuntimeError(f"No skills found under: {skills_root}")
 
-        requested = parse_skill_list(args.skill)
         if requested:
             selected = requested
         elif args.install_all:
             selected = available
         else:
-            selected = pick_skills_interactive(skills_root)
+            selected = pick_skills_interactive(skills_root, catalog=catalog)
 
-        unknown = [name for name in selected if name not in available]
+        unknown = [name for name in selected if name not in catalog]
         if unknown:
             raise RuntimeError(
                 f"Unknown skill(s): {', '.join(unknown)}. "
@@ -260,32 +1424,73 @@ def main() -> int:
         destination_root = project_root / PROJECT_SKILLS_DIR
         destination_root.mkdir(parents=True, exist_ok=True)
 
-        if args.mode == "symlink":
-            print(
-                "warning: symlink mode creates links that resolve outside the "
-                "project directory. This may cause permission prompts in Claude "
-                "Code for every file read. Use --mode copy to avoid this.",
-                file=sys.stderr,
+        from agentskills.lockfile import lock_path, read_lock, verify_lock
+
+        lock_file = lock_path(destination_root)
+        previous_lock = frozen_lock or read_lock(lock_file)
+        source = source_record(args, roots)
+        if frozen_lock is not None:
+            check_sources_against_lock(frozen_lock, catalog)
+            if not verify_lock(frozen_lock, destination_root):
+                print(f"up to date: {lock_file}")
+                return 0
+        elif (
+            not args.force
+            and not args.sync
+            and install_is_current(
+                previous_lock, destination_root, source, args.mode, selected
             )
+        ):
+            print(f"up to date: {lock_file}")
+            return 0
+
+        warn_symlink_mode(args)
+        store, cloner = make_backends(args)
 
-        installed: list[Path] = []
-        for skill_name in selected:
-            installed.append(
-                install_skill(
-                    skill_name=skill_name,
-                    source_root=skills_root,
-                    destination_root=destination_root,
-                    mode=args.mode,
-                    force=args.force,
+        if args.sync:
+            print(f"repo: {repo_label}")
+            print(f"project: {project_root}")
+            print("synced:")
+            for skill_name in selected:
+                report = sync_skill(
+                    skill_name, destination_root, catalog, checksum=args.checksum
                 )
+                status = report.summary() if report.changed else "up to date"
+                print(f"  - {destination_root / skill_name} ({status})")
+                for marker, paths in zip("+~-", report, strict=True):
+                    for rel in paths:
+                        print(f"      {marker} {rel}")
+            write_project_lock(
+                destination_root, previous_lock, source, args.mode, selected
+            )
+            print(f"lock: {lock_file}")
+            return 0
+
+        try:
+            installed = install_skills(
+                selected,
+                source_root=skills_root,
+                destination_root=destination_root,
+                mode=args.mode,
+                force=args.force,
+                catalog=catalog,
+                store=store,
+                cloner=cloner,
             )
+        finally:
+            if store is not None:
+                store.save()
+        write_project_lock(destination_root, previous_lock, source, args.mode, selected)
 
-        print(f"repo: {repo_root}")
+        print(f"repo: {repo_label}")
         print(f"project: {project_root}")
         print(f"mode: {args.mode}")
+        if cloner is not None:
+            print(f"reflink: {cloner.summary() or 'no files'}")
         print("installed:")
         for path in installed:
             print(f"  - {path}")
+        print(f"lock: {lock_file}")
         print("next: run optional harness links with `agentskills link` if needed.")
         return 0
     except Exception as exc:
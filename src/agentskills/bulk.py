@@ -0,0 +1,174 @@
+"""Bootstrap many projects from one manifest (`bootstrap --projects-file`).
+
+The source repo and catalog are resolved once by bootstrap; this module
+reads the manifest (see agentskills.manifest for its formats) and
+installs into every project with a bounded worker pool. A failure in one
+project is recorded in its result and does not stop the others.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from agentskills import SkillCatalog
+from agentskills.bootstrap import (
+    PROJECT_SKILLS_DIR,
+    install_is_current,
+    install_skills,
+    sync_skill,
+    write_project_lock,
+)
+from agentskills.lockfile import lock_path, read_lock
+from agentskills.manifest import ALL_SKILLS, ProjectSpec
+from agentskills.timings import span
+
+
+def manifest_skills(specs: list[ProjectSpec], default: list[str]) -> list[str] | None:
+    """Return every skill named across specs, or None if any wants all."""
+    names = dict.fromkeys(default)
+    for spec in specs:
+        if spec.skills == ALL_SKILLS:
+            return None
+        names.update(dict.fromkeys(spec.skills or []))
+    return list(names)
+
+
+def resolve_selections(
+    specs: list[ProjectSpec],
+    catalog: SkillCatalog,
+    requested: list[str],
+    install_all: bool,
+) -> list[tuple[Path, list[str]]]:
+    """Turn specs into (project root, skill names), validating every name."""
+    selections = []
+    for spec in specs:
+        if spec.skills == ALL_SKILLS or (spec.skills is None and install_all):
+            names = catalog.names
+        elif spec.skills is not None:
+            names = spec.skills
+        elif requested:
+            names = requested
+        else:
+            raise RuntimeError(
+                f"No skills for project {spec.path}. Use --skill, --all, or "
+                "set skills in a TOML manifest."
+            )
+        unknown = [name for name in names if name not in catalog]
+        if unknown:
+            raise RuntimeError(
+                f"Unknown skill(s) for project {spec.path}: {', '.join(unknown)}"
+            )
+        selections.append((spec.path.resolve(), names))
+    return selections
+
+
+def _bootstrap_project(
+    project_root: Path,
+    names: list[str],
+    args: argparse.Namespace,
+    catalog: SkillCatalog,
+    backends: dict[str, Any],
+    source: dict[str, Any],
+) -> dict[str, Any]:
+    """Install names into one project, write its lock, and return its result."""
+    result: dict[str, Any] = {"project": str(project_root), "skills": names}
+    try:
+        with span("bootstrap_project", project=project_root.name):
+            destination_root = project_root / PROJECT_SKILLS_DIR
+            destination_root.mkdir(parents=True, exist_ok=True)
+            previous = read_lock(lock_path(destination_root))
+            if args.sync:
+                changed = []
+                for name in names:
+                    report = sync_skill(name, destination_root, catalog, args.checksum)
+                    if report.changed:
+                        changed.append(name)
+                result["changed"] = changed
+            elif not args.force and install_is_current(
+                previous, destination_root, source, args.mode, names
+            ):
+                # The same no-op fast path as a single-project rerun.
+                result["status"] = "ok"
+                result["up_to_date"] = True
+                return result
+            else:
+                install_skills(
+                    names,
+                    source_root=catalog.skills_root,
+                    destination_root=destination_root,
+                    mode=args.mode,
+                    force=args.force,
+                    catalog=catalog,
+                    workers=1,
+                    **backends,
+                )
+            write_project_lock(destination_root, previous, source, args.mode, names)
+        result["status"] = "ok"
+    except Exception as exc:
+        result["status"] = "error"
+        result["error"] = str(exc)
+    return result
+
+
+def bootstrap_projects(
+    selections: list[tuple[Path, list[str]]],
+    args: argparse.Namespace,
+    catalog: SkillCatalog,
+    backends: dict[str, Any],
+    source: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Bootstrap every project with at most args.jobs running at once.
+
+    Each project gets its own skills.lock recording source, the
+    record of the repo(s) the catalog was resolved from.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = [
+            pool.submit(
+                _bootstrap_project, root, names, args, catalog, backends, source
+            )
+            for root, names in selections
+        ]
+        return [future.result() for future in futures]
+
+
+def print_results(
+    results: list[dict[str, Any]],
+    repo: str,
+    args: argparse.Namespace,
+) -> None:
+    """Print a per-project summary for the repo(s) in repo, or JSON with --json."""
+    failed = sum(result["status"] != "ok" for result in results)
+    if args.json:
+        summary = {
+            "repo": repo,
+            "mode": "sync" if args.sync else args.mode,
+            "projects": results,
+            "ok": len(results) - failed,
+            "failed": failed,
+        }
+        print(json.dumps(summary, indent=2))
+        return
+
+    print(f"repo: {repo}")
+    print(f"mode: {'sync' if args.sync else args.mode}")
+    print("projects:")
+    for result in results:
+        if result["status"] != "ok":
+            print(f"  ! {result['project']}: {result['error']}")
+        elif args.sync:
+            changed = result["changed"]
+            status = f"{len(changed)} changed" if changed else "up to date"
+            print(f"  - {result['project']} ({status})")
+        elif result.get("up_to_date"):
+            print(f"  - {result['project']} (up to date)")
+        else:
+            print(f"  - {result['project']} ({len(result['skills'])} skills)")
+    print(f"done: {len(results) - failed} ok, {failed} failed")
+    if failed:
+        print(f"error: {failed} project(s) failed", file=sys.stderr)
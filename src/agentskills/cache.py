@@ -0,0 +1,211 @@
+"""Persistent on-disk cache of the skill catalog.
+
+The cache records, per skills root, the listing of skills/ and
+skills/curated/ (keyed by directory mtime) and, per skill, the SKILL.md
+mtime, size and parsed frontmatter. A warm load stats the two top-level
+directories plus one SKILL.md per candidate and only re-reads SKILL.md
+files whose stat changed.
+
+Timestamps taken within RACY_WINDOW_NS of the load are not trusted, since
+a file modified again within the filesystem's timestamp granularity could
+keep the same mtime. Those entries are re-checked on the next load.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from agentskills import (
+    CURATED_DIR,
+    SkillCatalog,
+    SkillEntry,
+    cache_root,
+    list_skill_candidates,
+    stat_skill_md,
+)
+from agentskills.frontmatter import read_frontmatters
+from agentskills.timings import span
+
+CACHE_VERSION = 2
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def root_digest(skills_root: Path) -> str:
+    """Return a short stable digest identifying a skills root on this machine."""
+    key = os.path.abspath(skills_root)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+def catalog_cache_path(skills_root: Path) -> Path:
+    """Return the cache file path for a skills root."""
+    return cache_root() / "catalog" / f"{root_digest(skills_root)}.json"
+
+
+def _read_cache(path: Path, skills_root: str) -> dict[str, Any]:
+    """Load a cache file, returning {} if it is missing, corrupt or stale."""
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != CACHE_VERSION
+        or data.get("skills_root") != skills_root
+        or not isinstance(data.get("groups"), dict)
+    ):
+        return {}
+    return data
+
+
+def _write_cache(path: Path, data: dict[str, Any]) -> None:
+    """Atomically write a cache file; failures leave the old cache in place."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")), "utf-8")
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    except OSError:
+        pass
+
+
+def dir_mtime_ns(path: Path) -> int | None:
+    """Return a directory's mtime in ns, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _load_group(
+    root: Path,
+    curated: bool,
+    cached: dict[str, Any],
+    frontmatter: bool,
+    now_ns: int,
+) -> tuple[list[SkillEntry], dict[str, Any], bool]:
+    """Refresh one skills directory against its cached state.
+
+    Returns (entries, new cached state, whether anything changed).
+    """
+    dirty = False
+    mtime_ns = dir_mtime_ns(root)
+    if cached and not cached.get("racy") and cached.get("mtime_ns") == mtime_ns:
+        candidates = cached.get("candidates", [])
+    else:
+        candidates = list_skill_candidates(root, None if curated else CURATED_DIR)
+        dirty = True
+
+    cached_skills = cached.get("skills", {}) if cached else {}
+    found: list[tuple[str, Path, os.stat_result, dict[str, Any] | None]] = []
+    for name in candidates:
+        path = root / name
+        st = stat_skill_md(path)
+        if st is None:
+            dirty = dirty or name in cached_skills
+            continue
+
+        previous = cached_skills.get(name)
+        parsed: dict[str, Any] | None = None
+        if (
+            previous
+            and not previous.get("racy")
+            and previous.get("mtime_ns") == st.st_mtime_ns
+            and previous.get("size") == st.st_size
+        ):
+            parsed = previous.get("frontmatter")
+        else:
+            dirty = True
+        found.append((name, path, st, parsed))
+
+    if frontmatter:
+        pending = [i for i, item in enumerate(found) if item[3] is None]
+        if pending:
+            dirty = True
+            parsed_list = read_frontmatters([found[i][1] / "SKILL.md" for i in pending])
+            for i, parsed in zip(pending, parsed_list, strict=True):
+                name, path, st, _ = found[i]
+                found[i] = (name, path, st, parsed)
+
+    entries: list[SkillEntry] = []
+    skills: dict[str, Any] = {}
+    for name, path, st, parsed in found:
+        skills[name] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "frontmatter": parsed,
+            "racy": now_ns - st.st_mtime_ns < RACY_WINDOW_NS,
+        }
+        entries.append(
+            SkillEntry(name, path, curated, st.st_mtime_ns, st.st_size, parsed)
+        )
+
+    state = {
+        "mtime_ns": mtime_ns,
+        "racy": mtime_ns is not None and now_ns - mtime_ns < RACY_WINDOW_NS,
+        "candidates": candidates,
+        "skills": skills,
+    }
+    return entries, state, dirty
+
+
+def load_catalog(
+    skills_root: Path,
+    frontmatter: bool = False,
+    use_cache: bool = True,
+) -> SkillCatalog:
+    """Build a SkillCatalog, reusing the on-disk cache where it is still valid.
+
+    With frontmatter=True every entry carries parsed frontmatter; only
+    SKILL.md files that changed since the cache was written are re-read.
+    With use_cache=False the cache is neither read nor written.
+    """
+    with span("load_catalog", frontmatter=frontmatter, cached=use_cache):
+        return _load_catalog(skills_root, frontmatter, use_cache)
+
+
+def _load_catalog(
+    skills_root: Path,
+    frontmatter: bool,
+    use_cache: bool,
+) -> SkillCatalog:
+    """Build a SkillCatalog; see load_catalog."""
+    if not use_cache and not frontmatter:
+        return SkillCatalog.scan(skills_root)
+
+    key = os.path.abspath(skills_root)
+    cache_path = catalog_cache_path(skills_root)
+    data = _read_cache(cache_path, key) if use_cache else {}
+    cached_groups = data.get("groups", {})
+    now_ns = time.time_ns()
+
+    own, own_state, own_dirty = _load_group(
+        skills_root, False, cached_groups.get("own", {}), frontmatter, now_ns
+    )
+    curated, curated_state, curated_dirty = _load_group(
+        skills_root / CURATED_DIR,
+        True,
+        cached_groups.get("curated", {}),
+        frontmatter,
+        now_ns,
+    )
+
+    if use_cache and (own_dirty or curated_dirty):
+        _write_cache(
+            cache_path,
+            {
+                "version": CACHE_VERSION,
+                "skills_root": key,
+                "groups": {"own": own_state, "curated": curated_state},
+            },
+        )
+    return SkillCatalog(skills_root, own + curated)
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import os
 import sys
 
 COMMANDS = {
@@ -11,20 +12,45 @@ COMMANDS = {
     "link": "Create harness symlinks for a project",
     "package": "Package a skill into a .skill archive",
     "release": "Validate and package a skill",
+    "search": "Search skills and reference docs by keyword",
 }
 
+TIMINGS_ENV = "AGENTSKILLS_TIMINGS"
+
+
+def pop_timings_flag(argv: list[str]) -> str | None:
+    """Remove --timings[=tree|json] from argv and return the format, if any.
+
+    Only flags before the subcommand name are consumed; anything after it
+    belongs to the subcommand. Falls back to the AGENTSKILLS_TIMINGS
+    environment variable, which takes the same values (or "1" for the
+    default tree format).
+    """
+    fmt: str | None = None
+    while argv and (argv[0] == "--timings" or argv[0].startswith("--timings=")):
+        arg = argv.pop(0)
+        fmt = arg.split("=", 1)[1] if "=" in arg else "tree"
+    if fmt is None:
+        env = os.environ.get(TIMINGS_ENV, "")
+        if env:
+            fmt = "tree" if env == "1" else env
+    return fmt
+
 
 def main() -> int:
     """Dispatch to the requested subcommand."""
-    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help"):
-        print("usage: agentskills <command> [args]\n")
+    argv = sys.argv[1:]
+    timings_format = pop_timings_flag(argv)
+
+    if not argv or argv[0] in ("-h", "--help"):
+        print("usage: agentskills [--timings[=tree|json]] <command> [args]\n")
         print("commands:")
         for name, desc in COMMANDS.items():
             print(f"  {name:12s} {desc}")
         return 0
 
-    command = sys.argv[1]
-    sys.argv = [f"agentskills {command}", *sys.argv[2:]]
+    command = argv[0]
+    sys.argv = [f"agentskills {command}", *argv[1:]]
 
     if command == "bootstrap":
         from agentskills.bootstrap import main as cmd
@@ -36,12 +62,28 @@ def main() -> int:
         from agentskills.package import main as cmd
     elif command == "release":
         from agentskills.release import main as cmd
+    elif command == "search":
+        from agentskills.search import main as cmd
     else:
         print(f"error: unknown command '{command}'")
         print(f"available: {', '.join(COMMANDS)}")
         return 1
 
-    return cmd()
+    if timings_format is None:
+        return cmd()
+
+    from agentskills import timings
+
+    try:
+        timings.enable(timings_format)
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    try:
+        with timings.span(f"agentskills {command}"):
+            return cmd()
+    finally:
+        timings.report()
 
 
 if __name__ == "__main__":
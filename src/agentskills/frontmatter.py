@@ -0,0 +1,513 @@
+"""Read YAML frontmatter from SKILL.md files.
+
+Only the frontmatter is read: files are read line by line up to the
+closing ``---`` (at most MAX_HEADER_BYTES), so a large SKILL.md body
+costs nothing. The block is parsed with a small parser for the subset of
+YAML that skills use; see _Parser.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, NamedTuple
+
+DELIMITER = b"---"
+MAX_HEADER_BYTES = 64 * 1024
+PARALLEL_THRESHOLD = 32
+
+_KEY_RE = re.compile(
+    r'(?:"((?:[^"\\]|\\.)*)"'  # "double-quoted"
+    r"|'((?:[^']|'')*)'"  # 'single-quoted'
+    r"|([^\s#'\"{\[\]},&*!|>%@`-][^#]*?|-[^\s#][^#]*?))"  # plain
+    r"\s*:(?:\s+(.*))?$"
+)
+_FLOW_PLAIN_RE = re.compile(r"[^,\[\]{}:]*(?::(?![\s,\]}])[^,\[\]{}:]*)*")
+_BLOCK_HEADER_RE = re.compile(r"([|>])([+-]?)([1-9]?)([+-]?)\s*(?:#.*)?$")
+_INT_RE = re.compile(r"[-+]?(?:0|[1-9][0-9]*)$")
+_ESCAPES = {
+    "0": "\0",
+    "a": "\a",
+    "b": "\b",
+    "t": "\t",
+    "n": "\n",
+    "v": "\v",
+    "f": "\f",
+    "r": "\r",
+    "e": "\x1b",
+    " ": " ",
+    '"': '"',
+    "/": "/",
+    "\\": "\\",
+}
+_ESCAPE_RE = re.compile(r"\\(x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|.)")
+
+
+class Frontmatter(NamedTuple):
+    """The fields of a SKILL.md frontmatter block that the tools use.
+
+    version is metadata.version, falling back to a top-level version.
+    data holds the whole parsed mapping.
+    """
+
+    name: str | None
+    description: str | None
+    version: str | None
+    metadata: dict[str, Any]
+    data: dict[str, Any]
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any]) -> Frontmatter:
+        """Build a Frontmatter from a parsed frontmatter mapping."""
+        metadata = data.get("metadata")
+        if not isinstance(metadata, dict):
+            metadata = {}
+        version = _text(metadata.get("version")) or _text(data.get("version"))
+        return cls(
+            _text(data.get("name")),
+            _text(data.get("description")),
+            version,
+            metadata,
+            data,
+        )
+
+
+def _text(value: Any) -> str | None:
+    """Return a scalar as a non-empty string, or None."""
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    return str(value) or None
+
+
+class _Line(NamedTuple):
+    """One frontmatter line: indent in spaces, stripped text, raw text."""
+
+    indent: int
+    text: str
+    raw: str
+    number: int
+
+
+def _quoted_end(text: str) -> int | None:
+    """Return the index of the quote closing the string text starts, or None."""
+    quote = text[0]
+    i = 1
+    while i < len(text):
+        char = text[i]
+        if quote == '"' and char == "\\":
+            i += 2
+            continue
+        if char == quote:
+            if quote == "'" and text[i + 1 : i + 2] == "'":
+                i += 2
+                continue
+            return i
+        i += 1
+    return None
+
+
+def _unescape(body: str) -> str:
+    """Resolve the escapes of a double-quoted string."""
+
+    def replace(match: re.Match[str]) -> str:
+        code = match.group(1)
+        if len(code) > 1:
+            return chr(int(code[1:], 16))
+        if code not in _ESCAPES:
+            raise ValueError(f"unknown escape \\{code}")
+        return _ESCAPES[code]
+
+    return _ESCAPE_RE.sub(replace, body)
+
+
+def _unquote(text: str) -> str:
+    """Return the value of a quoted string that spans all of text."""
+    if text[0] == '"':
+        return _unescape(text[1:-1])
+    return text[1:-1].replace("''", "'")
+
+
+def _plain(text: str) -> Any:
+    """Resolve a plain scalar: null, booleans and integers; else a string.
+
+    Other numbers stay strings, so versions such as 1.10 keep their text.
+    """
+    if text in ("", "~", "null", "Null", "NULL"):
+        return None
+    if text in ("true", "True", "TRUE"):
+        return True
+    if text in ("false", "False", "FALSE"):
+        return False
+    if _INT_RE.match(text):
+        return int(text)
+    return text
+
+
+def _strip_comment(text: str) -> str:
+    """Drop a trailing `` #`` comment from a plain scalar."""
+    match = re.search(r"\s#", text)
+    return (text[: match.start()] if match else text).strip()
+
+
+def _flow(text: str, i: int) -> tuple[Any, int]:
+    """Parse the flow collection or scalar at text[i:]; return it and the end."""
+    while text[i] == " ":
+        i += 1
+    char = text[i]
+    if char in "[{":
+        close = "]" if char == "[" else "}"
+        items: list[Any] = []
+        mapping: dict[str, Any] = {}
+        i += 1
+        while True:
+            while text[i] == " ":
+                i += 1
+            if text[i] == close:
+                return (items if char == "[" else mapping), i + 1
+            value, i = _flow(text, i)
+            if char == "{":
+                while text[i] == " ":
+                    i += 1
+                if text[i] != ":":
+                    raise ValueError(f"expected ':' in {text!r}")
+                mapping[str(value)], i = _flow(text, i + 1)
+            else:
+                items.append(value)
+            while text[i] == " ":
+                i += 1
+            if text[i] == ",":
+                i += 1
+            elif text[i] != close:
+                raise ValueError(f"expected ',' or '{close}' in {text!r}")
+    if char in "\"'":
+        end = _quoted_end(text[i:])
+        if end is None:
+            raise ValueError(f"unterminated string in {text!r}")
+        return _unquote(text[i : i + end + 1]), i + end + 1
+    match = _FLOW_PLAIN_RE.match(text, i)
+    assert match is not None
+    return _plain(match.group().strip()), match.end()
+
+
+def _scalar(text: str) -> Any:
+    """Parse a one-line scalar or flow collection, with optional comment."""
+    if text[0] in "\"'[{":
+        try:
+            value, end = _flow(text, 0)
+        except IndexError:
+            raise ValueError(f"unterminated value {text!r}") from None
+        rest = text[end:].strip()
+        if rest and not rest.startswith("#"):
+            raise ValueError(f"unexpected text after value: {rest!r}")
+        return value
+    return _plain(_strip_comment(text))
+
+
+def _fold(lines: list[str]) -> str:
+    """Join the lines of a folded block scalar."""
+    text = ""
+    for i, line in enumerate(lines):
+        if i == 0 or line == "":
+            text += line if i == 0 else "\n"
+            continue
+        previous = lines[i - 1]
+        if previous == "":
+            text += line
+        elif line.startswith((" ", "\t")) or previous.startswith((" ", "\t")):
+            text += "\n" + line
+        else:
+            text += " " + line
+    return text
+
+
+class _Parser:
+    """Recursive-descent parser for the block YAML used in frontmatter.
+
+    Handles nested mappings and sequences by indentation, plain, quoted
+    and multi-line scalars, literal (|) and folded (>) block scalars with
+    chomping and indentation indicators, flow collections on one line,
+    and comments. Anchors, aliases, tags and multiple documents are not
+    supported.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.lines = [
+            _Line(len(raw) - len(raw.lstrip(" ")), raw.strip(), raw, number)
+            for number, raw in enumerate(text.splitlines(), start=2)
+        ]
+        self.pos = 0
+
+    def error(self, message: str) -> ValueError:
+        """Return a ValueError for the current line."""
+        if self.pos < len(self.lines):
+            message = f"line {self.lines[self.pos].number}: {message}"
+        return ValueError(message)
+
+    def peek(self) -> _Line | None:
+        """Return the next line with content, skipping blanks and comments."""
+        while self.pos < len(self.lines):
+            line = self.lines[self.pos]
+            if line.text and not line.text.startswith("#"):
+                return line
+            self.pos += 1
+        return None
+
+    def document(self) -> dict[str, Any]:
+        """Parse the whole block, which must be a mapping."""
+        line = self.peek()
+        if line is None:
+            return {}
+        if _is_item(line.text):
+            raise self.error("frontmatter must be a mapping")
+        data = self.mapping(line.indent)
+        if self.peek() is not None:
+            raise self.error("unexpected indentation")
+        return data
+
+    def block(self, indent: int) -> Any:
+        """Parse the mapping or sequence starting at the next line."""
+        line = self.peek()
+        assert line is not None
+        if _is_item(line.text):
+            return self.sequence(indent)
+        return self.mapping(indent)
+
+    def mapping(self, indent: int) -> dict[str, Any]:
+        """Parse `key: value` lines at exactly indent."""
+        data: dict[str, Any] = {}
+        while (line := self.peek()) and line.indent == indent:
+            if _is_item(line.text):
+                break
+            match = _KEY_RE.match(line.text)
+            if match is None:
+                raise self.error(f"expected 'key: value', got {line.text!r}")
+            double, single, plain, rest = match.groups()
+            if double is not None:
+                key = _unescape(double)
+            elif single is not None:
+                key = single.replace("''", "'")
+            else:
+                key = plain
+            self.pos += 1
+            data[key] = self.value(rest or "", indent, in_mapping=True)
+        if line is not None and line.indent > indent:
+            raise self.error("unexpected indentation")
+        return data
+
+    def sequence(self, indent: int) -> list[Any]:
+        """Parse `- item` lines at exactly indent."""
+        items: list[Any] = []
+        while (line := self.peek()) and line.indent == indent:
+            if not _is_item(line.text):
+                break
+            content = line.text[1:].lstrip()
+            if content and (_is_item(content) or _KEY_RE.match(content)):
+                # A collection starting on the dash line: reparse the rest
+                # of the line as if it stood alone at its own column.
+                column = indent + len(line.text) - len(content)
+                self.lines[self.pos] = line._replace(indent=column, text=content)
+                items.append(self.block(column))
+                continue
+            self.pos += 1
+            items.append(self.value(content, indent, in_mapping=False))
+        if line is not None and line.indent > indent:
+            raise self.error("unexpected indentation")
+        return items
+
+    def value(self, rest: str, indent: int, in_mapping: bool) -> Any:
+        """Parse the value after a key or dash whose line is at indent."""
+        if rest.startswith(("|", ">")):
+            return self.block_scalar(rest, indent)
+        if rest.startswith(("'", '"')):
+            return self.quoted(rest)
+        if rest and not rest.startswith("#"):
+            return self.plain(rest, indent)
+        line = self.peek()
+        if line is not None and line.indent > indent:
+            return self.block(line.indent)
+        if (
+            in_mapping
+            and line is not None
+            and line.indent == indent
+            and _is_item(line.text)
+        ):
+            # A sequence may sit at the same indent as its key.
+            return self.sequence(indent)
+        return None
+
+    def plain(self, rest: str, indent: int) -> Any:
+        """Parse a plain scalar, folding more-indented continuation lines."""
+        value = _scalar(rest)
+        if rest[0] in "[{":
+            return value
+        parts = [_strip_comment(rest)]
+        while (line := self.peek()) and line.indent > indent:
+            parts.append(_strip_comment(line.text))
+            self.pos += 1
+        return value if len(parts) == 1 else " ".join(parts)
+
+    def quoted(self, rest: str) -> Any:
+        """Parse a quoted scalar, joining lines until the closing quote."""
+        text = rest
+        while _quoted_end(text) is None:
+            if self.pos >= len(self.lines):
+                raise self.error(f"unterminated string {rest!r}")
+            line = self.lines[self.pos].text
+            text += "\n" if not line else ("" if text.endswith("\n") else " ") + line
+            self.pos += 1
+        return _scalar(text)
+
+    def block_scalar(self, header: str, indent: int) -> str:
+        """Parse a literal or folded block scalar after its header."""
+        match = _BLOCK_HEADER_RE.match(header)
+        if match is None:
+            raise self.error(f"invalid block scalar header {header!r}")
+        style, chomp_a, digit, chomp_b = match.groups()
+        chomp = chomp_a or chomp_b
+        block_indent = indent + int(digit) if digit else None
+        lines: list[str] = []
+        while self.pos < len(self.lines):
+            line = self.lines[self.pos]
+            if not line.text:
+                lines.append("")
+                self.pos += 1
+                continue
+            if block_indent is None:
+                block_indent = line.indent
+            if line.indent < block_indent or line.indent <= indent:
+                break
+            lines.append(line.raw[block_indent:].rstrip("\r"))
+            self.pos += 1
+
+        trailing = len(lines)
+        while trailing and lines[trailing - 1] == "":
+            trailing -= 1
+        content, blank = lines[:trailing], len(lines) - trailing
+        text = _fold(content) if style == ">" else "\n".join(content)
+        if not content or chomp == "-":
+            return text if chomp != "+" else text + "\n" * blank
+        if chomp == "+":
+            return text + "\n" * (blank + 1)
+        return text + "\n"
+
+
+def _is_item(text: str) -> bool:
+    """Return True if text starts a block sequence item."""
+    return text == "-" or text.startswith("- ")
+
+
+def parse_frontmatter_block(block: str) -> dict[str, Any]:
+    """Parse the YAML between the frontmatter delimiters.
+
+    Raises:
+        ValueError: If the block is not valid in the supported YAML subset.
+    """
+    return _Parser(block).document()
+
+
+def _split_block(text: str) -> tuple[bool, str | None]:
+    """Split the frontmatter off text.
+
+    Returns whether text opens with a delimiter line, and the YAML between
+    the delimiters, or None if there is no closing delimiter.
+    """
+    lines = text.splitlines(keepends=True)
+    if not lines or lines[0].rstrip() != "---":
+        return False, None
+    for i, line in enumerate(lines[1:], start=1):
+        if line.rstrip() == "---":
+            return True, "".join(lines[1:i])
+    return True, None
+
+
+def parse_frontmatter_text(text: str) -> dict[str, Any] | None:
+    """Parse the frontmatter block at the start of text.
+
+    Returns None when text does not start with a ``---`` delimited block
+    or the block is not valid YAML in the supported subset.
+    """
+    block = _split_block(text)[1]
+    if block is None:
+        return None
+    try:
+        return parse_frontmatter_block(block)
+    except ValueError:
+        return None
+
+
+def _read_block(skill_md: Path) -> tuple[bool, str | None]:
+    """Read the frontmatter of skill_md, stopping at the closing delimiter.
+
+    Returns the same pair as _split_block, including both delimiters in
+    the text. A block longer than MAX_HEADER_BYTES counts as unterminated.
+    """
+    with skill_md.open("rb") as handle:
+        first = handle.readline(MAX_HEADER_BYTES)
+        if first.rstrip() != DELIMITER:
+            return False, None
+        lines = [first]
+        consumed = len(first)
+        while consumed < MAX_HEADER_BYTES:
+            line = handle.readline(MAX_HEADER_BYTES - consumed)
+            if not line:
+                return True, None
+            lines.append(line)
+            consumed += len(line)
+            if line.rstrip() == DELIMITER:
+                return True, b"".join(lines).decode("utf-8")
+    return True, None
+
+
+def read_frontmatter_text(skill_md: Path) -> str | None:
+    """Return the frontmatter block of skill_md, including both delimiters.
+
+    Reads line by line and stops at the closing ``---``, so the body of the
+    file is never read. Returns None if the file does not open with a
+    frontmatter block or the block exceeds MAX_HEADER_BYTES.
+    """
+    return _read_block(skill_md)[1]
+
+
+def load_frontmatter(skill_md: Path) -> Frontmatter:
+    """Read and parse the frontmatter of skill_md, without reading its body.
+
+    Raises:
+        RuntimeError: If the frontmatter is missing, unterminated or invalid.
+    """
+    try:
+        opened, text = _read_block(skill_md)
+    except UnicodeDecodeError as exc:
+        raise RuntimeError(f"Invalid YAML frontmatter in {skill_md}") from exc
+    if not opened:
+        raise RuntimeError(f"Missing YAML frontmatter in {skill_md}")
+    if text is None:
+        raise RuntimeError(f"Invalid YAML frontmatter in {skill_md}")
+    try:
+        data = parse_frontmatter_block(_split_block(text)[1] or "")
+    except ValueError as exc:
+        raise RuntimeError(f"Invalid YAML frontmatter in {skill_md}: {exc}") from exc
+    return Frontmatter.from_data(data)
+
+
+def read_frontmatter(skill_md: Path) -> dict[str, Any]:
+    """Read frontmatter from skill_md, returning {} if it is missing or invalid."""
+    try:
+        return load_frontmatter(skill_md).data
+    except (OSError, RuntimeError):
+        return {}
+
+
+def read_frontmatters(paths: Sequence[Path]) -> list[dict[str, Any]]:
+    """Read frontmatter from many SKILL.md files, in order.
+
+    Large batches are spread across a thread pool, since the cost is
+    dominated by open/read latency rather than parsing.
+    """
+    if len(paths) < PARALLEL_THRESHOLD:
+        return [read_frontmatter(path) for path in paths]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(32, len(paths) // 8 + 1)) as pool:
+        return list(pool.map(read_frontmatter, paths))
@@ -0,0 +1,159 @@
+"""Export skills straight from a git commit, without a working tree.
+
+Backs `bootstrap --no-checkout`. Skills are found with a single
+`git ls-tree` of the commit's skills/ tree, and each one is streamed out
+of the object database with `git archive --format=tar <commit> -- <path>`,
+read as a tar stream and written file by file into the destination. The
+cached clone is only ever fetched into, so any number of commits can be
+exported from it concurrently.
+"""
+
+from __future__ import annotations
+
+import os
+import posixpath
+import shutil
+import subprocess
+import tarfile
+from pathlib import Path, PurePosixPath
+
+from agentskills import CURATED_DIR
+
+CHUNK_SIZE = 1 << 20
+
+
+def list_skills(repo: Path, commit: str) -> dict[str, str]:
+    """Map skill name to its path in commit, own skills before curated.
+
+    Like SkillCatalog, a directory counts as a skill when it holds a
+    SKILL.md, and own skills shadow curated ones with the same name.
+    """
+    result = subprocess.run(
+        ["git", "ls-tree", "-r", "-z", "--name-only", commit, "--", "skills"],
+        cwd=repo,
+        capture_output=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        stderr = result.stderr.decode(errors="replace").strip()
+        raise RuntimeError(f"Cannot list skills at {commit}: {stderr}")
+
+    own: dict[str, str] = {}
+    curated: dict[str, str] = {}
+    for raw in result.stdout.split(b"\0"):
+        parts = raw.decode("utf-8", errors="surrogateescape").split("/")
+        if parts[-1] != "SKILL.md":
+            continue
+        if len(parts) == 3 and parts[1] != CURATED_DIR:
+            found, name = own, parts[1]
+        elif len(parts) == 4 and parts[1] == CURATED_DIR:
+            found, name = curated, parts[2]
+        else:
+            continue
+        if not name.startswith("."):
+            found[name] = "/".join(parts[:-1])
+    skills = {name: own[name] for name in sorted(own)}
+    for name in sorted(curated):
+        skills.setdefault(name, curated[name])
+    return skills
+
+
+def _relative(member: tarfile.TarInfo, prefix: str) -> str | None:
+    """Return member's path below prefix, or None for prefix and its parents."""
+    path = PurePosixPath(member.name)
+    base = PurePosixPath(prefix)
+    if path == base or path in base.parents:
+        return None
+    rel = path.relative_to(prefix)
+    if any(part in ("", ".", "..") for part in rel.parts):
+        raise RuntimeError(f"Unsafe path in git archive: {member.name!r}")
+    return str(rel)
+
+
+def _link_target(rel: str, linkname: str, path: str) -> str:
+    """Resolve a symlink at rel against the exported tree, relative to it.
+
+    Raises RuntimeError for links that leave the tree, since only path is
+    exported and the target would not exist in the destination.
+    """
+    target = posixpath.normpath(posixpath.join(posixpath.dirname(rel), linkname))
+    if posixpath.isabs(linkname) or target == ".." or target.startswith("../"):
+        raise RuntimeError(f"Symlink {path}/{rel} -> {linkname} points outside {path}")
+    return target
+
+
+def _materialize_links(destination: Path, links: dict[str, str], path: str) -> None:
+    """Replace each pending link with a copy of its target, as copytree would.
+
+    Links to links are resolved by repeating passes until every link is
+    written; a link whose target never appears is dangling or circular.
+    """
+    while links:
+        # A directory is only copied once the links inside it are written.
+        ready = {
+            rel: target
+            for rel, target in links.items()
+            if (destination / target).exists()
+            and not any(other.startswith(f"{target}/") for other in links)
+        }
+        if not ready:
+            rel, target = next(iter(links.items()))
+            raise RuntimeError(
+                f"Symlink {path}/{rel} -> {target} is dangling or circular"
+            )
+        for rel, target in ready.items():
+            source = destination / target
+            if source.is_dir():
+                shutil.copytree(source, destination / rel)
+            else:
+                shutil.copy(source, destination / rel)
+            del links[rel]
+
+
+def export_tree(repo: Path, commit: str, path: str, destination: Path) -> int:
+    """Write the tree at path in commit to destination; return the file count.
+
+    destination must not exist yet. Executable bits are kept as git records
+    them. Symlinks are written as copies of their targets, like a copy-mode
+    install from a checkout; links that point outside path are refused.
+    """
+    proc = subprocess.Popen(
+        ["git", "archive", "--format=tar", commit, "--", path],
+        cwd=repo,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    files = 0
+    links: dict[str, str] = {}
+    try:
+        destination.mkdir()
+        with tarfile.open(fileobj=proc.stdout, mode="r|") as tar:
+            for member in tar:
+                rel = _relative(member, path)
+                if rel is None:
+                    continue
+                target = destination / rel
+                if member.isdir():
+                    target.mkdir(parents=True, exist_ok=True)
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                if member.issym():
+                    links[rel] = _link_target(rel, member.linkname, path)
+                elif member.isfile():
+                    with tar.extractfile(member) as src, open(target, "wb") as dst:
+                        shutil.copyfileobj(src, dst, CHUNK_SIZE)
+                    os.chmod(target, 0o755 if member.mode & 0o111 else 0o644)
+                else:
+                    continue
+                files += 1
+    except tarfile.TarError as exc:
+        raise RuntimeError(f"Bad git archive stream for {path}: {exc}") from exc
+    finally:
+        proc.stdout.close()
+        stderr = proc.stderr.read().decode(errors="replace").strip()
+        proc.stderr.close()
+        returncode = proc.wait()
+    if returncode != 0:
+        raise RuntimeError(f"git archive {commit} {path} failed: {stderr}")
+    _materialize_links(destination, links, path)
+    return files
@@ -6,7 +6,6 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import shutil
 import sys
 from pathlib import Path
 
@@ -29,6 +28,8 @@ def remove_path(path: Path) -> None:
     if path.is_symlink() or path.is_file():
         path.unlink()
     elif path.exists():
+        import shutil
+
         shutil.rmtree(path)
 
 
@@ -39,8 +40,29 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--project",
-        required=True,
-        help="Project directory containing .agents/skills.",
+        action="append",
+        default=[],
+        help="Project directory containing .agents/skills. Repeat to reconcile "
+        "several projects at once.",
+    )
+    parser.add_argument(
+        "--root",
+        action="append",
+        default=[],
+        help="Reconcile every project with .agents/skills found under this "
+        "directory. Repeatable.",
+    )
+    parser.add_argument(
+        "--projects-file",
+        metavar="PATH",
+        help="Reconcile the projects listed in PATH (the bootstrap "
+        "--projects-file format).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=8,
+        help="Projects to reconcile in parallel (default: 8).",
     )
     parser.add_argument(
         "--harness",
@@ -61,7 +83,8 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--dry-run",
         action="store_true",
-        help="Print planned actions without writing changes.",
+        help="Print planned actions without writing changes (as JSON when "
+        "reconciling several projects).",
     )
     return parser.parse_args()
 
@@ -102,23 +125,48 @@ def _link_harness(  # noqa: PLR0913
         print(f"linked: {name} ({link_path} -> {relative_target})")
 
 
+def load_config(config_path: Path) -> tuple[str, dict]:
+    """Return (canonical_skills_dir, adapters) from an adapter config."""
+    if not config_path.exists():
+        raise RuntimeError(f"Config file not found: {config_path}")
+
+    with config_path.open("r", encoding="utf-8") as handle:
+        config = json.load(handle)
+
+    canonical_rel = config.get("canonical_skills_dir")
+    adapters = config.get("adapters", {})
+    if not canonical_rel or not isinstance(adapters, dict):
+        raise RuntimeError("Config must contain canonical_skills_dir and adapters.")
+    for name, adapter in adapters.items():
+        if not adapter.get("relative_link_path"):
+            raise RuntimeError(f"Adapter {name} is missing relative_link_path.")
+    return canonical_rel, adapters
+
+
+def select_harnesses(adapters: dict, raw_values: list[str]) -> list[str]:
+    """Return the harnesses named in raw_values (default: all), validated."""
+    selected = parse_harness_list(raw_values)
+    harness_names = selected if selected else sorted(adapters.keys())
+    unknown = [name for name in harness_names if name not in adapters]
+    if unknown:
+        raise RuntimeError(f"Unknown harness(es): {', '.join(unknown)}")
+    return harness_names
+
+
 def main() -> int:
-    """Create harness symlinks for a project."""
+    """Create harness symlinks for a project, or reconcile many projects."""
     try:
         args = parse_args()
-        project_root = Path(args.project).expanduser().resolve()
-        config_path = Path(args.config).expanduser().resolve()
-
-        if not config_path.exists():
-            raise RuntimeError(f"Config file not found: {config_path}")
+        if len(args.project) > 1 or args.root or args.projects_file:
+            from agentskills.reconcile import reconcile
 
-        with config_path.open("r", encoding="utf-8") as handle:
-            config = json.load(handle)
+            return reconcile(args)
+        if not args.project:
+            raise RuntimeError("Use --project, --root or --projects-file.")
 
-        canonical_rel = config.get("canonical_skills_dir")
-        adapters = config.get("adapters", {})
-        if not canonical_rel or not isinstance(adapters, dict):
-            raise RuntimeError("Config must contain canonical_skills_dir and adapters.")
+        project_root = Path(args.project[0]).expanduser().resolve()
+        config_path = Path(args.config).expanduser().resolve()
+        canonical_rel, adapters = load_config(config_path)
 
         canonical_dir = project_root / canonical_rel
         if not canonical_dir.exists():
@@ -128,23 +176,14 @@ def main() -> int:
                 " via `agentskills bootstrap`."
             )
 
-        selected = parse_harness_list(args.harness)
-        harness_names = selected if selected else sorted(adapters.keys())
-        unknown = [name for name in harness_names if name not in adapters]
-        if unknown:
-            raise RuntimeError(f"Unknown harness(es): {', '.join(unknown)}")
+        harness_names = select_harnesses(adapters, args.harness)
 
         print(f"project: {project_root}")
         print(f"canonical: {canonical_dir}")
         print(f"dry_run: {args.dry_run}")
 
         for name in harness_names:
-            adapter = adapters[name]
-            link_rel = adapter.get("relative_link_path")
-            if not link_rel:
-                raise RuntimeError(f"Adapter {name} is missing relative_link_path.")
-
-            link_path = project_root / link_rel
+            link_path = project_root / adapters[name]["relative_link_path"]
             link_path.parent.mkdir(parents=True, exist_ok=True)
             relative_target = Path(os.path.relpath(canonical_dir, link_path.parent))
             _link_harness(
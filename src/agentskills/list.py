@@ -4,9 +4,13 @@
 from __future__ import annotations
 
 import argparse
+import json
 from pathlib import Path
+from typing import Any
 
-from agentskills import REPO_ROOT, categorize_skills
+from agentskills import REPO_ROOT, SkillCatalog
+from agentskills.cache import load_catalog
+from agentskills.frontmatter import Frontmatter
 
 
 def parse_args() -> argparse.Namespace:
@@ -18,9 +22,60 @@ def parse_args() -> argparse.Namespace:
         "--repo-path",
         help="Use a local repo path instead of the current directory.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rescan skills without reading or writing the catalog cache.",
+    )
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument(
+        "--long",
+        "-l",
+        action="store_true",
+        help="Show version, source, SKILL.md size and description.",
+    )
+    output.add_argument(
+        "--json",
+        action="store_true",
+        help="Print skill details as a JSON array.",
+    )
     return parser.parse_args()
 
 
+def skill_details(catalog: SkillCatalog) -> list[dict[str, Any]]:
+    """Return name, version, description, source, path and size per skill."""
+    details: list[dict[str, Any]] = []
+    for entry in catalog:
+        frontmatter = Frontmatter.from_data(entry.frontmatter or {})
+        details.append(
+            {
+                "name": entry.name,
+                "version": frontmatter.version or "",
+                "description": frontmatter.description or "",
+                "source": "curated" if entry.curated else "own",
+                "path": str(entry.path),
+                "size": entry.size or 0,
+            }
+        )
+    return details
+
+
+def print_long(details: list[dict[str, Any]]) -> None:
+    """Print skill details as aligned columns."""
+    name_width = max(len(d["name"]) for d in details)
+    version_width = max(len("VERSION"), *(len(d["version"]) for d in details))
+    size_width = max(len("SIZE"), *(len(str(d["size"])) for d in details))
+    print(
+        f"{'NAME':{name_width}s}  {'VERSION':{version_width}s}  "
+        f"{'SOURCE':7s}  {'SIZE':>{size_width}s}  DESCRIPTION"
+    )
+    for d in details:
+        print(
+            f"{d['name']:{name_width}s}  {d['version']:{version_width}s}  "
+            f"{d['source']:7s}  {d['size']:>{size_width}d}  {d['description']}"
+        )
+
+
 def main() -> int:
     """Print available skills grouped by own/curated."""
     args = parse_args()
@@ -30,15 +85,30 @@ def main() -> int:
     else:
         skills_root = REPO_ROOT / "skills"
 
-    own, curated = categorize_skills(skills_root)
+    detailed = args.long or args.json
+    catalog = load_catalog(
+        skills_root,
+        frontmatter=detailed,
+        use_cache=not args.no_cache,
+    )
 
-    if not own and not curated:
-        print(f"No skills found under: {skills_root}")
+    if not catalog:
+        if args.json:
+            print("[]")
+        else:
+            print(f"No skills found under: {skills_root}")
         return 1
 
-    for name in own:
+    if args.json:
+        print(json.dumps(skill_details(catalog), indent=2))
+        return 0
+    if args.long:
+        print_long(skill_details(catalog))
+        return 0
+
+    for name in catalog.own:
         print(name)
-    for name in curated:
+    for name in catalog.curated:
         print(f"{name} (curated)")
 
     return 0
@@ -0,0 +1,146 @@
+"""The .agents/skills.lock file written by bootstrap.
+
+The lock records where skills came from (repo URL or path, ref and
+resolved commit), the install mode, and the size and SHA-256 of every
+installed file. Three things use it:
+
+- `bootstrap --verify` re-hashes the installed files and reports drift.
+- A plain rerun is a no-op when the lock already pins the same commit,
+  mode and skills and the installed files are still present at the
+  recorded sizes. Only files are stat'ed; nothing is read or copied.
+- `bootstrap --frozen` installs exactly the skills and commit the lock
+  pins, after checking the source files against the recorded hashes.
+
+The file is JSON with sorted keys, so it diffs cleanly when committed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+LOCK_VERSION = 1
+LOCK_NAME = "skills.lock"
+
+
+def lock_path(destination_root: Path) -> Path:
+    """Return the lockfile path for a project's .agents/skills directory."""
+    return destination_root.parent / LOCK_NAME
+
+
+def hash_tree(root: Path) -> dict[str, dict[str, Any]]:
+    """Return {relpath: {sha256, size}} for every file under root.
+
+    Symlinks are followed, so a symlink-mode install hashes the files it
+    points at.
+    """
+    files: dict[str, dict[str, Any]] = {}
+    for dirpath, dirnames, filenames in os.walk(root, followlinks=True):
+        dirnames.sort()
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            with open(path, "rb") as handle:
+                digest = hashlib.file_digest(handle, "sha256").hexdigest()
+            rel = os.path.relpath(path, root).replace(os.sep, "/")
+            files[rel] = {"sha256": digest, "size": os.stat(path).st_size}
+    return files
+
+
+def build_lock(
+    source: dict[str, Any],
+    mode: str,
+    installed: dict[str, Path],
+) -> dict[str, Any]:
+    """Build lock data for the installed {skill name: path} mapping."""
+    return {
+        "version": LOCK_VERSION,
+        "source": source,
+        "mode": mode,
+        "skills": {
+            name: {"files": hash_tree(path)} for name, path in sorted(installed.items())
+        },
+    }
+
+
+def read_lock(path: Path) -> dict[str, Any] | None:
+    """Load a lockfile, returning None if it is missing.
+
+    Raises RuntimeError if the file exists but cannot be used.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        raise RuntimeError(f"Cannot read {path}: {exc}") from exc
+    if not isinstance(data, dict) or data.get("version") != LOCK_VERSION:
+        raise RuntimeError(f"Unsupported lockfile format: {path}")
+    return data
+
+
+def write_lock(path: Path, lock: dict[str, Any]) -> None:
+    """Atomically write lock data to path."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(
+            json.dumps(lock, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _listed_files(root: Path) -> set[str]:
+    """Return the relative paths of all files under root."""
+    return {
+        os.path.relpath(os.path.join(dirpath, name), root).replace(os.sep, "/")
+        for dirpath, _dirnames, filenames in os.walk(root, followlinks=True)
+        for name in filenames
+    }
+
+
+def verify_tree(root: Path, files: dict[str, dict[str, Any]], deep: bool) -> list[str]:
+    """Compare the files under root with recorded entries.
+
+    With deep=False only presence and sizes are checked; with deep=True
+    every file is re-hashed.
+    """
+    if not root.is_dir():
+        return [f"{root}: missing"]
+    extra = sorted(_listed_files(root) - files.keys())
+    problems = [f"{root / rel}: not in lock" for rel in extra]
+    for rel, expected in sorted(files.items()):
+        path = root / rel
+        try:
+            size = path.stat().st_size
+        except OSError:
+            problems.append(f"{path}: missing")
+            continue
+        if size != expected["size"]:
+            problems.append(f"{path}: size {size} != {expected['size']}")
+        elif deep:
+            with open(path, "rb") as handle:
+                digest = hashlib.file_digest(handle, "sha256").hexdigest()
+            if digest != expected["sha256"]:
+                problems.append(f"{path}: sha256 mismatch")
+    return problems
+
+
+def verify_lock(
+    lock: dict[str, Any],
+    destination_root: Path,
+    deep: bool = True,
+) -> list[str]:
+    """Return a list of problems with the installed skills; empty if clean."""
+    problems: list[str] = []
+    for name, entry in sorted(lock["skills"].items()):
+        target = destination_root / name
+        if lock["mode"] == "symlink" and not target.is_symlink():
+            problems.append(f"{target}: expected a symlink")
+            continue
+        problems.extend(verify_tree(target, entry["files"], deep))
+    return problems
@@ -0,0 +1,84 @@
+"""Projects manifests for `bootstrap --projects-file` and `link --projects-file`.
+
+Two formats are accepted. A plain text file lists one project path per
+line (blank lines and `#` comments are ignored); every project gets the
+skills chosen with --skill or --all. A `.toml` manifest can give each
+project its own skills:
+
+    skills = ["spec", "release"]      # default for projects without a list
+
+    [[projects]]
+    path = "services/api"
+
+    [[projects]]
+    path = "services/web"
+    skills = "all"
+
+Relative paths are resolved against the manifest's directory. This
+module only parses; it imports nothing from bootstrap, so `link` can
+read a manifest without loading the install machinery.
+"""
+
+from __future__ import annotations
+
+import tomllib
+from pathlib import Path
+from typing import Any, NamedTuple
+
+ALL_SKILLS = "all"
+
+
+class ProjectSpec(NamedTuple):
+    """One manifest entry: a project and the skills it asks for, if any."""
+
+    path: Path
+    skills: list[str] | str | None
+
+
+def _toml_skills(value: Any, where: str) -> list[str] | str | None:
+    """Validate a `skills` value from a TOML manifest."""
+    if value is None or value == ALL_SKILLS:
+        return value
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return value
+    raise RuntimeError(f'{where}: skills must be a list of names or "all"')
+
+
+def read_projects_file(path: Path) -> list[ProjectSpec]:
+    """Parse a text or TOML projects manifest."""
+    try:
+        raw = path.read_bytes()
+    except OSError as exc:
+        raise RuntimeError(f"Cannot read projects file: {path} ({exc})") from exc
+    base = path.parent
+
+    if path.suffix != ".toml":
+        specs = []
+        for line in raw.decode("utf-8").splitlines():
+            entry = line.strip()
+            if entry and not entry.startswith("#"):
+                specs.append(ProjectSpec(base / Path(entry).expanduser(), None))
+        return specs
+
+    try:
+        data = tomllib.loads(raw.decode("utf-8"))
+    except tomllib.TOMLDecodeError as exc:
+        raise RuntimeError(f"Invalid TOML in {path}: {exc}") from exc
+    default = _toml_skills(data.get("skills"), str(path))
+    projects = data.get("projects", [])
+    if not isinstance(projects, list):
+        raise RuntimeError(f"{path}: [[projects]] must be an array of tables")
+
+    specs = []
+    for index, project in enumerate(projects):
+        where = f"{path}: projects[{index}]"
+        if not isinstance(project, dict) or not isinstance(project.get("path"), str):
+            raise RuntimeError(f"{where} needs a string 'path'")
+        skills = _toml_skills(project.get("skills"), where)
+        specs.append(
+            ProjectSpec(
+                base / Path(project["path"]).expanduser(),
+                default if skills is None else skills,
+            )
+        )
+    return specs
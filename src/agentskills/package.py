@@ -1,51 +1,102 @@
 #!/usr/bin/env python3
-"""Package a skill directory into a versioned .skill archive."""
+"""Package a skill directory into a versioned .skill archive.
+
+Archives are reproducible: entries are in walk order (each directory's
+files by name, then its subdirectories by name), every entry gets the same
+timestamp (SOURCE_DATE_EPOCH if set, else 1980-01-01), and permissions
+are normalised to 0644, or 0755 for executables. The archive comment
+records a hash of the skill tree, so re-packaging an unchanged skill with
+--overwrite leaves the existing archive untouched.
+
+A .skill archive is a zip. Files that are already compressed (images,
+fonts, media, archives; see STORED_SUFFIXES) are stored as they are, and
+everything else is compressed with the chosen codec: deflate (default),
+bzip2 or lzma. The tar.xz codec instead writes <name>-v<version>.tar.xz,
+a single xz stream over a tar of the skill.
+"""
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import os
 import re
+import shutil
+import stat
 import sys
+import time
+from collections.abc import Iterator
 from pathlib import Path
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import NamedTuple
+from zipfile import (
+    ZIP_BZIP2,
+    ZIP_DEFLATED,
+    ZIP_LZMA,
+    ZIP_STORED,
+    BadZipFile,
+    ZipFile,
+    ZipInfo,
+)
 
-from agentskills import resolve_skill_dir
+from agentskills import SkillCatalog, resolve_skill_dir
+from agentskills.cache import load_catalog
+from agentskills.frontmatter import load_frontmatter
+from agentskills.skillignore import walk_files
+from agentskills.timings import span
 
 SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+(?:-[0-9A-Za-z.-]+)?(?:\+[0-9A-Za-z.-]+)?$")
+TREE_HASH_PREFIX = b"agentskills-tree-sha256="
+TREE_HASH_PAX_KEY = "agentskills.tree-sha256"
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+CHUNK_SIZE = 1 << 20
+
+# Codec name -> zip compression method; tar.xz is not a zip.
+CODECS = {
+    "deflate": ZIP_DEFLATED,
+    "bzip2": ZIP_BZIP2,
+    "lzma": ZIP_LZMA,
+    "tar.xz": None,
+}
+DEFAULT_CODEC = "deflate"
+
+# Already-compressed formats: recompressing them costs CPU and saves nothing.
+STORED_SUFFIXES = frozenset(
+    {
+        ".7z",
+        ".avif",
+        ".br",
+        ".bz2",
+        ".gif",
+        ".gz",
+        ".heic",
+        ".ico",
+        ".jar",
+        ".jpeg",
+        ".jpg",
+        ".m4a",
+        ".mov",
+        ".mp3",
+        ".mp4",
+        ".ogg",
+        ".pdf",
+        ".png",
+        ".skill",
+        ".tgz",
+        ".webm",
+        ".webp",
+        ".woff",
+        ".woff2",
+        ".xz",
+        ".zip",
+        ".zst",
+    }
+)
 
 
 def parse_frontmatter(skill_md: Path) -> tuple[str, str]:
     """Extract name and version from SKILL.md YAML frontmatter."""
-    text = skill_md.read_text(encoding="utf-8")
-    if not text.startswith("---"):
-        raise RuntimeError(f"Missing YAML frontmatter in {skill_md}")
-
-    parts = text.split("---", 2)
-    if len(parts) < 3:
-        raise RuntimeError(f"Invalid YAML frontmatter in {skill_md}")
-
-    frontmatter = parts[1]
-    name: str | None = None
-    version: str | None = None
-    in_metadata = False
-
-    for raw_line in frontmatter.splitlines():
-        line = raw_line.rstrip()
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-
-        indent = len(line) - len(line.lstrip(" "))
-        if indent == 0:
-            in_metadata = stripped == "metadata:"
-            if stripped.startswith("name:"):
-                name = stripped.split(":", 1)[1].strip().strip('"').strip("'")
-            elif stripped.startswith("version:"):
-                version = stripped.split(":", 1)[1].strip().strip('"').strip("'")
-            continue
-
-        if in_metadata and stripped.startswith("version:"):
-            version = stripped.split(":", 1)[1].strip().strip('"').strip("'")
+    frontmatter = load_frontmatter(skill_md)
+    name, version = frontmatter.name, frontmatter.version
 
     if not name:
         raise RuntimeError(f"Frontmatter is missing 'name' in {skill_md}")
@@ -58,50 +109,372 @@ def parse_frontmatter(skill_md: Path) -> tuple[str, str]:
     return name, version
 
 
-def iter_skill_files(skill_dir: Path) -> list[Path]:
-    """List all distributable files in a skill directory."""
-    files: list[Path] = []
-    for path in sorted(skill_dir.rglob("*")):
-        if not path.is_file():
-            continue
-        if "__pycache__" in path.parts:
-            continue
-        if path.name in {".DS_Store"}:
-            continue
-        files.append(path)
-    return files
+def iter_skill_files(skill_dir: Path) -> Iterator[Path]:
+    """Yield the distributable files in a skill directory, in a stable order.
+
+    Directories matched by the default ignores or by the skill's
+    .skillignore are pruned without being listed; see skillignore.
+    """
+    return walk_files(skill_dir)
+
+
+def archive_date_time() -> tuple[int, int, int, int, int, int]:
+    """Return the timestamp for every entry: SOURCE_DATE_EPOCH or 1980-01-01."""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if not epoch:
+        return ZIP_EPOCH
+    try:
+        stamp = time.gmtime(int(epoch))[:6]
+    except ValueError as exc:
+        raise RuntimeError(f"SOURCE_DATE_EPOCH is not an integer: {epoch}") from exc
+    return max(stamp, ZIP_EPOCH)
+
+
+def _is_executable(path: Path) -> bool:
+    """Return True if path has any execute bit set."""
+    return bool(path.stat().st_mode & 0o111)
+
+
+def archive_name(name: str, version: str, codec: str = DEFAULT_CODEC) -> str:
+    """Return the archive file name for a skill version and codec."""
+    suffix = ".tar.xz" if codec == "tar.xz" else ".skill"
+    return f"{name}-v{version}{suffix}"
+
+
+def compression_for(path: Path, codec: str) -> int:
+    """Return the zip method for path: stored if already compressed."""
+    if path.suffix.lower() in STORED_SUFFIXES:
+        return ZIP_STORED
+    return CODECS[codec]
+
+
+def tree_hash(
+    skill_dir: Path,
+    files: list[Path],
+    codec: str = DEFAULT_CODEC,
+    level: int | None = None,
+) -> str:
+    """Hash the archive settings and the paths, exec bits and contents of files.
+
+    The settings are the codec, the level and the entry timestamp, so
+    repackaging with a different SOURCE_DATE_EPOCH rewrites the archive.
+    """
+    digest = hashlib.sha256(f"{codec}:{level}:{archive_date_time()}\0".encode())
+    for file_path in files:
+        rel = file_path.relative_to(skill_dir).as_posix()
+        with open(file_path, "rb") as handle:
+            content = hashlib.file_digest(handle, "sha256").digest()
+        kind = b"x" if _is_executable(file_path) else b"-"
+        digest.update(rel.encode("utf-8") + b"\0" + kind + content)
+    return digest.hexdigest()
+
+
+def read_tree_hash(archive_path: Path) -> str | None:
+    """Return the tree hash recorded in an archive, if any.
+
+    Zips keep it in the archive comment and tar.xz files in a pax header.
+    """
+    if archive_path.name.endswith(".tar.xz"):
+        import tarfile
+
+        try:
+            with tarfile.open(archive_path, "r:xz") as tar:
+                return tar.pax_headers.get(TREE_HASH_PAX_KEY)
+        except (OSError, EOFError, tarfile.TarError):
+            return None
+    try:
+        with ZipFile(archive_path) as zf:
+            comment = zf.comment
+    except (OSError, BadZipFile):
+        return None
+    if not comment.startswith(TREE_HASH_PREFIX):
+        return None
+    return comment[len(TREE_HASH_PREFIX) :].decode("ascii", errors="replace")
+
+
+def _write_zip(  # noqa: PLR0913
+    path: Path,
+    skill_dir: Path,
+    prefix: str,
+    files: list[Path],
+    digest: str,
+    codec: str,
+    level: int | None,
+) -> None:
+    """Write files to a reproducible zip, storing already-compressed ones."""
+    date_time = archive_date_time()
+    with ZipFile(path, mode="w") as zf:
+        for file_path in files:
+            info = ZipInfo(
+                f"{prefix}/{file_path.relative_to(skill_dir).as_posix()}",
+                date_time=date_time,
+            )
+            info.create_system = 3
+            mode = 0o755 if _is_executable(file_path) else 0o644
+            info.external_attr = (stat.S_IFREG | mode) << 16
+            info.compress_type = compression_for(file_path, codec)
+            if level is not None and info.compress_type != ZIP_STORED:
+                # ZipFile.open(info, "w") has no public way to take a level,
+                # so an explicit level goes through writestr, one file at a
+                # time; the default level streams.
+                zf.writestr(info, file_path.read_bytes(), compresslevel=level)
+                continue
+            info.file_size = file_path.stat().st_size
+            with open(file_path, "rb") as src, zf.open(info, "w") as dst:
+                shutil.copyfileobj(src, dst, CHUNK_SIZE)
+        zf.comment = TREE_HASH_PREFIX + digest.encode("ascii")
+
+
+def _write_tar_xz(  # noqa: PLR0913
+    path: Path,
+    skill_dir: Path,
+    prefix: str,
+    files: list[Path],
+    digest: str,
+    level: int | None,
+) -> None:
+    """Write files to a reproducible tar.xz with the tree hash in a pax header."""
+    import calendar
+    import tarfile
+
+    mtime = calendar.timegm(archive_date_time())
+    with tarfile.open(
+        path,
+        "w:xz",
+        preset=6 if level is None else level,
+        format=tarfile.PAX_FORMAT,
+        pax_headers={TREE_HASH_PAX_KEY: digest},
+    ) as tar:
+        for file_path in files:
+            info = tarfile.TarInfo(
+                f"{prefix}/{file_path.relative_to(skill_dir).as_posix()}"
+            )
+            info.size = file_path.stat().st_size
+            info.mtime = mtime
+            info.mode = 0o755 if _is_executable(file_path) else 0o644
+            with open(file_path, "rb") as handle:
+                tar.addfile(info, handle)
+
+
+def write_archive(  # noqa: PLR0913
+    archive_path: Path,
+    skill_dir: Path,
+    prefix: str,
+    files: list[Path],
+    digest: str,
+    codec: str = DEFAULT_CODEC,
+    level: int | None = None,
+) -> None:
+    """Write files under prefix/ to a reproducible archive, atomically."""
+    tmp_path = archive_path.with_name(f"{archive_path.name}.{os.getpid()}.tmp")
+    try:
+        if codec == "tar.xz":
+            _write_tar_xz(tmp_path, skill_dir, prefix, files, digest, level)
+        else:
+            _write_zip(tmp_path, skill_dir, prefix, files, digest, codec, level)
+        os.replace(tmp_path, archive_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class PackageStats(NamedTuple):
+    """Outcome of packaging one skill."""
+
+    archive: Path
+    name: str
+    version: str
+    files: int
+    bytes_in: int
+    bytes_out: int
+    seconds: float
+    unchanged: bool
+
+
+def package_dir(
+    skill_dir: Path,
+    out: Path,
+    overwrite: bool,
+    codec: str = DEFAULT_CODEC,
+    level: int | None = None,
+) -> PackageStats:
+    """Package skill_dir into out and report sizes and time taken."""
+    start = time.perf_counter()
+    frontmatter_name, version = parse_frontmatter(skill_dir / "SKILL.md")
+    out.mkdir(parents=True, exist_ok=True)
+    archive_path = out / archive_name(frontmatter_name, version, codec)
+
+    if archive_path.exists() and not overwrite:
+        raise RuntimeError(
+            f"Package already exists: {archive_path} (use --overwrite to replace)"
+        )
+
+    files = list(iter_skill_files(skill_dir))
+    with span("hash_tree", skill=frontmatter_name, files=len(files)):
+        digest = tree_hash(skill_dir, files, codec, level)
+    unchanged = read_tree_hash(archive_path) == digest
+    if not unchanged:
+        with span("write_archive", skill=frontmatter_name, codec=codec):
+            write_archive(
+                archive_path, skill_dir, frontmatter_name, files, digest, codec, level
+            )
+
+    return PackageStats(
+        archive=archive_path,
+        name=frontmatter_name,
+        version=version,
+        files=len(files),
+        bytes_in=sum(path.stat().st_size for path in files),
+        bytes_out=archive_path.stat().st_size,
+        seconds=time.perf_counter() - start,
+        unchanged=unchanged,
+    )
 
 
-def package_skill(
+def package_skill(  # noqa: PLR0913
     skill_name: str,
     repo_root: Path,
     output_dir: str = "dist",
     overwrite: bool = False,
+    catalog: SkillCatalog | None = None,
+    codec: str = DEFAULT_CODEC,
+    level: int | None = None,
 ) -> tuple[Path, str, str]:
-    """Package a skill and return (archive_path, name, version)."""
-    skill_dir = resolve_skill_dir(repo_root / "skills", skill_name)
-    skill_md = skill_dir / "SKILL.md"
+    """Package a skill and return (archive_path, name, version).
 
-    frontmatter_name, version = parse_frontmatter(skill_md)
-    pkg_name = f"{frontmatter_name}-v{version}.skill"
+    When a catalog is given, the skill is looked up in it instead of
+    probing repo_root/skills on disk. With overwrite, an existing archive
+    whose recorded tree hash matches the skill is left as it is.
+    """
+    if catalog is not None:
+        skill_dir = catalog.resolve(skill_name)
+    else:
+        skill_dir = resolve_skill_dir(repo_root / "skills", skill_name)
     out = (repo_root / output_dir).resolve()
-    out.mkdir(parents=True, exist_ok=True)
-    archive_path = out / pkg_name
+    stats = package_dir(skill_dir, out, overwrite, codec, level)
+    return stats.archive, stats.name, stats.version
 
-    if archive_path.exists() and not overwrite:
-        raise RuntimeError(
-            f"Package already exists: {archive_path} (use --overwrite to replace)"
+
+def package_many(  # noqa: PLR0913
+    skill_names: list[str],
+    catalog: SkillCatalog,
+    out: Path,
+    overwrite: bool,
+    jobs: int,
+    codec: str = DEFAULT_CODEC,
+    level: int | None = None,
+) -> tuple[list[PackageStats], dict[str, str]]:
+    """Package several skills, up to jobs at a time in worker processes.
+
+    Returns the stats of every archive written or found unchanged, and
+    {skill name: error} for the skills that failed.
+    """
+    skill_dirs = {name: catalog.resolve(name) for name in skill_names}
+    results: list[PackageStats] = []
+    errors: dict[str, str] = {}
+    if jobs <= 1 or len(skill_names) <= 1:
+        for name, skill_dir in skill_dirs.items():
+            try:
+                results.append(package_dir(skill_dir, out, overwrite, codec, level))
+            except Exception as exc:
+                errors[name] = str(exc)
+        return results, errors
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(skill_names))) as pool:
+        futures = {
+            name: pool.submit(package_dir, skill_dir, out, overwrite, codec, level)
+            for name, skill_dir in skill_dirs.items()
+        }
+        for name, future in futures.items():
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                errors[name] = str(exc)
+    return results, errors
+
+
+def _format_bytes(size: int) -> str:
+    """Format a byte count as e.g. '12.3 KiB'."""
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KiB"
+    return f"{size / (1024 * 1024):.1f} MiB"
+
+
+def print_summary(
+    results: list[PackageStats],
+    errors: dict[str, str],
+    wall: float,
+) -> None:
+    """Print one line per archive and the totals."""
+    print("archives:")
+    for stats in results:
+        status = " (unchanged)" if stats.unchanged else ""
+        print(
+            f"  - {stats.archive.name}: {stats.files} files, "
+            f"{_format_bytes(stats.bytes_in)} -> {_format_bytes(stats.bytes_out)}, "
+            f"{stats.seconds:.2f}s{status}"
         )
+    for name, error in errors.items():
+        print(f"  ! {name}: {error}")
+    bytes_in = sum(stats.bytes_in for stats in results)
+    bytes_out = sum(stats.bytes_out for stats in results)
+    busy = sum(stats.seconds for stats in results)
+    print(
+        f"done: {len(results)} archives, {_format_bytes(bytes_in)} -> "
+        f"{_format_bytes(bytes_out)}, {wall:.2f}s wall ({busy:.2f}s in workers)"
+    )
+    if errors:
+        print(f"error: {len(errors)} skill(s) failed", file=sys.stderr)
 
-    files = iter_skill_files(skill_dir)
-    with ZipFile(archive_path, mode="w", compression=ZIP_DEFLATED) as zf:
-        for file_path in files:
-            zf.write(
-                file_path,
-                Path(frontmatter_name) / file_path.relative_to(skill_dir),
-            )
 
-    return archive_path, frontmatter_name, version
+def compare_codecs(
+    skill_names: list[str],
+    catalog: SkillCatalog,
+    jobs: int,
+    level: int | None,
+) -> list[tuple[str, list[PackageStats], float]]:
+    """Package skill_names with every codec into a scratch directory.
+
+    Returns (codec, stats, wall seconds) per codec; nothing is kept.
+    """
+    import tempfile
+
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="agentskills-codecs-") as scratch:
+        for codec in CODECS:
+            start = time.perf_counter()
+            with span("compare_codec", codec=codec):
+                results, errors = package_many(
+                    skill_names,
+                    catalog,
+                    Path(scratch) / codec,
+                    False,
+                    jobs,
+                    codec,
+                    level,
+                )
+            if errors:
+                name, error = next(iter(errors.items()))
+                raise RuntimeError(f"{codec}: {name}: {error}")
+            rows.append((codec, results, time.perf_counter() - start))
+    return rows
+
+
+def print_codec_report(rows: list[tuple[str, list[PackageStats], float]]) -> None:
+    """Print bytes out, ratio and time for each codec."""
+    print(f"{'codec':<8} {'bytes in':>10} {'bytes out':>10} {'ratio':>6} {'wall':>7}")
+    for codec, results, wall in rows:
+        bytes_in = sum(stats.bytes_in for stats in results)
+        bytes_out = sum(stats.bytes_out for stats in results)
+        ratio = bytes_out / bytes_in if bytes_in else 0.0
+        print(
+            f"{codec:<8} {_format_bytes(bytes_in):>10} "
+            f"{_format_bytes(bytes_out):>10} {ratio:>6.1%} {wall:>6.2f}s"
+        )
 
 
 def parse_args() -> argparse.Namespace:
@@ -109,7 +482,51 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Package a skill into a .skill archive.",
     )
-    parser.add_argument("skill", help="Skill name under skills/<skill>.")
+    parser.add_argument(
+        "skill",
+        nargs="?",
+        help="Skill name under skills/<skill>.",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        dest="package_all",
+        help="Package every skill in the repo.",
+    )
+    parser.add_argument(
+        "--skills",
+        action="append",
+        default=[],
+        help="Skill names to package. Repeat or comma-separate.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Skills to compress in parallel with --all/--skills (default: CPU count).",
+    )
+    parser.add_argument(
+        "--codec",
+        choices=list(CODECS),
+        default=DEFAULT_CODEC,
+        help="Compression for files that are not already compressed "
+        "(default: deflate). tar.xz writes <name>-v<version>.tar.xz instead of "
+        "a .skill zip; it is for distribution only and cannot be installed with "
+        "bootstrap --from-archive.",
+    )
+    parser.add_argument(
+        "--level",
+        type=int,
+        choices=range(10),
+        metavar="0-9",
+        help="Compression level for deflate, bzip2 (1-9) and tar.xz; lzma ignores it.",
+    )
+    parser.add_argument(
+        "--codec-report",
+        action="store_true",
+        help="Package the selected skills with every codec into a scratch "
+        "directory and print sizes and times; nothing is written.",
+    )
     parser.add_argument(
         "--repo-root",
         default=str(Path.cwd()),
@@ -128,16 +545,68 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def package_selected(args: argparse.Namespace, repo_root: Path) -> int:
+    """Package --all or --skills with a process pool and print a summary.
+
+    With --codec-report, compare the codecs on them instead.
+    """
+    catalog = load_catalog(repo_root / "skills")
+    if args.package_all:
+        names = catalog.names
+    elif args.skill:
+        names = [args.skill]
+    else:
+        names = [
+            name.strip()
+            for raw in args.skills
+            for name in raw.split(",")
+            if name.strip()
+        ]
+        names = list(dict.fromkeys(names))
+    if not names:
+        raise RuntimeError(f"No skills found under: {repo_root / 'skills'}")
+    unknown = [name for name in names if name not in catalog]
+    if unknown:
+        raise RuntimeError(f"Unknown skill(s): {', '.join(unknown)}")
+
+    if args.codec_report:
+        print_codec_report(compare_codecs(names, catalog, args.jobs, args.level))
+        return 0
+
+    start = time.perf_counter()
+    with span("package_many", skills=len(names), jobs=args.jobs):
+        results, errors = package_many(
+            names,
+            catalog,
+            (repo_root / args.output_dir).resolve(),
+            args.overwrite,
+            args.jobs,
+            args.codec,
+            args.level,
+        )
+    print_summary(results, errors, time.perf_counter() - start)
+    return 1 if errors else 0
+
+
 def main() -> int:
-    """Package a skill into a distributable archive."""
+    """Package one skill, or several in parallel, into distributable archives."""
     try:
         args = parse_args()
         repo_root = Path(args.repo_root).expanduser().resolve()
+        selections = bool(args.skill) + args.package_all + bool(args.skills)
+        if selections != 1:
+            raise RuntimeError("Give one skill, --all, or --skills a,b,c.")
+        if args.codec == "bzip2" and args.level == 0:
+            raise RuntimeError("bzip2 levels are 1-9.")
+        if not args.skill or args.codec_report:
+            return package_selected(args, repo_root)
         archive_path, name, version = package_skill(
             skill_name=args.skill,
             repo_root=repo_root,
             output_dir=args.output_dir,
             overwrite=args.overwrite,
+            codec=args.codec,
+            level=args.level,
         )
         print(f"skill: {name}")
         print(f"version: {version}")
@@ -0,0 +1,203 @@
+"""Reconcile harness links across many projects (`link` with several projects).
+
+Projects come from repeated --project, from --root (every directory with
+.agents/skills below it) or from a --projects-file manifest. The desired
+link for every selected adapter in every project is planned up front by
+reading the current state with lstat/readlink only. Projects that need
+changes are then fixed on a thread pool, and links that are already right
+are never touched. With --dry-run the plan is printed as JSON and nothing
+is written.
+
+Each planned link gets one of these actions:
+
+- ok: already a symlink to the canonical directory
+- create: nothing at the link path yet
+- replace: a different symlink or a real path; needs --force
+- conflict: like replace, but --force was not given; nothing is changed
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from agentskills.link import load_config, remove_path, select_harnesses
+from agentskills.manifest import read_projects_file
+from agentskills.timings import span
+
+# Directories never searched for projects under --root.
+SKIP_DIRS = frozenset({"node_modules", "__pycache__", "venv", "dist", "build"})
+
+
+def discover_projects(root: Path, canonical_rel: str) -> list[Path]:
+    """Return every directory under root (inclusive) holding canonical_rel.
+
+    Hidden directories and SKIP_DIRS are not searched, and the search
+    does not descend into a project once one is found.
+    """
+    found: list[Path] = []
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        if os.path.isdir(os.path.join(current, canonical_rel)):
+            found.append(Path(current))
+            continue
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if (
+                        not entry.name.startswith(".")
+                        and entry.name not in SKIP_DIRS
+                        and entry.is_dir(follow_symlinks=False)
+                    ):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return sorted(found)
+
+
+def collect_projects(args: argparse.Namespace, canonical_rel: str) -> list[Path]:
+    """Gather project roots from --project, --root and --projects-file."""
+    projects = [Path(raw).expanduser().resolve() for raw in args.project]
+    for raw in args.root:
+        root = Path(raw).expanduser().resolve()
+        if not root.is_dir():
+            raise RuntimeError(f"Root is not a directory: {root}")
+        with span("discover_projects", root=root.name):
+            projects += discover_projects(root, canonical_rel)
+    if args.projects_file:
+        manifest = Path(args.projects_file).expanduser().resolve()
+        projects += [spec.path.resolve() for spec in read_projects_file(manifest)]
+    return list(dict.fromkeys(projects))
+
+
+def _plan_link(link_path: Path, target: str, force: bool) -> dict[str, Any]:
+    """Plan one link from its current state."""
+    step: dict[str, Any] = {"path": str(link_path), "target": target}
+    if os.path.islink(link_path):
+        current = os.readlink(link_path)
+        if current == target:
+            step["action"] = "ok"
+            return step
+        step["current"] = f"symlink -> {current}"
+    elif os.path.lexists(link_path):
+        step["current"] = "directory" if link_path.is_dir() else "file"
+    else:
+        step["action"] = "create"
+        return step
+    step["action"] = "replace" if force else "conflict"
+    return step
+
+
+def plan_project(
+    project_root: Path,
+    canonical_rel: str,
+    adapters: dict,
+    harness_names: list[str],
+    force: bool,
+) -> dict[str, Any]:
+    """Compute the link actions one project needs, without changing it."""
+    canonical_dir = project_root / canonical_rel
+    plan: dict[str, Any] = {"project": str(project_root), "links": {}}
+    if not canonical_dir.is_dir():
+        plan["error"] = f"Canonical skills directory is missing: {canonical_dir}"
+        return plan
+    for name in harness_names:
+        link_path = project_root / adapters[name]["relative_link_path"]
+        target = os.path.relpath(canonical_dir, link_path.parent)
+        plan["links"][name] = _plan_link(link_path, target, force)
+    return plan
+
+
+def apply_project(plan: dict[str, Any]) -> dict[str, Any]:
+    """Carry out a project's create and replace actions; record any error."""
+    try:
+        with span("reconcile_project", project=os.path.basename(plan["project"])):
+            for step in plan["links"].values():
+                if step["action"] not in ("create", "replace"):
+                    continue
+                link_path = Path(step["path"])
+                if step["action"] == "replace":
+                    remove_path(link_path)
+                link_path.parent.mkdir(parents=True, exist_ok=True)
+                link_path.symlink_to(step["target"], target_is_directory=True)
+                step["done"] = True
+    except OSError as exc:
+        plan["error"] = str(exc)
+    return plan
+
+
+def summarize(plans: list[dict[str, Any]]) -> dict[str, int]:
+    """Count links per action, plus projects with errors."""
+    counts = dict.fromkeys(("ok", "create", "replace", "conflict"), 0)
+    for plan in plans:
+        for step in plan["links"].values():
+            counts[step["action"]] += 1
+    counts["errors"] = sum("error" in plan for plan in plans)
+    return counts
+
+
+def reconcile(args: argparse.Namespace) -> int:
+    """Plan harness links for every project, then apply the differences."""
+    canonical_rel, adapters = load_config(Path(args.config).expanduser().resolve())
+    harness_names = select_harnesses(adapters, args.harness)
+    projects = collect_projects(args, canonical_rel)
+    if not projects:
+        raise RuntimeError("No projects with .agents/skills found.")
+
+    with span("plan_links", projects=len(projects)):
+        plans = [
+            plan_project(root, canonical_rel, adapters, harness_names, args.force)
+            for root in projects
+        ]
+    summary = summarize(plans)
+
+    if args.dry_run:
+        document = {
+            "canonical": canonical_rel,
+            "harnesses": harness_names,
+            "projects": plans,
+            "summary": summary,
+        }
+        print(json.dumps(document, indent=2))
+        return 0 if not summary["conflict"] and not summary["errors"] else 1
+
+    pending = [
+        plan
+        for plan in plans
+        if "error" not in plan
+        and any(
+            step["action"] in ("create", "replace") for step in plan["links"].values()
+        )
+    ]
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        list(pool.map(apply_project, pending))
+    summary = summarize(plans)
+
+    for plan in plans:
+        if "error" in plan:
+            print(f"  ! {plan['project']}: {plan['error']}")
+        for name, step in plan["links"].items():
+            if step["action"] == "conflict":
+                print(
+                    f"  ! {plan['project']}: {name} has {step['current']} at "
+                    f"{step['path']} (use --force to replace)"
+                )
+            elif step.get("done"):
+                print(
+                    f"  {step['action']}: {name} ({step['path']} -> {step['target']})"
+                )
+    print(
+        f"done: {len(plans)} projects, {summary['create']} created, "
+        f"{summary['replace']} replaced, {summary['ok']} unchanged"
+    )
+    failed = summary["conflict"] + summary["errors"]
+    if failed:
+        print(f"error: {failed} conflict(s) or error(s)", file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,104 @@
+"""Copy-on-write file cloning backing `bootstrap --mode reflink`.
+
+Each file is cloned with the Linux FICLONE ioctl where the filesystem
+supports it (btrfs, XFS, bcachefs, overlayfs on those), which shares
+extents until either side is written. Otherwise os.copy_file_range does
+an in-kernel copy, and as a last resort shutil.copyfile copies through
+userspace. A method that fails as unsupported is not tried again by the
+same Cloner, so a tree on tmpfs pays for the probe once.
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+FICLONE = 0x40049409
+METHODS = ("ficlone", "copy_file_range", "copy")
+
+# Errors meaning "this method is not available for these files".
+_UNSUPPORTED_ERRNOS = {
+    errno.EBADF,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    errno.EPERM,
+    errno.EXDEV,
+}
+
+
+def _ficlone(src_fd: int, dst_fd: int, size: int) -> None:
+    """Clone src_fd into dst_fd with the FICLONE ioctl."""
+    fcntl.ioctl(dst_fd, FICLONE, src_fd)
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, size: int) -> None:
+    """Copy size bytes from src_fd to dst_fd inside the kernel."""
+    copied = 0
+    while copied < size:
+        written = os.copy_file_range(src_fd, dst_fd, size - copied)
+        if written == 0:
+            break
+        copied += written
+
+
+class Cloner:
+    """Clones files and counts which method each one took."""
+
+    def __init__(self) -> None:
+        """Start with every method available on this platform enabled."""
+        self.methods = Counter[str]()
+        self._disabled: set[str] = set()
+        if fcntl is None or not sys.platform.startswith("linux"):
+            self._disabled.add("ficlone")
+        if not hasattr(os, "copy_file_range"):
+            self._disabled.add("copy_file_range")
+        self._lock = threading.Lock()
+
+    def clone_file(self, src: str | Path, dst: str | Path) -> str:
+        """Clone src to dst with its permissions and times; return the method."""
+        method = self._clone_data(src, dst)
+        shutil.copystat(src, dst)
+        with self._lock:
+            self.methods[method] += 1
+        return method
+
+    def _clone_data(self, src: str | Path, dst: str | Path) -> str:
+        """Write src's content to dst using the first method that works."""
+        attempts = (("ficlone", _ficlone), ("copy_file_range", _copy_file_range))
+        for method, fn in attempts:
+            if method in self._disabled:
+                continue
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                try:
+                    fn(fsrc.fileno(), fdst.fileno(), os.fstat(fsrc.fileno()).st_size)
+                    return method
+                except OSError as exc:
+                    if exc.errno not in _UNSUPPORTED_ERRNOS:
+                        raise
+            self._disabled.add(method)
+        shutil.copyfile(src, dst)
+        return "copy"
+
+    def clone_tree(self, source: Path, destination: Path) -> None:
+        """Recreate source at destination, cloning every file."""
+        shutil.copytree(source, destination, copy_function=self.clone_file)
+
+    def summary(self) -> str:
+        """Return e.g. 'ficlone=12 copy=1' in METHODS order."""
+        return " ".join(
+            f"{method}={self.methods[method]}"
+            for method in METHODS
+            if self.methods[method]
+        )
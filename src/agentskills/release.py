@@ -4,16 +4,18 @@
 from __future__ import annotations
 
 import argparse
-import subprocess
 import sys
 from pathlib import Path
 
 from agentskills import resolve_skill_dir
 from agentskills.package import package_skill
+from agentskills.timings import span
 
 
 def run_command(cmd: list[str], cwd: Path) -> None:
     """Run a shell command, raising on non-zero exit."""
+    import subprocess
+
     result = subprocess.run(cmd, cwd=str(cwd), check=False)
     if result.returncode != 0:
         joined = " ".join(cmd)
@@ -60,17 +62,18 @@ def main() -> int:
 
         if not args.skip_validate:
             print(f"validate: {skill_dir}")
-            run_command(
-                [
-                    "uvx",
-                    "--from",
-                    "skills-ref",
-                    "agentskills",
-                    "validate",
-                    str(skill_dir),
-                ],
-                cwd=repo_root,
-            )
+            with span("validate", skill=args.skill):
+                run_command(
+                    [
+                        "uvx",
+                        "--from",
+                        "skills-ref",
+                        "agentskills",
+                        "validate",
+                        str(skill_dir),
+                    ],
+                    cwd=repo_root,
+                )
         else:
             print("validate: skipped")
 
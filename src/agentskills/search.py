@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+"""Full-text search over skills, backed by a persisted inverted index.
+
+Each SKILL.md and every ``references/*.md`` file of a skill is one
+document. The index lives in an SQLite database under the agentskills
+cache directory and is refreshed incrementally: only files whose mtime
+or size changed since the last refresh are re-read and re-tokenized.
+Before a query, the index is checked with stats only: the mtimes of
+skills/, skills/curated/, every skill directory and its references/
+directory (which change when a document is added or removed), and the
+size and mtime of every indexed document. The write transaction of a
+refresh is only taken when one of those changed.
+Results are ranked with Okapi BM25; SKILL.md name and description terms
+are counted FIELD_BOOST times so frontmatter matches rank first.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import math
+import os
+import re
+import sqlite3
+import sys
+import time
+from collections import Counter
+from collections.abc import Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+from agentskills import CURATED_DIR, REPO_ROOT, SkillCatalog, cache_root
+from agentskills.cache import RACY_WINDOW_NS, dir_mtime_ns, load_catalog, root_digest
+from agentskills.frontmatter import parse_frontmatter_text
+
+SCHEMA_VERSION = 2
+REFERENCES_DIR = "references"
+FIELD_BOOST = 3
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    {
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "has",
+        "in",
+        "is",
+        "it",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "this",
+        "to",
+        "was",
+        "were",
+        "will",
+        "with",
+    }
+)
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+CREATE TABLE docs (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    skill TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE TABLE postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX postings_doc ON postings (doc_id);
+CREATE TABLE dirs (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL) WITHOUT ROWID;
+"""
+
+
+class SearchHit(NamedTuple):
+    """A ranked search result."""
+
+    score: float
+    skill: str
+    kind: str
+    path: str
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric terms, dropping stopwords."""
+    return [
+        token
+        for token in TOKEN_RE.findall(text.lower())
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+def index_path(skills_root: Path) -> Path:
+    """Return the search index path for a skills root."""
+    return cache_root() / "search" / f"{root_digest(skills_root)}.sqlite"
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    """Connect to the index database in WAL mode."""
+    conn = sqlite3.connect(path, timeout=30)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    except sqlite3.DatabaseError:
+        conn.close()
+        raise
+    return conn
+
+
+def _schema_version(conn: sqlite3.Connection) -> tuple[int] | None:
+    """Return the stored schema version row, or None if there is no schema."""
+    try:
+        return conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+    except sqlite3.OperationalError as exc:
+        if "no such table" in str(exc):
+            return None
+        raise
+
+
+def open_index(skills_root: Path) -> sqlite3.Connection:
+    """Open (creating or rebuilding on schema change) the index database.
+
+    A file that is corrupt or not an SQLite database at all is deleted and
+    rebuilt; the index only caches what is on disk.
+    """
+    path = index_path(skills_root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn: sqlite3.Connection | None = None
+    try:
+        conn = _connect(path)
+        row = _schema_version(conn)
+    except sqlite3.OperationalError:
+        raise
+    except sqlite3.DatabaseError:
+        if conn is not None:
+            conn.close()
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{path}{suffix}").unlink(missing_ok=True)
+        conn = _connect(path)
+        row = None
+    if row is None or row[0] != SCHEMA_VERSION:
+        conn.execute("BEGIN IMMEDIATE")
+        with conn:
+            # Another process may have built the schema while we waited.
+            row = _schema_version(conn)
+            if row is None or row[0] != SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS postings")
+                conn.execute("DROP TABLE IF EXISTS docs")
+                conn.execute("DROP TABLE IF EXISTS meta")
+                conn.execute("DROP TABLE IF EXISTS dirs")
+                for statement in SCHEMA.split(";"):
+                    if statement.strip():
+                        conn.execute(statement)
+                conn.executemany(
+                    "INSERT INTO meta (key, value) VALUES (?, ?)",
+                    [
+                        ("schema", SCHEMA_VERSION),
+                        ("doc_count", 0),
+                        ("total_length", 0),
+                    ],
+                )
+    return conn
+
+
+def _iter_documents(
+    catalog: SkillCatalog,
+) -> Iterator[tuple[str, str, str, Path, os.stat_result]]:
+    """Yield (relpath, skill, kind, path, stat) for every indexable file."""
+    root = catalog.skills_root
+    for entry in catalog:
+        skill_md = entry.path / "SKILL.md"
+        try:
+            yield (
+                os.path.relpath(skill_md, root),
+                entry.name,
+                "skill",
+                skill_md,
+                skill_md.stat(),
+            )
+        except OSError:
+            continue
+
+        try:
+            with os.scandir(entry.path / REFERENCES_DIR) as it:
+                refs = sorted(
+                    (e for e in it if e.name.endswith(".md") and e.is_file()),
+                    key=lambda e: e.name,
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        for ref in refs:
+            path = Path(ref.path)
+            try:
+                yield (
+                    os.path.relpath(path, root),
+                    entry.name,
+                    "reference",
+                    path,
+                    ref.stat(),
+                )
+            except OSError:
+                continue
+
+
+def _document_terms(path: Path, kind: str) -> Counter[str]:
+    """Read and tokenize a document, boosting SKILL.md frontmatter fields."""
+    text = path.read_text(encoding="utf-8", errors="replace")
+    terms = Counter(tokenize(text))
+    if kind == "skill":
+        frontmatter = parse_frontmatter_text(text) or {}
+        for field in ("name", "description"):
+            value = frontmatter.get(field)
+            if isinstance(value, str):
+                for term in tokenize(value):
+                    terms[term] += FIELD_BOOST - 1
+    return terms
+
+
+def _remove_doc(conn: sqlite3.Connection, doc_id: int, length: int) -> None:
+    """Delete a document and its postings, updating corpus totals."""
+    conn.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+    conn.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+    conn.execute(
+        "UPDATE meta SET value = value - 1 WHERE key = 'doc_count'",
+    )
+    conn.execute(
+        "UPDATE meta SET value = value - ? WHERE key = 'total_length'",
+        (length,),
+    )
+
+
+def _dir_stamps(catalog: SkillCatalog, now_ns: int) -> dict[str, int]:
+    """Return {relpath: mtime_ns} for the directories whose listing is indexed.
+
+    These are skills/, skills/curated/, every skill directory and its
+    references/ directory; their mtimes change when a skill or document is
+    added, removed or renamed. A missing directory is stored as -1, and
+    one modified within the racy window as -2, which never matches.
+    """
+    root = catalog.skills_root
+    paths = [root, root / CURATED_DIR]
+    for entry in catalog:
+        paths += [entry.path, entry.path / REFERENCES_DIR]
+    stamps: dict[str, int] = {}
+    for path in paths:
+        mtime_ns = dir_mtime_ns(path)
+        if mtime_ns is None:
+            mtime_ns = -1
+        elif now_ns - mtime_ns < RACY_WINDOW_NS:
+            mtime_ns = -2
+        stamps[os.path.relpath(path, root)] = mtime_ns
+    return stamps
+
+
+def index_is_current(conn: sqlite3.Connection, skills_root: Path) -> bool:
+    """Return True if nothing indexed changed on disk since the last refresh.
+
+    Only stats are taken: one per tracked directory, to notice added or
+    removed skills and documents, and one per indexed document, to notice
+    edits. No file is read and no write lock is taken.
+    """
+    dirs = conn.execute("SELECT path, mtime_ns FROM dirs").fetchall()
+    if not dirs:
+        return False
+    for relpath, mtime_ns in dirs:
+        current = dir_mtime_ns(skills_root / relpath)
+        if (-1 if current is None else current) != mtime_ns:
+            return False
+    for relpath, mtime_ns, size in conn.execute(
+        "SELECT path, mtime_ns, size FROM docs"
+    ):
+        try:
+            st = os.stat(skills_root / relpath)
+        except OSError:
+            return False
+        if (st.st_mtime_ns, st.st_size) != (mtime_ns, size):
+            return False
+    return True
+
+
+def refresh_index(conn: sqlite3.Connection, catalog: SkillCatalog) -> int:
+    """Bring the index in line with the files on disk.
+
+    Returns the number of documents that were added, updated or removed.
+    Files modified within the timestamp-granularity window are stored
+    with an invalid mtime so they are re-checked on the next refresh.
+    """
+    now_ns = time.time_ns()
+    # Stamp the directories before listing them, so a document added
+    # while we scan leaves a stale stamp rather than a missed file.
+    stamps = _dir_stamps(catalog, now_ns)
+    changed = 0
+    # Take the write lock before reading, so a concurrent refresh cannot
+    # insert the same new document between our read and our writes.
+    conn.execute("BEGIN IMMEDIATE")
+    with conn:
+        existing = {
+            path: (doc_id, mtime_ns, size, length)
+            for doc_id, path, mtime_ns, size, length in conn.execute(
+                "SELECT id, path, mtime_ns, size, length FROM docs"
+            )
+        }
+        for relpath, skill, kind, path, st in _iter_documents(catalog):
+            previous = existing.pop(relpath, None)
+            if previous and previous[1:3] == (st.st_mtime_ns, st.st_size):
+                continue
+            try:
+                terms = _document_terms(path, kind)
+            except OSError:
+                continue
+            if previous:
+                _remove_doc(conn, previous[0], previous[3])
+
+            length = sum(terms.values())
+            mtime_ns = st.st_mtime_ns
+            if now_ns - mtime_ns < RACY_WINDOW_NS:
+                mtime_ns = -1
+            cursor = conn.execute(
+                "INSERT INTO docs (path, skill, kind, mtime_ns, size, length)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (relpath, skill, kind, mtime_ns, st.st_size, length),
+            )
+            conn.executemany(
+                "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+                [(term, cursor.lastrowid, tf) for term, tf in terms.items()],
+            )
+            conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'doc_count'")
+            conn.execute(
+                "UPDATE meta SET value = value + ? WHERE key = 'total_length'",
+                (length,),
+            )
+            changed += 1
+
+        for doc_id, _mtime_ns, _size, length in existing.values():
+            _remove_doc(conn, doc_id, length)
+            changed += 1
+
+        conn.execute("DELETE FROM dirs")
+        conn.executemany(
+            "INSERT INTO dirs (path, mtime_ns) VALUES (?, ?)", stamps.items()
+        )
+    return changed
+
+
+def search_index(
+    conn: sqlite3.Connection,
+    query: str,
+    limit: int = 10,
+) -> list[SearchHit]:
+    """Return the top documents for query, ranked by BM25."""
+    meta = dict(conn.execute("SELECT key, value FROM meta"))
+    doc_count = meta.get("doc_count", 0)
+    if not doc_count:
+        return []
+    avg_length = meta.get("total_length", 0) / doc_count or 1.0
+
+    scores: dict[int, float] = {}
+    for term in dict.fromkeys(tokenize(query)):
+        rows = conn.execute(
+            "SELECT p.doc_id, p.tf, d.length FROM postings p"
+            " JOIN docs d ON d.id = p.doc_id WHERE p.term = ?",
+            (term,),
+        ).fetchall()
+        if not rows:
+            continue
+        df = len(rows)
+        idf = math.log((doc_count - df + 0.5) / (df + 0.5) + 1.0)
+        for doc_id, tf, length in rows:
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+            scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (BM25_K1 + 1) / (
+                tf + norm
+            )
+
+    top = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+    hits: list[SearchHit] = []
+    for doc_id, score in top:
+        skill, kind, path = conn.execute(
+            "SELECT skill, kind, path FROM docs WHERE id = ?", (doc_id,)
+        ).fetchone()
+        hits.append(SearchHit(score, skill, kind, path))
+    return hits
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse CLI arguments for the search command."""
+    parser = argparse.ArgumentParser(
+        description="Search skills and their reference docs by keyword.",
+    )
+    parser.add_argument("query", nargs="+", help="Search terms.")
+    parser.add_argument(
+        "--repo-path",
+        help="Use a local repo path instead of the current directory.",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=10,
+        help="Maximum number of results (default: 10).",
+    )
+    parser.add_argument(
+        "--skills-only",
+        action="store_true",
+        help="Collapse results to the best-matching document per skill.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print results as a JSON array.",
+    )
+    refresh = parser.add_mutually_exclusive_group()
+    refresh.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Refresh the index even if no change was detected.",
+    )
+    refresh.add_argument(
+        "--no-refresh",
+        action="store_true",
+        help="Query the existing index without checking for changes at all.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Search the skills index and print ranked results."""
+    try:
+        args = parse_args()
+        if args.repo_path:
+            skills_root = Path(args.repo_path).expanduser().resolve() / "skills"
+        else:
+            skills_root = REPO_ROOT / "skills"
+
+        conn = open_index(skills_root)
+        try:
+            if args.refresh or (
+                not args.no_refresh and not index_is_current(conn, skills_root)
+            ):
+                refresh_index(conn, load_catalog(skills_root))
+            query = " ".join(args.query)
+            fetch = args.limit * 20 if args.skills_only else args.limit
+            hits = search_index(conn, query, limit=fetch)
+        finally:
+            conn.close()
+
+        if args.skills_only:
+            best: dict[str, SearchHit] = {}
+            for hit in hits:
+                best.setdefault(hit.skill, hit)
+            hits = list(best.values())[: args.limit]
+
+        if args.json:
+            print(
+                json.dumps(
+                    [
+                        {
+                            "score": round(hit.score, 4),
+                            "skill": hit.skill,
+                            "kind": hit.kind,
+                            "path": hit.path,
+                        }
+                        for hit in hits
+                    ],
+                    indent=2,
+                )
+            )
+        else:
+            if not hits:
+                print(f"No matches for: {query}")
+            for hit in hits:
+                print(f"{hit.score:7.3f}  {hit.skill}  {hit.path}")
+        return 0 if hits else 1
+    except Exception as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
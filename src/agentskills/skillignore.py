@@ -0,0 +1,153 @@
+"""Gitignore-style `.skillignore` rules and the walker that applies them.
+
+A skill may keep a `.skillignore` at its root to leave files out of
+packages. The syntax follows .gitignore:
+
+- blank lines and lines starting with `#` are skipped
+- `!pattern` re-includes what an earlier pattern excluded
+- a trailing `/` matches directories only
+- a pattern with a `/` anywhere but the end is anchored at the skill root;
+  otherwise it matches a name at any depth
+- `*`, `?` and `[...]` do not match `/`; `**` matches across directories
+
+DEFAULT_IGNORES are applied first, so a `.skillignore` can re-include
+them with `!`. As in git, a file inside an ignored directory cannot be
+re-included: the walker never descends into it.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+IGNORE_FILE = ".skillignore"
+DEFAULT_IGNORES = (
+    ".DS_Store",
+    ".git/",
+    ".venv/",
+    "__pycache__/",
+    "node_modules/",
+    IGNORE_FILE,
+)
+
+
+class Rule(NamedTuple):
+    """One compiled ignore pattern."""
+
+    regex: re.Pattern[str]
+    negate: bool
+    dir_only: bool
+
+
+def _translate(pattern: str) -> str:
+    """Translate the glob part of a pattern to a regex body."""
+    out: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "[" and (end := pattern.find("]", i + 2)) != -1:
+            body = pattern[i + 1 : end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"(?!/)[{body}]")
+            i = end + 1
+            continue
+        elif char == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return "".join(out)
+
+
+def compile_rule(line: str) -> Rule | None:
+    """Compile one .skillignore line, or return None for blanks and comments."""
+    pattern = line.rstrip("\n").rstrip()
+    if not pattern or pattern.startswith("#"):
+        return None
+    negate = pattern.startswith("!")
+    if negate:
+        pattern = pattern[1:]
+    dir_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    if not pattern:
+        return None
+    anchored = "/" in pattern
+    pattern = pattern.removeprefix("/")
+    prefix = "" if anchored else "(?:.*/)?"
+    return Rule(re.compile(prefix + _translate(pattern)), negate, dir_only)
+
+
+class IgnoreRules:
+    """Ordered ignore rules; the last matching rule decides."""
+
+    def __init__(self, lines: list[str]) -> None:
+        """Compile DEFAULT_IGNORES followed by lines."""
+        self.rules = [
+            rule
+            for line in (*DEFAULT_IGNORES, *lines)
+            if (rule := compile_rule(line)) is not None
+        ]
+
+    @classmethod
+    def for_skill(cls, skill_dir: Path) -> IgnoreRules:
+        """Load skill_dir/.skillignore if there is one."""
+        try:
+            text = (skill_dir / IGNORE_FILE).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return cls([])
+        return cls(text.splitlines())
+
+    def ignored(self, rel: str, is_dir: bool) -> bool:
+        """Return True if the skill-relative posix path rel is ignored."""
+        result = False
+        for rule in self.rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.fullmatch(rel):
+                result = not rule.negate
+        return result
+
+
+def walk_files(skill_dir: Path, rules: IgnoreRules | None = None) -> Iterator[Path]:
+    """Yield the files under skill_dir that are not ignored.
+
+    Each directory is listed once with os.scandir and its entries are
+    visited in name order, depth first, so the output order is stable
+    without sorting the whole tree. Ignored directories are pruned before
+    they are opened; symlinked directories are not followed.
+    """
+    if rules is None:
+        rules = IgnoreRules.for_skill(skill_dir)
+    stack: list[tuple[str, str]] = [(os.fspath(skill_dir), "")]
+    while stack:
+        path, rel_dir = stack.pop()
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        subdirs: list[tuple[str, str]] = []
+        for entry in entries:
+            rel = f"{rel_dir}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                if not rules.ignored(rel, is_dir=True):
+                    subdirs.append((entry.path, f"{rel}/"))
+            elif entry.is_file() and not rules.ignored(rel, is_dir=False):
+                yield Path(entry.path)
+        # Files of this directory come first, then each subdirectory in order.
+        stack.extend(reversed(subdirs))
@@ -0,0 +1,139 @@
+"""Install from several skill repos at once (`bootstrap --source`).
+
+Each --source is a git URL (optionally `URL#ref`) or a local repo path.
+All sources are fetched or opened in parallel, so resolving them takes
+about as long as the slowest one, and their catalogs are merged into one.
+Precedence follows the order the sources were given: a skill in an
+earlier source shadows a skill with the same name in a later one, the
+same way own skills shadow curated ones within a single repo.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from agentskills import SkillCatalog
+from agentskills.bootstrap import (
+    clone_or_update_repo,
+    describe_source,
+    repo_cache_name,
+    sparse_skill_paths,
+)
+from agentskills.cache import load_catalog
+from agentskills.timings import span
+
+URL_PREFIXES = ("https://", "http://", "ssh://", "git://", "file://")
+# scp-like syntax, [user@]host:path, as git recognises it: no "/" before the
+# colon, and a bare single letter is a Windows drive (C:\...), not a host.
+SCP_URL_RE = re.compile(r"^(?:[\w.-]+@[\w.-]+|[\w.-]{2,}):")
+
+
+class Source(NamedTuple):
+    """One --source: a git URL and ref, or a local repo path."""
+
+    url: str | None
+    ref: str | None
+    path: Path | None
+
+    @property
+    def label(self) -> str:
+        """Return the source as the user would write it."""
+        return f"{self.url}#{self.ref}" if self.url else str(self.path)
+
+
+def parse_source(spec: str, default_ref: str) -> Source:
+    """Parse URL, URL#ref or a local path into a Source."""
+    if spec.startswith(URL_PREFIXES) or SCP_URL_RE.match(spec):
+        url, _, ref = spec.partition("#")
+        return Source(url, ref or default_ref, None)
+    path = Path(spec).expanduser().resolve()
+    if not path.exists():
+        raise RuntimeError(f"Source path does not exist: {path}")
+    return Source(None, None, path)
+
+
+def parse_sources(specs: list[str], default_ref: str) -> list[Source]:
+    """Parse --source values, rejecting duplicates and cache name clashes."""
+    sources: list[Source] = []
+    cache_names: dict[str, str] = {}
+    for spec in specs:
+        source = parse_source(spec, default_ref)
+        if source in sources:
+            raise RuntimeError(f"Source given twice: {source.label}")
+        if source.url:
+            other = cache_names.setdefault(repo_cache_name(source.url), source.url)
+            if other != source.url:
+                raise RuntimeError(
+                    f"Sources {other} and {source.url} would share a clone cache "
+                    "directory; use a local clone for one of them."
+                )
+        sources.append(source)
+    return sources
+
+
+def _open_source(
+    source: Source,
+    args: argparse.Namespace,
+    sparse_paths: list[str] | None,
+) -> tuple[Path, SkillCatalog]:
+    """Fetch or open one source and load its catalog."""
+    with span("open_source", source=source.label):
+        if source.path is not None:
+            root = source.path
+        else:
+            root = clone_or_update_repo(
+                repo_url=source.url,
+                ref=source.ref,
+                cache_dir=Path(args.cache_dir).expanduser().resolve(),
+                sparse_paths=sparse_paths,
+                fetch_ttl=args.fetch_ttl,
+                follow_ref=args.mode == "symlink",
+            )
+        return root, load_catalog(root / "skills", use_cache=not args.no_cache)
+
+
+def resolve_sources(
+    args: argparse.Namespace,
+    skill_names: list[str],
+) -> tuple[list[Path], SkillCatalog]:
+    """Open every --source in parallel; return their roots and merged catalog.
+
+    skill_names limits a --sparse checkout of URL sources.
+    """
+    sources = parse_sources(args.source, args.ref)
+    sparse_paths = sparse_skill_paths(skill_names) if args.sparse else None
+    with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+        opened = list(
+            pool.map(lambda source: _open_source(source, args, sparse_paths), sources)
+        )
+    roots = [root for root, _catalog in opened]
+    entries = [entry for _root, catalog in opened for entry in catalog]
+    return roots, SkillCatalog(roots[0] / "skills", entries)
+
+
+def sources_record(args: argparse.Namespace, roots: list[Path]) -> dict[str, Any]:
+    """Describe every source, in precedence order, for skills.lock."""
+    sources = parse_sources(args.source, args.ref)
+    records = [
+        describe_source(root, source.url, source.ref)
+        for source, root in zip(sources, roots, strict=True)
+    ]
+    return {
+        "sources": records,
+        "dirty": any(record["dirty"] for record in records),
+    }
+
+
+def frozen_specs(lock_source: dict[str, Any]) -> list[str]:
+    """Return --source values pinning each locked source to its commit."""
+    specs = []
+    for record in lock_source["sources"]:
+        if record.get("url"):
+            specs.append(f"{record['url']}#{record.get('commit') or record['ref']}")
+        else:
+            specs.append(record["path"])
+    return specs
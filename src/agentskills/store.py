@@ -0,0 +1,147 @@
+"""Content-addressed object store backing `bootstrap --mode hardlink`.
+
+Every installed file is stored once under ~/.cache/agentskills/objects,
+named by the SHA-256 of its content, and hardlinked into each project.
+Objects are made read-only so an in-place edit inside one project cannot
+silently change every other project that links the same object.
+
+Digests are memoised in index.json by (size, mtime, inode) of the source
+file, so re-installing an unchanged skill does not re-hash anything.
+The module is only imported for hardlink installs.
+"""
+
+from __future__ import annotations
+
+import errno
+import hashlib
+import json
+import os
+import shutil
+import stat
+import time
+from _thread import get_ident
+from pathlib import Path
+from typing import NamedTuple
+
+from agentskills import cache_root
+from agentskills.cache import RACY_WINDOW_NS
+
+OBJECTS_DIR = "objects"
+INDEX_NAME = "index.json"
+INDEX_VERSION = 1
+
+# Errors that mean "hardlinking is not possible here", not "the install is
+# broken": cross-device stores, link-count limits and filesystems without
+# hardlink support fall back to copying the object.
+_LINK_FALLBACK_ERRNOS = {errno.EXDEV, errno.EMLINK, errno.EPERM, errno.ENOTSUP}
+
+
+class LinkStats(NamedTuple):
+    """Outcome of linking one tree out of the store."""
+
+    linked: int
+    copied: int
+    stored: int
+
+
+class ObjectStore:
+    """A directory of read-only, content-addressed file objects."""
+
+    def __init__(self, root: Path | None = None) -> None:
+        """Open the store at root (default: <cache>/objects)."""
+        self.root = root if root is not None else cache_root() / OBJECTS_DIR
+        self._index_path = self.root / INDEX_NAME
+        self._index: dict[str, list] = self._load_index()
+        self._dirty = False
+
+    def _load_index(self) -> dict[str, list]:
+        """Load the digest index, returning {} if it is missing or corrupt."""
+        try:
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def save(self) -> None:
+        """Persist the digest index if it changed; failures are ignored."""
+        if not self._dirty:
+            return
+        tmp_path = self._index_path.with_name(f"{INDEX_NAME}.{os.getpid()}.tmp")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            payload = {"version": INDEX_VERSION, "entries": self._index}
+            tmp_path.write_text(json.dumps(payload, separators=(",", ":")), "utf-8")
+            os.replace(tmp_path, self._index_path)
+            self._dirty = False
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def digest(self, path: Path, st: os.stat_result | None = None) -> str:
+        """Return the SHA-256 of path, reusing the index when its stat matches."""
+        st = st or os.stat(path)
+        key = os.path.abspath(path)
+        signature = [st.st_size, st.st_mtime_ns, st.st_ino]
+        cached = self._index.get(key)
+        if cached and cached[:3] == signature:
+            return cached[3]
+
+        with open(path, "rb") as handle:
+            digest = hashlib.file_digest(handle, "sha256").hexdigest()
+        if time.time_ns() - st.st_mtime_ns >= RACY_WINDOW_NS:
+            self._index[key] = [*signature, digest]
+            self._dirty = True
+        return digest
+
+    def object_path(self, digest: str, executable: bool) -> Path:
+        """Return where the object for digest (and exec bit) is stored."""
+        suffix = "x" if executable else ""
+        return self.root / digest[:2] / f"{digest[2:]}{suffix}"
+
+    def add(self, path: Path) -> tuple[Path, bool]:
+        """Store path's content, returning (object path, whether it was new)."""
+        st = os.stat(path)
+        executable = bool(st.st_mode & stat.S_IXUSR)
+        target = self.object_path(self.digest(path, st), executable)
+        if target.exists():
+            return target, False
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f"{target.name}.{os.getpid()}.{get_ident()}.tmp")
+        try:
+            shutil.copyfile(path, tmp_path)
+            os.chmod(tmp_path, 0o555 if executable else 0o444)
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return target, True
+
+    def link_tree(self, source: Path, destination: Path) -> LinkStats:
+        """Recreate source at destination with files hardlinked from the store.
+
+        Directories are created fresh; symlinks inside source are followed,
+        as with copy mode. Files that cannot be hardlinked are copied.
+        """
+        linked = copied = stored = 0
+        destination.mkdir(parents=True)
+        for dirpath, dirnames, filenames in os.walk(source, followlinks=True):
+            dirnames.sort()
+            rel = os.path.relpath(dirpath, source)
+            target_dir = destination if rel == "." else destination / rel
+            for name in dirnames:
+                (target_dir / name).mkdir()
+            for name in sorted(filenames):
+                obj, new = self.add(Path(dirpath) / name)
+                stored += new
+                try:
+                    os.link(obj, target_dir / name)
+                    linked += 1
+                except OSError as exc:
+                    if exc.errno not in _LINK_FALLBACK_ERRNOS:
+                        raise
+                    shutil.copy2(obj, target_dir / name)
+                    copied += 1
+        return LinkStats(linked, copied, stored)
@@ -0,0 +1,138 @@
+"""Incremental tree sync backing `bootstrap --sync`.
+
+A destination file is up to date when it has the same size, permission
+bits and mtime as its source. When only the mtime differs, as it does for
+every file after the source is checked out at another commit, contents
+are compared instead; a match just takes the source's mtime, so the next
+sync is back on the fast path. With checksum=True contents are always
+compared. Only new or changed files are rewritten, each through a temporary file
+and an atomic rename, and files missing from the source are deleted. An
+up-to-date tree is left untouched, so watchers see no events.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import stat
+from pathlib import Path
+from typing import NamedTuple
+
+
+class SyncReport(NamedTuple):
+    """Relative paths changed by one sync."""
+
+    added: list[str]
+    updated: list[str]
+    removed: list[str]
+
+    @property
+    def changed(self) -> bool:
+        """True if anything was written or deleted."""
+        return bool(self.added or self.updated or self.removed)
+
+    def summary(self) -> str:
+        """Return a short '+added ~updated -removed' summary."""
+        return f"+{len(self.added)} ~{len(self.updated)} -{len(self.removed)}"
+
+
+def _digest(path: str) -> bytes:
+    """Return the SHA-256 digest of a file."""
+    with open(path, "rb") as handle:
+        return hashlib.file_digest(handle, "sha256").digest()
+
+
+def _is_current(src: os.DirEntry, dst: os.DirEntry, checksum: bool) -> bool:
+    """Return True if dst already matches src.
+
+    A dst with src's content but another mtime is given src's mtime.
+    """
+    src_st, dst_st = src.stat(), dst.stat(follow_symlinks=False)
+    if src_st.st_size != dst_st.st_size:
+        return False
+    if stat.S_IMODE(src_st.st_mode) != stat.S_IMODE(dst_st.st_mode):
+        return False
+    if src_st.st_mtime_ns == dst_st.st_mtime_ns and not checksum:
+        return True
+    if _digest(src.path) != _digest(dst.path):
+        return False
+    if src_st.st_mtime_ns != dst_st.st_mtime_ns:
+        os.utime(dst.path, ns=(dst_st.st_atime_ns, src_st.st_mtime_ns))
+    return True
+
+
+def _remove(path: str) -> None:
+    """Remove a file, symlink or directory tree."""
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    else:
+        os.unlink(path)
+
+
+def _copy_atomic(src: str, dst: str) -> None:
+    """Copy src over dst via a temporary sibling and a rename."""
+    tmp = f"{dst}.{os.getpid()}.tmp"
+    try:
+        shutil.copy2(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        if os.path.lexists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def sync_tree(source: Path, destination: Path, checksum: bool = False) -> SyncReport:
+    """Make destination a copy of source, rewriting only what differs.
+
+    A destination that is a symlink or a file (e.g. from a previous
+    symlink-mode install) is replaced by a real directory.
+    """
+    report = SyncReport([], [], [])
+    if destination.is_symlink() or destination.is_file():
+        destination.unlink()
+    destination.mkdir(parents=True, exist_ok=True)
+    _sync_dir(str(source), str(destination), "", checksum, report)
+    return report
+
+
+def _sync_dir(
+    src_dir: str,
+    dst_dir: str,
+    prefix: str,
+    checksum: bool,
+    report: SyncReport,
+) -> None:
+    """Sync one directory level, then recurse into subdirectories."""
+    with os.scandir(dst_dir) as it:
+        existing = {entry.name: entry for entry in it}
+    with os.scandir(src_dir) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+
+    for entry in entries:
+        rel = f"{prefix}{entry.name}"
+        target = os.path.join(dst_dir, entry.name)
+        current = existing.pop(entry.name, None)
+        if entry.is_dir():
+            if current is not None and not current.is_dir(follow_symlinks=False):
+                _remove(target)
+                report.removed.append(rel)
+                current = None
+            if current is None:
+                os.mkdir(target)
+            _sync_dir(entry.path, target, f"{rel}/", checksum, report)
+            continue
+
+        if current is not None and current.is_dir(follow_symlinks=False):
+            _remove(target)
+            current = None
+        if current is None or current.is_symlink():
+            _copy_atomic(entry.path, target)
+            (report.updated if current else report.added).append(rel)
+        elif not _is_current(entry, current, checksum):
+            _copy_atomic(entry.path, target)
+            report.updated.append(rel)
+
+    for name in sorted(existing):
+        _remove(os.path.join(dst_dir, name))
+        report.removed.append(f"{prefix}{name}")
@@ -0,0 +1,157 @@
+"""Opt-in per-phase timing spans for the global --timings flag.
+
+Instrumented code wraps phases in ``with span("name", key=value):``.
+Until enable() is called, span() returns a shared no-op context manager,
+so disabled instrumentation costs one function call and a global lookup.
+Spans opened on worker threads attach to the span that is open on the
+main thread, so parallel work nests under the phase that started it.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from _thread import get_ident
+from typing import Any, TextIO
+
+FORMATS = ("tree", "json")
+
+_enabled = False
+_format = "tree"
+_origin_ns = 0
+_main_ident = get_ident()
+_roots: list[Span] = []
+_stacks: dict[int, list[Span]] = {}
+
+
+class Span:
+    """A timed phase with optional attributes and nested child spans."""
+
+    __slots__ = ("name", "attrs", "start_ns", "end_ns", "children", "_stack")
+
+    def __init__(self, name: str, attrs: dict[str, Any]) -> None:
+        """Create an unstarted span."""
+        self.name = name
+        self.attrs = attrs
+        self.start_ns = 0
+        self.end_ns = 0
+        self.children: list[Span] = []
+        self._stack: list[Span] = []
+
+    @property
+    def duration_ms(self) -> float:
+        """Elapsed time in milliseconds (up to now if still open)."""
+        end = self.end_ns or time.perf_counter_ns()
+        return (end - self.start_ns) / 1e6
+
+    def __enter__(self) -> Span:
+        """Start timing and attach to the innermost open span."""
+        stack = _stacks.setdefault(get_ident(), [])
+        parent_stack = stack or _stacks.get(_main_ident, [])
+        (parent_stack[-1].children if parent_stack else _roots).append(self)
+        stack.append(self)
+        self._stack = stack
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop timing and pop this span."""
+        self.end_ns = time.perf_counter_ns()
+        if self._stack and self._stack[-1] is self:
+            self._stack.pop()
+
+
+class _NullSpan:
+    """Shared no-op stand-in used while timings are disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def enable(fmt: str = "tree") -> None:
+    """Start recording spans, to be reported in the given format."""
+    global _enabled, _format, _origin_ns
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown timings format: {fmt} (use {', '.join(FORMATS)})")
+    _enabled = True
+    _format = fmt
+    _origin_ns = time.perf_counter_ns()
+    _roots.clear()
+    _stacks.clear()
+
+
+def disable() -> None:
+    """Stop recording spans and discard those recorded so far."""
+    global _enabled
+    _enabled = False
+    _roots.clear()
+    _stacks.clear()
+
+
+def is_enabled() -> bool:
+    """Return True if spans are being recorded."""
+    return _enabled
+
+
+def span(name: str, **attrs: Any) -> Span | _NullSpan:
+    """Return a context manager timing one phase (a no-op when disabled)."""
+    if not _enabled:
+        return _NULL_SPAN
+    return Span(name, attrs)
+
+
+def _format_attrs(attrs: dict[str, Any]) -> str:
+    """Render span attributes as space-separated key=value pairs."""
+    return " ".join(f"{key}={value}" for key, value in attrs.items())
+
+
+def _write_tree(spans: list[Span], stream: TextIO, depth: int) -> None:
+    """Write spans and their children as an indented tree."""
+    for item in spans:
+        label = f"{'  ' * depth}{item.name}"
+        attrs = _format_attrs(item.attrs)
+        line = f"  {label:48s} {item.duration_ms:10.1f}ms"
+        stream.write(f"{line}  {attrs}\n" if attrs else f"{line}\n")
+        _write_tree(item.children, stream, depth + 1)
+
+
+def _write_json_lines(
+    spans: list[Span],
+    stream: TextIO,
+    parent: str | None,
+    depth: int,
+) -> None:
+    """Write one JSON object per span, parents before children."""
+    import json
+
+    for item in spans:
+        record = {
+            "name": item.name,
+            "parent": parent,
+            "depth": depth,
+            "start_ms": round((item.start_ns - _origin_ns) / 1e6, 3),
+            "duration_ms": round(item.duration_ms, 3),
+            "attrs": item.attrs,
+        }
+        stream.write(json.dumps(record, default=str) + "\n")
+        _write_json_lines(item.children, stream, item.name, depth + 1)
+
+
+def report(stream: TextIO | None = None) -> None:
+    """Write recorded spans to stream (stderr by default)."""
+    if not _enabled or not _roots:
+        return
+    stream = stream or sys.stderr
+    if _format == "json":
+        _write_json_lines(_roots, stream, None, 0)
+    else:
+        stream.write("timings:\n")
+        _write_tree(_roots, stream, 0)
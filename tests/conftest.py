@@ -26,6 +26,14 @@ CURATED_SKILL_MD_CONTENT = (
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path_factory, monkeypatch) -> Path:
+    """Point the agentskills cache at a per-test temporary directory."""
+    cache = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("AGENTSKILLS_CACHE_DIR", str(cache))
+    return cache
+
+
 @pytest.fixture()
 def tmp_skill(tmp_path: Path) -> Path:
     """Create a minimal skill directory with a valid SKILL.md."""
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+import stat
+from pathlib import Path
+from zipfile import ZipFile, ZipInfo
+
+import pytest
+
+from agentskills.archive import extract_skill, find_archives, version_key
+from agentskills.bootstrap import main
+from agentskills.package import package_skill
+
+
+@pytest.fixture()
+def dist(tmp_skill: Path) -> Path:
+    """Package test-skill into tmp_skill/dist and return that directory."""
+    scripts = tmp_skill / "skills" / "test-skill" / "scripts"
+    scripts.mkdir()
+    (scripts / "run.sh").write_text("#!/bin/sh\n")
+    (scripts / "run.sh").chmod(0o755)
+    package_skill("test-skill", tmp_skill)
+    return tmp_skill / "dist"
+
+
+def _write_zip(path: Path, names: list[str]) -> Path:
+    with ZipFile(path, "w") as zf:
+        for name in names:
+            zf.writestr(name, "x")
+    return path
+
+
+class TestFindArchives:
+    def test_picks_highest_version(self, tmp_path: Path):
+        for version in ("1.2.0", "1.10.0", "1.10.0-rc.1", "0.9.9"):
+            (tmp_path / f"demo-v{version}.skill").write_bytes(b"")
+        (tmp_path / "other-v2.0.0.skill").write_bytes(b"")
+        (tmp_path / "notes.txt").write_text("")
+        found = find_archives(tmp_path)
+        assert found == {
+            "demo": tmp_path / "demo-v1.10.0.skill",
+            "other": tmp_path / "other-v2.0.0.skill",
+        }
+
+    def test_version_key_orders_prereleases_first(self):
+        assert version_key("1.0.0-alpha") < version_key("1.0.0-alpha.1")
+        assert version_key("1.0.0-alpha.1") < version_key("1.0.0-beta")
+        assert version_key("1.0.0-rc.1") < version_key("1.0.0")
+
+    def test_rejects_badly_named_file(self, tmp_path: Path):
+        path = _write_zip(tmp_path / "demo.zip", ["demo/SKILL.md"])
+        with pytest.raises(RuntimeError, match="Not a"):
+            find_archives(path)
+
+    def test_rejects_tar_xz(self, tmp_path: Path):
+        path = tmp_path / "demo-v1.0.0.tar.xz"
+        path.write_bytes(b"")
+        with pytest.raises(RuntimeError, match="Cannot install from a tar.xz"):
+            find_archives(path)
+
+
+class TestExtractSkill:
+    def test_extracts_with_modes(self, dist: Path, tmp_path: Path):
+        archive = dist / "test-skill-v1.0.0.skill"
+        report = extract_skill(archive, "test-skill", tmp_path / "dest")
+        assert sorted(report.written) == ["SKILL.md", "scripts/run.sh"]
+        run = tmp_path / "dest" / "test-skill" / "scripts" / "run.sh"
+        assert stat.S_IMODE(run.stat().st_mode) == 0o755
+
+    def test_skips_matching_and_removes_stale(self, dist: Path, tmp_path: Path):
+        archive = dist / "test-skill-v1.0.0.skill"
+        dest = tmp_path / "dest"
+        extract_skill(archive, "test-skill", dest)
+        installed = dest / "test-skill"
+        inode = (installed / "SKILL.md").stat().st_ino
+        (installed / "scripts" / "run.sh").write_text("edited\n")
+        (installed / "stale.md").write_text("stale\n")
+
+        report = extract_skill(archive, "test-skill", dest)
+        assert report.skipped == ["SKILL.md"]
+        assert report.written == ["scripts/run.sh"]
+        assert report.removed == ["stale.md"]
+        assert (installed / "SKILL.md").stat().st_ino == inode
+        assert (installed / "scripts" / "run.sh").read_text() == "#!/bin/sh\n"
+
+    @pytest.mark.parametrize(
+        "entry",
+        ["demo/../evil.md", "/etc/evil", "other/SKILL.md", "demo\\..\\evil", "demo"],
+    )
+    def test_rejects_unsafe_entries(self, tmp_path: Path, entry: str):
+        archive = _write_zip(tmp_path / "demo-v1.0.0.skill", ["demo/SKILL.md", entry])
+        with pytest.raises(RuntimeError, match="Unsafe entry"):
+            extract_skill(archive, "demo", tmp_path / "dest")
+        assert not (tmp_path / "dest").exists()
+
+    def test_rejects_symlink_entries(self, tmp_path: Path):
+        archive = tmp_path / "demo-v1.0.0.skill"
+        with ZipFile(archive, "w") as zf:
+            zf.writestr("demo/SKILL.md", "x")
+            link = ZipInfo("demo/link")
+            link.external_attr = (stat.S_IFLNK | 0o777) << 16
+            zf.writestr(link, "/etc/passwd")
+        with pytest.raises(RuntimeError, match="Symlink entry"):
+            extract_skill(archive, "demo", tmp_path / "dest")
+
+
+class TestBootstrapFromArchive:
+    def test_installs_from_directory(
+        self, dist: Path, tmp_path: Path, capsys, monkeypatch
+    ):
+        project = tmp_path / "project"
+        argv = ["agentskills", "--project", str(project), "--from-archive", str(dist)]
+        monkeypatch.setattr("sys.argv", argv)
+        assert main() == 0
+        assert (project / ".agents" / "skills" / "test-skill" / "SKILL.md").exists()
+
+        monkeypatch.setattr("sys.argv", [*argv, "--force"])
+        assert main() == 0
+        assert "0 written, 2 unchanged, 0 removed" in capsys.readouterr().out
+
+    def test_writes_lock(self, dist: Path, tmp_path: Path, capsys, monkeypatch):
+        project = tmp_path / "project"
+        argv = ["agentskills", "--project", str(project), "--from-archive", str(dist)]
+        monkeypatch.setattr("sys.argv", argv)
+        assert main() == 0
+        lock = json.loads((project / ".agents" / "skills.lock").read_text())
+        assert lock["source"]["archive"] == str(dist)
+        assert set(lock["skills"]) == {"test-skill"}
+
+        monkeypatch.setattr(
+            "sys.argv", ["agentskills", "--project", str(project), "--verify"]
+        )
+        assert main() == 0
+        monkeypatch.setattr(
+            "sys.argv", ["agentskills", "--project", str(project), "--frozen"]
+        )
+        assert main() == 1
+        assert "instead of --frozen" in capsys.readouterr().err
+
+    def test_bad_archive_installs_nothing(
+        self, dist: Path, tmp_path: Path, capsys, monkeypatch
+    ):
+        project = tmp_path / "project"
+        argv = ["agentskills", "--project", str(project), "--from-archive", str(dist)]
+        monkeypatch.setattr("sys.argv", argv)
+        assert main() == 0
+        installed = project / ".agents" / "skills" / "test-skill"
+        (installed / "SKILL.md").write_text("local edit\n")
+        _write_zip(dist / "zzz-v1.0.0.skill", ["zzz/SKILL.md", "zzz/../evil.md"])
+
+        monkeypatch.setattr("sys.argv", [*argv, "--all", "--force"])
+        assert main() == 1
+        assert "Unsafe entry" in capsys.readouterr().err
+        assert (installed / "SKILL.md").read_text() == "local edit\n"
+        assert sorted(p.name for p in (project / ".agents").iterdir()) == [
+            "skills",
+            "skills.lock",
+        ]
+        assert sorted(p.name for p in installed.parent.iterdir()) == ["test-skill"]
+
+    def test_existing_destination_needs_force(
+        self, dist: Path, tmp_path: Path, capsys, monkeypatch
+    ):
+        project = tmp_path / "project"
+        (project / ".agents" / "skills" / "test-skill").mkdir(parents=True)
+        argv = ["agentskills", "--project", str(project), "--from-archive", str(dist)]
+        monkeypatch.setattr("sys.argv", argv)
+        assert main() == 1
+        assert "already exists" in capsys.readouterr().err
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
 from unittest.mock import patch
 
+from agentskills import bootstrap
 from agentskills.bootstrap import (
+    clone_or_update_repo,
     discover_available_skills,
     install_skill,
+    install_skills,
     main,
     parse_skill_list,
     pick_skills_interactive,
     repo_cache_name,
+    sparse_skill_paths,
 )
 
 URL = "https://github.com/jwa91/agentskills"
@@ -60,6 +67,11 @@ class TestRepoCacheName:
         result = repo_cache_name("https://example.com/my repo!.git")
         assert all(ch.isalnum() or ch in ("-", "_", ".") for ch in result)
 
+    def test_default_cache_dir_follows_cache_root(self, isolated_cache: Path):
+        with patch("sys.argv", ["agentskills", "--all"]):
+            args = bootstrap.parse_args()
+        assert Path(args.cache_dir) == isolated_cache / "repos"
+
 
 class TestDiscoverAvailableSkills:
     def test_finds_skills(self, tmp_skill: Path):
@@ -117,6 +129,21 @@ class TestInstallSkill:
         )
         assert result.is_symlink()
 
+    def test_hardlink_mode(self, tmp_skill: Path, tmp_path: Path):
+        first = tmp_path / "a"
+        second = tmp_path / "b"
+        first.mkdir()
+        second.mkdir()
+        for dest in (first, second):
+            install_skill(
+                "test-skill", tmp_skill / "skills", dest, "hardlink", force=False
+            )
+        a = (first / "test-skill" / "SKILL.md").stat()
+        b = (second / "test-skill" / "SKILL.md").stat()
+        assert not (first / "test-skill").is_symlink()
+        assert a.st_ino == b.st_ino
+        assert a.st_nlink >= 3
+
     def test_force_replaces(self, tmp_skill: Path, tmp_path: Path):
         dest = tmp_path / "dest"
         dest.mkdir()
@@ -169,6 +196,77 @@ class TestInstallSkill:
         assert (result / "SKILL.md").exists()
 
 
+class TestInstallSkills:
+    def test_installs_all(self, tmp_skill_with_curated: Path, tmp_path: Path):
+        dest = tmp_path / ".agents" / "skills"
+        dest.mkdir(parents=True)
+        result = install_skills(
+            ["test-skill", "curated-skill"],
+            tmp_skill_with_curated / "skills",
+            dest,
+            "copy",
+            force=False,
+        )
+        assert [path.name for path in result] == ["test-skill", "curated-skill"]
+        assert sorted(p.name for p in (tmp_path / ".agents").iterdir()) == ["skills"]
+
+    def test_existing_destination_installs_nothing(
+        self, tmp_skill_with_curated: Path, tmp_path: Path
+    ):
+        dest = tmp_path / "project" / "skills"
+        (dest / "curated-skill").mkdir(parents=True)
+        with pytest.raises(RuntimeError, match="already exists"):
+            install_skills(
+                ["test-skill", "curated-skill"],
+                tmp_skill_with_curated / "skills",
+                dest,
+                "copy",
+                force=False,
+            )
+        assert sorted(p.name for p in dest.iterdir()) == ["curated-skill"]
+
+    def test_failed_stage_leaves_destination_untouched(
+        self, tmp_skill_with_curated: Path, tmp_path: Path
+    ):
+        dest = tmp_path / "project" / "skills"
+        dest.mkdir(parents=True)
+        with pytest.raises(RuntimeError, match="Skill not found"):
+            install_skills(
+                ["test-skill", "missing-skill"],
+                tmp_skill_with_curated / "skills",
+                dest,
+                "copy",
+                force=False,
+            )
+        assert list(dest.iterdir()) == []
+        assert [p.name for p in dest.parent.iterdir()] == ["skills"]
+
+    def test_failed_rename_restores_replaced_skills(
+        self, tmp_skill_with_curated: Path, tmp_path: Path, monkeypatch
+    ):
+        dest = tmp_path / "project" / "skills"
+        (dest / "test-skill").mkdir(parents=True)
+        (dest / "test-skill" / "old.md").write_text("old\n")
+        real_replace = os.replace
+
+        def flaky_replace(src, dst):
+            if Path(dst).name == "curated-skill":
+                raise OSError("disk full")
+            real_replace(src, dst)
+
+        monkeypatch.setattr("agentskills.bootstrap.os.replace", flaky_replace)
+        with pytest.raises(OSError, match="disk full"):
+            install_skills(
+                ["test-skill", "curated-skill"],
+                tmp_skill_with_curated / "skills",
+                dest,
+                "copy",
+                force=True,
+            )
+        assert sorted(p.name for p in dest.iterdir()) == ["test-skill"]
+        assert (dest / "test-skill" / "old.md").read_text() == "old\n"
+
+
 class TestSymlinkWarning:
     def test_symlink_mode_prints_warning(self, tmp_skill: Path, tmp_path: Path, capsys, monkeypatch):
         dest = tmp_path / "project"
@@ -278,3 +376,271 @@ class TestPickerInteractive:
             monkeypatch.setattr("sys.stdin", type("FakeTTY", (), {"isatty": lambda self: True})())
             result = pick_skills_interactive(tmp_skill_with_curated / "skills")
         assert result == ["curated-skill"]
+
+
+def _git(*args: str, cwd: Path) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture()
+def origin_repo(tmp_skill_with_curated: Path) -> Path:
+    """Turn tmp_skill_with_curated into a git repo with a big unrelated file."""
+    repo = tmp_skill_with_curated
+    (repo / "docs").mkdir()
+    (repo / "docs" / "big.md").write_text("x" * 10_000)
+    _git("init", "-q", "-b", "main", cwd=repo)
+    _git("config", "uploadpack.allowFilter", "true", cwd=repo)
+    _git("add", "-A", cwd=repo)
+    _git("commit", "-q", "-m", "init", cwd=repo)
+    _git("tag", "v1", cwd=repo)
+    return repo
+
+
+class TestSparseClone:
+    def test_sparse_paths_cover_own_and_curated(self):
+        assert sparse_skill_paths(["a"]) == ["skills/a", "skills/curated/a"]
+
+    def test_sparse_paths_default_to_all_skills(self):
+        assert sparse_skill_paths([]) == ["skills"]
+
+    def test_checks_out_only_selected_skill(self, origin_repo: Path, tmp_path: Path):
+        repo_path = clone_or_update_repo(
+            f"file://{origin_repo}",
+            "main",
+            tmp_path / "cache",
+            sparse_paths=sparse_skill_paths(["curated-skill"]),
+        )
+        assert repo_path.parent.name.endswith("-sparse-worktrees")
+        curated = repo_path / "skills" / "curated" / "curated-skill"
+        assert (curated / "SKILL.md").exists()
+        assert not (repo_path / "skills" / "test-skill").exists()
+        assert not (repo_path / "docs").exists()
+        assert _git("rev-parse", "--is-shallow-repository", cwd=repo_path) == "true"
+        objects = _git(
+            "rev-list", "--objects", "--missing=print", "HEAD", cwd=repo_path
+        )
+        assert any(line.startswith("?") for line in objects.splitlines())
+
+    def test_update_adds_skills_to_worktree(self, origin_repo: Path, tmp_path: Path):
+        url = f"file://{origin_repo}"
+        cache = tmp_path / "cache"
+        first = clone_or_update_repo(
+            url, "main", cache, sparse_paths=["skills/test-skill"]
+        )
+        repo_path = clone_or_update_repo(
+            url, "v1", cache, sparse_paths=["skills/curated/curated-skill"]
+        )
+        assert repo_path == first
+        assert (repo_path / "skills" / "curated" / "curated-skill").exists()
+        assert (repo_path / "skills" / "test-skill").exists()
+        assert not (repo_path / "docs").exists()
+
+    def test_main_installs_from_sparse_clone(
+        self, origin_repo: Path, tmp_path: Path, monkeypatch
+    ):
+        project = tmp_path / "project"
+        monkeypatch.setattr(
+            "sys.argv",
+            [
+                "agentskills",
+                "--project",
+                str(project),
+                "--skill",
+                "test-skill",
+                "--repo-url",
+                f"file://{origin_repo}",
+                "--cache-dir",
+                str(tmp_path / "cache"),
+                "--sparse",
+            ],
+        )
+        assert main() == 0
+        assert (project / ".agents" / "skills" / "test-skill" / "SKILL.md").exists()
+
+    def test_sparse_requires_repo_url(self, tmp_skill: Path, capsys, monkeypatch):
+        monkeypatch.setattr(
+            "sys.argv",
+            ["agentskills", "--repo-path", str(tmp_skill), "--sparse", "--all"],
+        )
+        assert main() == 1
+        assert "--sparse requires --repo-url" in capsys.readouterr().err
+
+
+class TestWorktrees:
+    @pytest.fixture()
+    def two_commits(self, origin_repo: Path) -> Path:
+        """Add a second commit on main; v1 stays on the first."""
+        (origin_repo / "skills" / "test-skill" / "NEW.md").write_text("new\n")
+        _git("add", "-A", cwd=origin_repo)
+        _git("commit", "-q", "-m", "second", cwd=origin_repo)
+        return origin_repo
+
+    def test_each_commit_gets_its_own_worktree(self, two_commits: Path, tmp_path: Path):
+        url = f"file://{two_commits}"
+        cache = tmp_path / "cache"
+        main_tree = clone_or_update_repo(url, "main", cache)
+        v1_tree = clone_or_update_repo(url, "v1", cache)
+
+        assert main_tree != v1_tree
+        assert main_tree.parent == v1_tree.parent
+        assert (main_tree / "skills" / "test-skill" / "NEW.md").exists()
+        assert not (v1_tree / "skills" / "test-skill" / "NEW.md").exists()
+        # The first worktree is not moved by the second checkout.
+        assert (main_tree / "skills" / "test-skill" / "NEW.md").exists()
+        # The cached clone itself never has a working tree.
+        repo_path = cache / main_tree.parent.name.removesuffix("-worktrees")
+        assert not (repo_path / "skills").exists()
+
+    def test_parallel_runs_share_the_cache(self, two_commits: Path, tmp_path: Path):
+        url = f"file://{two_commits}"
+        cache = tmp_path / "cache"
+        refs = ["main", "v1"] * 3
+        with ThreadPoolExecutor(max_workers=len(refs)) as pool:
+            trees = list(
+                pool.map(lambda ref: clone_or_update_repo(url, ref, cache), refs)
+            )
+
+        assert len(set(trees)) == 2
+        for ref, tree in zip(refs, trees, strict=True):
+            has_new = (tree / "skills" / "test-skill" / "NEW.md").exists()
+            assert has_new == (ref == "main")
+
+    @staticmethod
+    def _advance(repo: Path) -> None:
+        (repo / "skills" / "test-skill" / "LATER.md").write_text("later\n")
+        _git("add", "-A", cwd=repo)
+        _git("commit", "-q", "-m", "later", cwd=repo)
+
+    def test_prunes_stale_worktrees(self, two_commits: Path, tmp_path: Path):
+        url = f"file://{two_commits}"
+        cache = tmp_path / "cache"
+        old = clone_or_update_repo(url, "main", cache)
+        os.utime(old, (0, 0))
+        self._advance(two_commits)
+        current = clone_or_update_repo(url, "main", cache)
+
+        assert current != old
+        assert current.exists()
+        assert not old.exists()
+
+    def test_keeps_worktrees_a_ref_points_at(self, two_commits: Path, tmp_path: Path):
+        url = f"file://{two_commits}"
+        cache = tmp_path / "cache"
+        v1_tree = clone_or_update_repo(url, "v1", cache)
+        os.utime(v1_tree, (0, 0))
+        clone_or_update_repo(url, "main", cache)
+
+        assert (v1_tree / "skills" / "test-skill" / "SKILL.md").exists()
+
+    def test_symlink_install_follows_ref(
+        self, two_commits: Path, tmp_path: Path, monkeypatch
+    ):
+        url = f"file://{two_commits}"
+        cache = tmp_path / "cache"
+        project = tmp_path / "project"
+        monkeypatch.setattr(
+            "sys.argv",
+            [
+                "agentskills",
+                "--project",
+                str(project),
+                "--skill",
+                "test-skill",
+                "--repo-url",
+                url,
+                "--cache-dir",
+                str(cache),
+                "--mode",
+                "symlink",
+            ],
+        )
+        assert main() == 0
+        installed = project / ".agents" / "skills" / "test-skill"
+        first = clone_or_update_repo(url, "main", cache)
+        os.utime(first, (0, 0))
+        self._advance(two_commits)
+        clone_or_update_repo(url, "main", cache)
+
+        assert not first.exists()
+        assert (installed / "LATER.md").read_text() == "later\n"
+
+
+class TestFetchShortCircuit:
+    @pytest.fixture()
+    def commands(self, monkeypatch) -> list[list[str]]:
+        """Record every git command run by bootstrap."""
+        seen: list[list[str]] = []
+        real = bootstrap.run_command
+
+        def recording(cmd, cwd=None, check=True):
+            seen.append(cmd)
+            return real(cmd, cwd=cwd, check=check)
+
+        monkeypatch.setattr(bootstrap, "run_command", recording)
+        return seen
+
+    @staticmethod
+    def _fetches(commands: list[list[str]]) -> int:
+        return sum(cmd[1] in ("fetch", "pull", "clone") for cmd in commands)
+
+    @pytest.mark.parametrize("sparse", [None, ["skills/test-skill"]])
+    def test_cached_tag_is_not_fetched(
+        self, origin_repo: Path, tmp_path: Path, commands, sparse
+    ):
+        url = f"file://{origin_repo}"
+        clone_or_update_repo(url, "v1", tmp_path / "cache", sparse_paths=sparse)
+        commands.clear()
+        repo_path = clone_or_update_repo(
+            url, "v1", tmp_path / "cache", sparse_paths=sparse
+        )
+        assert self._fetches(commands) == 0
+        assert (repo_path / "skills" / "test-skill" / "SKILL.md").exists()
+
+    def test_cached_sha_is_not_fetched(
+        self, origin_repo: Path, tmp_path: Path, commands
+    ):
+        url = f"file://{origin_repo}"
+        sha = _git("rev-parse", "HEAD", cwd=origin_repo)
+        clone_or_update_repo(url, "main", tmp_path / "cache")
+        commands.clear()
+        repo_path = clone_or_update_repo(url, sha[:12], tmp_path / "cache")
+        assert self._fetches(commands) == 0
+        assert _git("rev-parse", "HEAD", cwd=repo_path) == sha
+
+    def test_branch_respects_fetch_ttl(
+        self, origin_repo: Path, tmp_path: Path, commands
+    ):
+        url = f"file://{origin_repo}"
+        cache = tmp_path / "cache"
+        clone_or_update_repo(url, "main", cache)
+        (origin_repo / "new.md").write_text("new")
+        _git("add", "new.md", cwd=origin_repo)
+        _git("commit", "-q", "-m", "new", cwd=origin_repo)
+
+        commands.clear()
+        repo_path = clone_or_update_repo(url, "main", cache, fetch_ttl=3600)
+        assert self._fetches(commands) == 0
+        assert not (repo_path / "new.md").exists()
+
+        repo_path = clone_or_update_repo(url, "main", cache, fetch_ttl=0)
+        assert self._fetches(commands) > 0
+        assert (repo_path / "new.md").exists()
+
+    def test_switching_back_to_tag_checks_it_out(
+        self, origin_repo: Path, tmp_path: Path
+    ):
+        url = f"file://{origin_repo}"
+        cache = tmp_path / "cache"
+        (origin_repo / "new.md").write_text("new")
+        _git("add", "new.md", cwd=origin_repo)
+        _git("commit", "-q", "-m", "new", cwd=origin_repo)
+        clone_or_update_repo(url, "v1", cache)
+        clone_or_update_repo(url, "main", cache, fetch_ttl=3600)
+        repo_path = clone_or_update_repo(url, "v1", cache)
+        assert not (repo_path / "new.md").exists()
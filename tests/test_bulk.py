@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+
+from agentskills.bootstrap import main
+
+
+def _run(monkeypatch, *args: str) -> int:
+    monkeypatch.setattr("sys.argv", ["agentskills", *args])
+    return main()
+
+
+def _commit(repo: Path) -> None:
+    for args in (("init", "-q"), ("add", "-A"), ("commit", "-q", "-m", "init")):
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+        )
+
+
+class TestBootstrapProjects:
+    def test_installs_into_every_project(
+        self, tmp_skill_with_curated: Path, tmp_path: Path, capsys, monkeypatch
+    ):
+        manifest = tmp_path / "fleet" / "projects.toml"
+        manifest.parent.mkdir()
+        manifest.write_text(
+            'skills = ["test-skill"]\n'
+            '[[projects]]\npath = "api"\n'
+            '[[projects]]\npath = "web"\nskills = "all"\n'
+        )
+        result = _run(
+            monkeypatch,
+            "--projects-file",
+            str(manifest),
+            "--repo-path",
+            str(tmp_skill_with_curated),
+            "--json",
+        )
+        assert result == 0
+        summary = json.loads(capsys.readouterr().out)
+        assert summary["ok"] == 2
+        assert summary["failed"] == 0
+        api = tmp_path / "fleet" / "api" / ".agents" / "skills"
+        web = tmp_path / "fleet" / "web" / ".agents" / "skills"
+        assert sorted(p.name for p in api.iterdir()) == ["test-skill"]
+        assert sorted(p.name for p in web.iterdir()) == [
+            "curated-skill",
+            "test-skill",
+        ]
+        lock = json.loads((web.parent / "skills.lock").read_text())
+        assert lock["source"]["path"] == str(tmp_skill_with_curated)
+        assert set(lock["skills"]) == {"curated-skill", "test-skill"}
+        assert _run(monkeypatch, "--project", str(api.parent.parent), "--verify") == 0
+
+    def test_rerun_is_up_to_date(
+        self, tmp_skill: Path, tmp_path: Path, capsys, monkeypatch
+    ):
+        _commit(tmp_skill)
+        manifest = tmp_path / "projects.txt"
+        manifest.write_text("api\nweb\n")
+        args = ("--projects-file", str(manifest), "--repo-path", str(tmp_skill))
+        assert _run(monkeypatch, *args, "--skill", "test-skill") == 0
+        skill_md = tmp_path / "api" / ".agents" / "skills" / "test-skill" / "SKILL.md"
+        inode = skill_md.stat().st_ino
+        capsys.readouterr()
+
+        assert _run(monkeypatch, *args, "--skill", "test-skill") == 0
+        out = capsys.readouterr().out
+        assert out.count("(up to date)") == 2
+        assert "done: 2 ok, 0 failed" in out
+        assert skill_md.stat().st_ino == inode
+
+    def test_failure_in_one_project_is_reported(
+        self, tmp_skill: Path, tmp_path: Path, capsys, monkeypatch
+    ):
+        (tmp_path / "busy" / ".agents" / "skills" / "test-skill").mkdir(parents=True)
+        manifest = tmp_path / "projects.txt"
+        manifest.write_text("busy\nfresh\n")
+        result = _run(
+            monkeypatch,
+            "--projects-file",
+            str(manifest),
+            "--repo-path",
+            str(tmp_skill),
+            "--skill",
+            "test-skill",
+        )
+        assert result == 1
+        out = capsys.readouterr().out
+        assert "already exists" in out
+        assert "done: 1 ok, 1 failed" in out
+        assert (tmp_path / "fresh" / ".agents" / "skills" / "test-skill").exists()
+
+    def test_unknown_skill_fails_before_installing(
+        self, tmp_skill: Path, tmp_path: Path, capsys, monkeypatch
+    ):
+        manifest = tmp_path / "projects.toml"
+        manifest.write_text('[[projects]]\npath = "api"\nskills = ["nope"]\n')
+        result = _run(
+            monkeypatch,
+            "--projects-file",
+            str(manifest),
+            "--repo-path",
+            str(tmp_skill),
+        )
+        assert result == 1
+        assert "Unknown skill(s) for project" in capsys.readouterr().err
+        assert not (tmp_path / "api").exists()
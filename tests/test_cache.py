@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from agentskills.cache import catalog_cache_path, load_catalog
+
+OLD_NS = 1_000_000_000_000_000_000
+
+
+def _age(path: Path) -> None:
+    """Backdate a path so its timestamps are outside the racy window."""
+    os.utime(path, ns=(OLD_NS, OLD_NS))
+
+
+def _age_tree(root: Path) -> None:
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames:
+            _age(Path(dirpath) / name)
+    _age(root)
+
+
+class TestLoadCatalog:
+    def test_matches_scan(self, tmp_skill_with_curated: Path):
+        catalog = load_catalog(tmp_skill_with_curated / "skills")
+        assert catalog.own == ["test-skill"]
+        assert catalog.curated == ["curated-skill"]
+
+    def test_writes_cache_file(self, tmp_skill: Path):
+        skills_root = tmp_skill / "skills"
+        load_catalog(skills_root, frontmatter=True)
+        data = json.loads(catalog_cache_path(skills_root).read_text())
+        skill = data["groups"]["own"]["skills"]["test-skill"]
+        assert skill["frontmatter"]["name"] == "test-skill"
+        assert skill["frontmatter"]["metadata"]["version"] == "1.0.0"
+
+    def test_frontmatter_on_entries(self, tmp_skill: Path):
+        catalog = load_catalog(tmp_skill / "skills", frontmatter=True)
+        entry = catalog.get("test-skill")
+        assert entry is not None
+        assert entry.frontmatter is not None
+        assert entry.frontmatter["name"] == "test-skill"
+
+    def test_warm_load_does_not_reread(self, tmp_skill: Path, monkeypatch):
+        skills_root = tmp_skill / "skills"
+        _age_tree(skills_root)
+        load_catalog(skills_root, frontmatter=True)
+
+        def fail(_path):
+            raise AssertionError("SKILL.md re-read on warm load")
+
+        monkeypatch.setattr("agentskills.frontmatter.read_frontmatter", fail)
+        entry = load_catalog(skills_root, frontmatter=True).get("test-skill")
+        assert entry is not None
+        assert entry.frontmatter is not None
+
+    def test_changed_skill_md_is_reread(self, tmp_skill: Path):
+        skills_root = tmp_skill / "skills"
+        _age_tree(skills_root)
+        load_catalog(skills_root, frontmatter=True)
+
+        skill_md = skills_root / "test-skill" / "SKILL.md"
+        skill_md.write_text("---\nname: renamed\nversion: 2.0.0\n---\n")
+        entry = load_catalog(skills_root, frontmatter=True).get("test-skill")
+        assert entry is not None
+        assert entry.frontmatter is not None
+        assert entry.frontmatter["name"] == "renamed"
+
+    def test_new_skill_is_discovered(self, tmp_skill: Path):
+        skills_root = tmp_skill / "skills"
+        _age_tree(skills_root)
+        load_catalog(skills_root)
+
+        new_skill = skills_root / "new-skill"
+        new_skill.mkdir()
+        (new_skill / "SKILL.md").write_text("---\nname: new-skill\n---\n")
+        assert "new-skill" in load_catalog(skills_root)
+
+    def test_removed_skill_md_drops_skill(self, tmp_skill: Path):
+        skills_root = tmp_skill / "skills"
+        _age_tree(skills_root)
+        load_catalog(skills_root)
+
+        (skills_root / "test-skill" / "SKILL.md").unlink()
+        assert "test-skill" not in load_catalog(skills_root)
+
+    def test_corrupt_cache_is_ignored(self, tmp_skill: Path):
+        skills_root = tmp_skill / "skills"
+        cache_path = catalog_cache_path(skills_root)
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text("{not json")
+        assert load_catalog(skills_root).names == ["test-skill"]
+        json.loads(cache_path.read_text())
+
+    def test_no_cache_writes_nothing(self, tmp_skill: Path):
+        skills_root = tmp_skill / "skills"
+        load_catalog(skills_root, use_cache=False)
+        assert not catalog_cache_path(skills_root).exists()
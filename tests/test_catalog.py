@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from agentskills import SkillCatalog
+
+
+class TestSkillCatalog:
+    def test_scan_own_and_curated(self, tmp_skill_with_curated: Path):
+        catalog = SkillCatalog.scan(tmp_skill_with_curated / "skills")
+        assert catalog.own == ["test-skill"]
+        assert catalog.curated == ["curated-skill"]
+        assert catalog.names == ["test-skill", "curated-skill"]
+        assert len(catalog) == 2
+
+    def test_own_shadows_curated(self, tmp_skill: Path):
+        curated = tmp_skill / "skills" / "curated" / "test-skill"
+        curated.mkdir(parents=True)
+        (curated / "SKILL.md").write_text("---\nname: test-skill\n---\n")
+        catalog = SkillCatalog.scan(tmp_skill / "skills")
+        assert catalog.names == ["test-skill"]
+        entry = catalog.get("test-skill")
+        assert entry is not None
+        assert not entry.curated
+        assert entry.path == tmp_skill / "skills" / "test-skill"
+
+    def test_resolve(self, tmp_skill_with_curated: Path):
+        skills_root = tmp_skill_with_curated / "skills"
+        catalog = SkillCatalog.scan(skills_root)
+        expected = skills_root / "curated" / "curated-skill"
+        assert catalog.resolve("curated-skill") == expected
+        assert "curated-skill" in catalog
+
+    def test_resolve_unknown_raises(self, tmp_skill: Path):
+        catalog = SkillCatalog.scan(tmp_skill / "skills")
+        with pytest.raises(RuntimeError, match="Skill not found: nope"):
+            catalog.resolve("nope")
+
+    def test_sorted_and_ignores_non_skills(self, tmp_path: Path):
+        skills_root = tmp_path / "skills"
+        for name in ("zeta", "alpha", "mid"):
+            (skills_root / name).mkdir(parents=True)
+            (skills_root / name / "SKILL.md").write_text("---\nname: x\n---\n")
+        (skills_root / "not-a-skill").mkdir()
+        (skills_root / "README.md").write_text("")
+        assert SkillCatalog.scan(skills_root).names == ["alpha", "mid", "zeta"]
+
+    def test_missing_root(self, tmp_path: Path):
+        assert len(SkillCatalog.scan(tmp_path / "nope")) == 0
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from agentskills.frontmatter import (
+    Frontmatter,
+    load_frontmatter,
+    parse_frontmatter_block,
+    parse_frontmatter_text,
+    read_frontmatter,
+    read_frontmatter_text,
+    read_frontmatters,
+)
+
+
+class TestReadFrontmatter:
+    def test_reads_fields(self, tmp_path: Path):
+        md = tmp_path / "SKILL.md"
+        md.write_text(
+            "---\nname: x\ndescription: 'Does x.'\nmetadata:\n  version: 1.2.3\n"
+            "---\n# Body\n"
+        )
+        assert read_frontmatter(md) == {
+            "name": "x",
+            "description": "Does x.",
+            "metadata": {"version": "1.2.3"},
+        }
+
+    def test_stops_at_closing_delimiter(self, tmp_path: Path):
+        md = tmp_path / "SKILL.md"
+        md.write_bytes(b"---\nname: x\n---\n" + b"\xff" * 100_000)
+        assert read_frontmatter_text(md) == "---\nname: x\n---\n"
+        assert read_frontmatter(md) == {"name": "x"}
+
+    def test_missing_frontmatter(self, tmp_path: Path):
+        md = tmp_path / "SKILL.md"
+        md.write_text("# Title\n")
+        assert read_frontmatter(md) == {}
+
+    def test_unterminated_frontmatter(self, tmp_path: Path):
+        md = tmp_path / "SKILL.md"
+        md.write_text("---\nname: x\n")
+        assert read_frontmatter(md) == {}
+
+    def test_missing_file(self, tmp_path: Path):
+        assert read_frontmatter(tmp_path / "SKILL.md") == {}
+
+    def test_read_many_preserves_order(self, tmp_path: Path):
+        paths = []
+        for i in range(50):
+            md = tmp_path / f"{i}.md"
+            md.write_text(f"---\nname: s{i}\n---\n")
+            paths.append(md)
+        results = read_frontmatters(paths)
+        assert [r["name"] for r in results] == [f"s{i}" for i in range(50)]
+
+
+class TestParseFrontmatterBlock:
+    def test_scalars(self):
+        block = (
+            "plain: some text # comment\n"
+            'double: "a: b\\tc"\n'
+            "single: 'it''s'\n"
+            "url: https://example.com/x\n"
+            "flag: true\n"
+            "count: 3\n"
+            "version: 1.10\n"
+            "empty:\n"
+        )
+        assert parse_frontmatter_block(block) == {
+            "plain": "some text",
+            "double": "a: b\tc",
+            "single": "it's",
+            "url": "https://example.com/x",
+            "flag": True,
+            "count": 3,
+            "version": "1.10",
+            "empty": None,
+        }
+
+    def test_block_scalars(self):
+        block = (
+            "literal: |\n"
+            "  line one\n"
+            "    indented\n"
+            "\n"
+            "folded: >-\n"
+            "  joined\n"
+            "  together\n"
+            "\n"
+            "  new paragraph\n"
+            "kept: |+\n"
+            "  x\n"
+            "\n"
+            "next: y\n"
+        )
+        assert parse_frontmatter_block(block) == {
+            "literal": "line one\n  indented\n",
+            "folded": "joined together\nnew paragraph",
+            "kept": "x\n\n",
+            "next": "y",
+        }
+
+    def test_multiline_scalars(self):
+        block = (
+            "description: A long description\n"
+            "  that wraps.\n"
+            'quoted: "first\n'
+            '  second"\n'
+        )
+        assert parse_frontmatter_block(block) == {
+            "description": "A long description that wraps.",
+            "quoted": "first second",
+        }
+
+    def test_lists_and_nested_mappings(self):
+        block = (
+            'tags: [a, "b, c", {k: v}]\n'
+            "metadata:\n"
+            "  version: 1.0.0\n"
+            "  authors:\n"
+            "    - alice\n"
+            "    - bob\n"
+            "hooks:\n"
+            "  PreToolUse:\n"
+            "    - matcher: Bash\n"
+            "      hooks:\n"
+            "        - type: command\n"
+            "          command: ./gate.sh\n"
+            "flat:\n"
+            "- one\n"
+            "- two\n"
+        )
+        assert parse_frontmatter_block(block) == {
+            "tags": ["a", "b, c", {"k": "v"}],
+            "metadata": {"version": "1.0.0", "authors": ["alice", "bob"]},
+            "hooks": {
+                "PreToolUse": [
+                    {
+                        "matcher": "Bash",
+                        "hooks": [{"type": "command", "command": "./gate.sh"}],
+                    }
+                ]
+            },
+            "flat": ["one", "two"],
+        }
+
+    @pytest.mark.parametrize(
+        "block",
+        [
+            "- not a mapping\n",
+            "name: x\nnot a key\n",
+            "tags: [a, b\n",
+            "name: 'open\n",
+            'name: "x" trailing\n',
+            "metadata:\n    version: 1\n  name: x\n",
+        ],
+    )
+    def test_invalid(self, block: str):
+        with pytest.raises(ValueError):
+            parse_frontmatter_block(block)
+
+    def test_text_ignores_delimiter_inside_values(self):
+        text = "---\nname: x\ndescription: a --- b\n---\nbody\n"
+        assert parse_frontmatter_text(text) == {
+            "name": "x",
+            "description": "a --- b",
+        }
+
+
+class TestLoadFrontmatter:
+    def test_typed_fields(self, tmp_path: Path):
+        md = tmp_path / "SKILL.md"
+        md.write_text(
+            "---\nname: x\ndescription: >\n  Does\n  x.\n"
+            "version: 0.0.1\nmetadata:\n  version: 1.2.3\n---\n"
+        )
+        frontmatter = load_frontmatter(md)
+        assert frontmatter.name == "x"
+        assert frontmatter.description == "Does x.\n"
+        assert frontmatter.version == "1.2.3"
+        assert frontmatter.metadata == {"version": "1.2.3"}
+
+    def test_from_data_ignores_non_scalars(self):
+        frontmatter = Frontmatter.from_data({"name": ["x"], "metadata": "1.0.0"})
+        assert frontmatter.name is None
+        assert frontmatter.version is None
+        assert frontmatter.metadata == {}
+
+    def test_does_not_read_body(self, tmp_path: Path):
+        md = tmp_path / "SKILL.md"
+        md.write_bytes(b"---\nname: x\n---\n" + b"\xff" * 1_000_000)
+        assert load_frontmatter(md).name == "x"
+
+    def test_missing(self, tmp_path: Path):
+        md = tmp_path / "SKILL.md"
+        md.write_text("# Title\n")
+        with pytest.raises(RuntimeError, match="Missing YAML frontmatter"):
+            load_frontmatter(md)
+
+    def test_unterminated(self, tmp_path: Path):
+        md = tmp_path / "SKILL.md"
+        md.write_text("---\nname: x\n")
+        with pytest.raises(RuntimeError, match="Invalid YAML frontmatter"):
+            load_frontmatter(md)
+
+    def test_invalid_yaml_reports_line(self, tmp_path: Path):
+        md = tmp_path / "SKILL.md"
+        md.write_text("---\nname: x\noops\n---\n")
+        with pytest.raises(RuntimeError, match="line 3"):
+            load_frontmatter(md)
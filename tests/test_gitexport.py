@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from agentskills.bootstrap import main
+from agentskills.gitexport import export_tree, list_skills
+
+
+def _git(*args: str, cwd: Path) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture()
+def origin(tmp_skill_with_curated: Path) -> Path:
+    """A committed skills repo with a script, a nested file and a shadowed skill."""
+    repo = tmp_skill_with_curated
+    skill = repo / "skills" / "test-skill"
+    (skill / "scripts").mkdir()
+    (skill / "scripts" / "run.sh").write_text("#!/bin/sh\necho hi\n")
+    os.chmod(skill / "scripts" / "run.sh", 0o755)
+    (skill / "references" / "deep").mkdir(parents=True)
+    (skill / "references" / "deep" / "notes.md").write_text("notes\n")
+    shadowed = repo / "skills" / "curated" / "test-skill"
+    shadowed.mkdir()
+    (shadowed / "SKILL.md").write_text("curated copy\n")
+    (repo / "skills" / "no-skill-md").mkdir()
+    (repo / "skills" / "no-skill-md" / "README.md").write_text("x\n")
+    _git("init", "-q", "-b", "main", cwd=repo)
+    _git("add", "-A", cwd=repo)
+    _git("commit", "-q", "-m", "init", cwd=repo)
+    return repo
+
+
+class TestListSkills:
+    def test_own_skills_shadow_curated(self, origin: Path):
+        skills = list_skills(origin, "HEAD")
+        assert skills == {
+            "test-skill": "skills/test-skill",
+            "curated-skill": "skills/curated/curated-skill",
+        }
+
+    def test_unknown_commit(self, origin: Path):
+        with pytest.raises(RuntimeError, match="Cannot list skills"):
+            list_skills(origin, "0" * 40)
+
+
+class TestExportTree:
+    def test_writes_files_and_modes(self, origin: Path, tmp_path: Path):
+        destination = tmp_path / "out"
+        count = export_tree(origin, "HEAD", "skills/test-skill", destination)
+
+        assert count == 3
+        source = origin / "skills" / "test-skill"
+        for rel in ("SKILL.md", "scripts/run.sh", "references/deep/notes.md"):
+            assert (destination / rel).read_bytes() == (source / rel).read_bytes()
+        assert os.access(destination / "scripts" / "run.sh", os.X_OK)
+        assert not os.access(destination / "SKILL.md", os.X_OK)
+
+    def test_reads_the_commit_not_the_worktree(self, origin: Path, tmp_path: Path):
+        commit = _git("rev-parse", "HEAD", cwd=origin)
+        (origin / "skills" / "test-skill" / "SKILL.md").write_text("edited\n")
+        export_tree(origin, commit, "skills/test-skill", tmp_path / "out")
+        assert (tmp_path / "out" / "SKILL.md").read_text() != "edited\n"
+
+    def test_internal_links_are_copied(self, origin: Path, tmp_path: Path):
+        skill = origin / "skills" / "test-skill"
+        (skill / "notes.md").symlink_to("references/deep/notes.md")
+        (skill / "refs").symlink_to("references", target_is_directory=True)
+        (skill / "alias.md").symlink_to("notes.md")
+        _git("add", "-A", cwd=origin)
+        _git("commit", "-q", "-m", "links", cwd=origin)
+
+        destination = tmp_path / "out"
+        export_tree(origin, "HEAD", "skills/test-skill", destination)
+        for rel in ("notes.md", "alias.md", "refs/deep/notes.md"):
+            assert not (destination / rel).is_symlink()
+            assert (destination / rel).read_text() == "notes\n"
+        assert not (destination / "refs").is_symlink()
+
+    def test_escaping_link_is_refused(self, origin: Path, tmp_path: Path):
+        (origin / "shared.md").write_text("shared\n")
+        link = origin / "skills" / "test-skill" / "shared.md"
+        link.symlink_to("../../shared.md")
+        _git("add", "-A", cwd=origin)
+        _git("commit", "-q", "-m", "escape", cwd=origin)
+
+        with pytest.raises(RuntimeError, match="points outside skills/test-skill"):
+            export_tree(origin, "HEAD", "skills/test-skill", tmp_path / "out")
+
+    def test_missing_path(self, origin: Path, tmp_path: Path):
+        with pytest.raises(RuntimeError, match="git archive"):
+            export_tree(origin, "HEAD", "skills/nope", tmp_path / "out")
+
+
+class TestNoCheckoutBootstrap:
+    def _run(self, monkeypatch, origin: Path, tmp_path: Path, *args: str) -> int:
+        monkeypatch.setattr(
+            "sys.argv",
+            [
+                "agentskills",
+                "--project",
+                str(tmp_path / "project"),
+                "--repo-url",
+                f"file://{origin}",
+                "--cache-dir",
+                str(tmp_path / "cache"),
+                "--no-checkout",
+                *args,
+            ],
+        )
+        return main()
+
+    def test_installs_without_worktree(self, origin: Path, tmp_path: Path, monkeypatch):
+        assert self._run(monkeypatch, origin, tmp_path, "--all") == 0
+
+        skills = tmp_path / "project" / ".agents" / "skills"
+        assert (skills / "test-skill" / "scripts" / "run.sh").exists()
+        assert (skills / "curated-skill" / "SKILL.md").exists()
+        assert not any(
+            p.name.endswith("-worktrees") for p in (tmp_path / "cache").iterdir()
+        )
+        lock = json.loads((skills.parent / "skills.lock").read_text())
+        assert lock["source"]["commit"] == _git("rev-parse", "HEAD", cwd=origin)
+        assert set(lock["skills"]) == {"test-skill", "curated-skill"}
+
+    def test_rerun_is_up_to_date(
+        self, origin: Path, tmp_path: Path, monkeypatch, capsys
+    ):
+        assert self._run(monkeypatch, origin, tmp_path, "--skill", "test-skill") == 0
+        capsys.readouterr()
+        assert self._run(monkeypatch, origin, tmp_path, "--skill", "test-skill") == 0
+        assert "up to date" in capsys.readouterr().out
+
+    def test_frozen_reexports_pinned_commit(
+        self, origin: Path, tmp_path: Path, monkeypatch
+    ):
+        assert self._run(monkeypatch, origin, tmp_path, "--skill", "test-skill") == 0
+        installed = tmp_path / "project" / ".agents" / "skills" / "test-skill"
+        (installed / "SKILL.md").write_text("drifted\n")
+
+        assert self._run(monkeypatch, origin, tmp_path, "--frozen") == 0
+        source = origin / "skills" / "test-skill" / "SKILL.md"
+        assert (installed / "SKILL.md").read_bytes() == source.read_bytes()
+
+    def test_unknown_skill(self, origin: Path, tmp_path: Path, monkeypatch, capsys):
+        assert self._run(monkeypatch, origin, tmp_path, "--skill", "nope") == 1
+        assert "Unknown skill(s): nope" in capsys.readouterr().err
+
+    def test_requires_copy_mode(
+        self, origin: Path, tmp_path: Path, monkeypatch, capsys
+    ):
+        args = ("--all", "--mode", "symlink")
+        assert self._run(monkeypatch, origin, tmp_path, *args) == 1
+        assert "copy mode" in capsys.readouterr().err
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 from agentskills.list import main
@@ -59,3 +60,35 @@ class TestListCommand:
         assert result == 0
         out = capsys.readouterr().out
         assert "test-skill" in out
+
+    def test_long_output(self, tmp_skill_with_curated: Path, capsys, monkeypatch):
+        monkeypatch.setattr(
+            "sys.argv",
+            ["agentskills list", "--repo-path", str(tmp_skill_with_curated), "--long"],
+        )
+        assert main() == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].split()[:4] == ["NAME", "VERSION", "SOURCE", "SIZE"]
+        assert lines[1].split()[:3] == ["test-skill", "1.0.0", "own"]
+        assert lines[2].split()[:3] == ["curated-skill", "0.5.0", "curated"]
+
+    def test_json_output(self, tmp_skill_with_curated: Path, capsys, monkeypatch):
+        monkeypatch.setattr(
+            "sys.argv",
+            ["agentskills list", "--repo-path", str(tmp_skill_with_curated), "--json"],
+        )
+        assert main() == 0
+        details = json.loads(capsys.readouterr().out)
+        assert [d["name"] for d in details] == ["test-skill", "curated-skill"]
+        assert details[0]["version"] == "1.0.0"
+        assert details[1]["source"] == "curated"
+        skill_md = tmp_skill_with_curated / "skills" / "test-skill" / "SKILL.md"
+        assert details[0]["size"] == skill_md.stat().st_size
+
+    def test_json_no_skills(self, tmp_path: Path, capsys, monkeypatch):
+        monkeypatch.setattr(
+            "sys.argv",
+            ["agentskills list", "--repo-path", str(tmp_path), "--json"],
+        )
+        assert main() == 1
+        assert json.loads(capsys.readouterr().out) == []
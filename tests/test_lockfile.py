@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from agentskills.bootstrap import main
+from agentskills.lockfile import hash_tree, verify_lock
+
+
+def _git(*args: str, cwd: Path) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture()
+def source_repo(tmp_skill_with_curated: Path) -> Path:
+    """Commit tmp_skill_with_curated so the lock can pin a clean commit."""
+    _git("init", "-q", "-b", "main", cwd=tmp_skill_with_curated)
+    _git("add", "-A", cwd=tmp_skill_with_curated)
+    _git("commit", "-q", "-m", "init", cwd=tmp_skill_with_curated)
+    return tmp_skill_with_curated
+
+
+@pytest.fixture()
+def project(tmp_path: Path) -> Path:
+    return tmp_path / "project"
+
+
+def _run(monkeypatch, project: Path, *args: str) -> int:
+    monkeypatch.setattr("sys.argv", ["agentskills", "--project", str(project), *args])
+    return main()
+
+
+def _install(monkeypatch, project: Path, repo: Path) -> int:
+    return _run(monkeypatch, project, "--repo-path", str(repo), "--skill", "test-skill")
+
+
+class TestLockfile:
+    def test_install_writes_lock(self, source_repo: Path, project: Path, monkeypatch):
+        assert _install(monkeypatch, project, source_repo) == 0
+        lock = json.loads((project / ".agents" / "skills.lock").read_text())
+        assert lock["mode"] == "copy"
+        assert lock["source"]["path"] == str(source_repo)
+        assert len(lock["source"]["commit"]) == 40
+        files = lock["skills"]["test-skill"]["files"]
+        assert files == hash_tree(source_repo / "skills" / "test-skill")
+
+    def test_rerun_is_a_noop(
+        self, source_repo: Path, project: Path, capsys, monkeypatch
+    ):
+        _install(monkeypatch, project, source_repo)
+        skill_md = project / ".agents" / "skills" / "test-skill" / "SKILL.md"
+        inode = skill_md.stat().st_ino
+        assert _install(monkeypatch, project, source_repo) == 0
+        assert "up to date" in capsys.readouterr().out
+        assert skill_md.stat().st_ino == inode
+
+    def test_dirty_source_is_not_a_noop(
+        self, source_repo: Path, project: Path, capsys, monkeypatch
+    ):
+        _install(monkeypatch, project, source_repo)
+        (source_repo / "skills" / "test-skill" / "extra.md").write_text("x")
+        assert _install(monkeypatch, project, source_repo) == 1
+        assert "already exists" in capsys.readouterr().err
+
+    def test_adding_a_skill_keeps_existing_entries(
+        self, source_repo: Path, project: Path, monkeypatch
+    ):
+        _install(monkeypatch, project, source_repo)
+        args = ("--repo-path", str(source_repo), "--skill", "curated-skill")
+        assert _run(monkeypatch, project, *args) == 0
+        lock = json.loads((project / ".agents" / "skills.lock").read_text())
+        assert sorted(lock["skills"]) == ["curated-skill", "test-skill"]
+
+    def test_verify_detects_drift(
+        self, source_repo: Path, project: Path, capsys, monkeypatch
+    ):
+        _install(monkeypatch, project, source_repo)
+        assert _run(monkeypatch, project, "--verify") == 0
+        skill_md = project / ".agents" / "skills" / "test-skill" / "SKILL.md"
+        skill_md.write_text(skill_md.read_text().upper())
+        assert _run(monkeypatch, project, "--verify") == 1
+        assert "sha256 mismatch" in capsys.readouterr().out
+
+    def test_verify_without_lock_fails(self, project: Path, capsys, monkeypatch):
+        assert _run(monkeypatch, project, "--verify") == 1
+        assert "No lockfile" in capsys.readouterr().err
+
+
+class TestFrozen:
+    def test_restores_pinned_skills(
+        self, source_repo: Path, project: Path, monkeypatch
+    ):
+        _install(monkeypatch, project, source_repo)
+        installed = project / ".agents" / "skills" / "test-skill"
+        (installed / "SKILL.md").write_text("tampered")
+        assert _run(monkeypatch, project, "--frozen") == 0
+        lock = json.loads((project / ".agents" / "skills.lock").read_text())
+        assert verify_lock(lock, project / ".agents" / "skills") == []
+
+    def test_fails_when_source_drifted(
+        self, source_repo: Path, project: Path, capsys, monkeypatch
+    ):
+        _install(monkeypatch, project, source_repo)
+        (source_repo / "skills" / "test-skill" / "SKILL.md").write_text("changed")
+        assert _run(monkeypatch, project, "--frozen") == 1
+        assert "does not match skills.lock" in capsys.readouterr().err
+
+    def test_rejects_skill_selection(
+        self, source_repo: Path, project: Path, capsys, monkeypatch
+    ):
+        _install(monkeypatch, project, source_repo)
+        assert _run(monkeypatch, project, "--frozen", "--all") == 1
+        assert "--frozen installs what skills.lock pins" in capsys.readouterr().err
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from agentskills.manifest import ProjectSpec, read_projects_file
+
+
+class TestReadProjectsFile:
+    def test_text_manifest(self, tmp_path: Path):
+        manifest = tmp_path / "projects.txt"
+        manifest.write_text("# fleet\napi\n\n/abs/web\n")
+        assert read_projects_file(manifest) == [
+            ProjectSpec(tmp_path / "api", None),
+            ProjectSpec(Path("/abs/web"), None),
+        ]
+
+    def test_toml_manifest(self, tmp_path: Path):
+        manifest = tmp_path / "projects.toml"
+        manifest.write_text(
+            'skills = ["test-skill"]\n'
+            '[[projects]]\npath = "api"\n'
+            '[[projects]]\npath = "web"\nskills = "all"\n'
+        )
+        assert read_projects_file(manifest) == [
+            ProjectSpec(tmp_path / "api", ["test-skill"]),
+            ProjectSpec(tmp_path / "web", "all"),
+        ]
+
+    def test_toml_rejects_bad_skills(self, tmp_path: Path):
+        manifest = tmp_path / "projects.toml"
+        manifest.write_text('[[projects]]\npath = "api"\nskills = 3\n')
+        with pytest.raises(RuntimeError, match="skills must be"):
+            read_projects_file(manifest)
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import os
+import tarfile
 from pathlib import Path
+from zipfile import ZIP_BZIP2, ZIP_DEFLATED, ZIP_LZMA, ZIP_STORED, ZipFile
 
 import pytest
 
+from agentskills.archive import extract_skill
 from agentskills.package import (
     iter_skill_files,
+    main,
     package_skill,
     parse_frontmatter,
+    read_tree_hash,
 )
 
 
@@ -46,6 +52,20 @@ class TestParseFrontmatter:
         with pytest.raises(RuntimeError, match="not semver"):
             parse_frontmatter(md)
 
+    def test_yaml_subset(self, tmp_path: Path):
+        md = tmp_path / "SKILL.md"
+        md.write_text(
+            "---\nname: 'x'\ndescription: |\n  version: 9.9.9\n"
+            'metadata:\n  tags: [a, b]\n  version: "1.0.0"  # pinned\n---\nbody\n'
+        )
+        assert parse_frontmatter(md) == ("x", "1.0.0")
+
+    def test_invalid_yaml(self, tmp_path: Path):
+        md = tmp_path / "SKILL.md"
+        md.write_text("---\nname: [x\n---\nbody\n")
+        with pytest.raises(RuntimeError, match="Invalid YAML frontmatter"):
+            parse_frontmatter(md)
+
 
 class TestIterSkillFiles:
     def test_lists_files(self, tmp_path: Path):
@@ -71,6 +91,15 @@ class TestIterSkillFiles:
         files = iter_skill_files(tmp_path)
         assert all(f.name != ".DS_Store" for f in files)
 
+    def test_honours_skillignore(self, tmp_path: Path):
+        (tmp_path / "SKILL.md").write_text("hi")
+        (tmp_path / "draft.md").write_text("")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "dep.js").write_text("")
+        (tmp_path / ".skillignore").write_text("draft.md\n")
+        files = iter_skill_files(tmp_path)
+        assert [f.name for f in files] == ["SKILL.md"]
+
 
 class TestPackageSkill:
     def test_creates_archive(self, tmp_skill: Path):
@@ -97,3 +126,216 @@ class TestPackageSkill:
         assert archive.exists()
         assert name == "curated-skill"
         assert version == "0.5.0"
+
+
+class TestReproducibleArchives:
+    @pytest.fixture()
+    def skill(self, tmp_skill: Path) -> Path:
+        skill_dir = tmp_skill / "skills" / "test-skill"
+        (skill_dir / "scripts").mkdir()
+        (skill_dir / "scripts" / "run.sh").write_text("#!/bin/sh\n")
+        os.chmod(skill_dir / "scripts" / "run.sh", 0o775)
+        (skill_dir / "a.md").write_text("a\n")
+        os.chmod(skill_dir / "a.md", 0o600)
+        return skill_dir
+
+    def test_same_tree_same_bytes(self, tmp_skill: Path, skill: Path):
+        first, _, _ = package_skill("test-skill", tmp_skill, output_dir="one")
+        for path in skill.rglob("*"):
+            os.utime(path, (1_700_000_000, 1_700_000_000))
+        second, _, _ = package_skill("test-skill", tmp_skill, output_dir="two")
+        assert first.read_bytes() == second.read_bytes()
+
+    def test_entries_are_normalised(self, tmp_skill: Path, skill: Path):
+        archive, _, _ = package_skill("test-skill", tmp_skill)
+        with ZipFile(archive) as zf:
+            infos = zf.infolist()
+        names = [info.filename for info in infos]
+        assert names == sorted(names)
+        assert {info.date_time for info in infos} == {(1980, 1, 1, 0, 0, 0)}
+        modes = {info.filename: (info.external_attr >> 16) & 0o777 for info in infos}
+        assert modes["test-skill/scripts/run.sh"] == 0o755
+        assert modes["test-skill/a.md"] == 0o644
+
+    def test_source_date_epoch(self, tmp_skill: Path, skill: Path, monkeypatch):
+        monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+        archive, _, _ = package_skill("test-skill", tmp_skill)
+        with ZipFile(archive) as zf:
+            assert zf.infolist()[0].date_time == (2023, 11, 14, 22, 13, 20)
+
+    def test_unchanged_tree_is_not_rewritten(self, tmp_skill: Path, skill: Path):
+        archive, _, _ = package_skill("test-skill", tmp_skill)
+        before = archive.stat()
+        assert read_tree_hash(archive)
+
+        package_skill("test-skill", tmp_skill, overwrite=True)
+        after = archive.stat()
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+
+    def test_settings_change_rewrites(self, tmp_skill: Path, skill: Path, monkeypatch):
+        archive, _, _ = package_skill("test-skill", tmp_skill)
+        hashes = {read_tree_hash(archive)}
+        package_skill("test-skill", tmp_skill, overwrite=True, level=1)
+        hashes.add(read_tree_hash(archive))
+
+        monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+        package_skill("test-skill", tmp_skill, overwrite=True, level=1)
+        hashes.add(read_tree_hash(archive))
+        assert len(hashes) == 3
+        with ZipFile(archive) as zf:
+            assert zf.infolist()[0].date_time == (2023, 11, 14, 22, 13, 20)
+
+    def test_changed_tree_is_rewritten(self, tmp_skill: Path, skill: Path):
+        archive, _, _ = package_skill("test-skill", tmp_skill)
+        old_hash = read_tree_hash(archive)
+
+        os.chmod(skill / "a.md", 0o755)
+        package_skill("test-skill", tmp_skill, overwrite=True)
+        assert read_tree_hash(archive) != old_hash
+        with ZipFile(archive) as zf:
+            assert (zf.getinfo("test-skill/a.md").external_attr >> 16) & 0o777 == 0o755
+
+
+class TestPackageMany:
+    def _run(self, monkeypatch, repo: Path, *args: str) -> int:
+        monkeypatch.setattr(
+            "sys.argv", ["agentskills", "--repo-root", str(repo), *args]
+        )
+        return main()
+
+    def test_all_in_worker_processes(
+        self, tmp_skill_with_curated: Path, monkeypatch, capsys
+    ):
+        repo = tmp_skill_with_curated
+        assert self._run(monkeypatch, repo, "--all", "--jobs", "2") == 0
+
+        out = capsys.readouterr().out
+        assert "test-skill-v1.0.0.skill: 1 files" in out
+        assert "curated-skill-v0.5.0.skill: 1 files" in out
+        assert "done: 2 archives" in out
+        assert (repo / "dist" / "test-skill-v1.0.0.skill").exists()
+        assert (repo / "dist" / "curated-skill-v0.5.0.skill").exists()
+
+    def test_skills_list_and_unchanged(
+        self, tmp_skill_with_curated: Path, monkeypatch, capsys
+    ):
+        repo = tmp_skill_with_curated
+        args = ("--skills", "test-skill,curated-skill", "--jobs", "1")
+        assert self._run(monkeypatch, repo, *args) == 0
+        capsys.readouterr()
+
+        assert self._run(monkeypatch, repo, *args, "--overwrite") == 0
+        assert capsys.readouterr().out.count("(unchanged)") == 2
+
+    def test_failures_are_reported(
+        self, tmp_skill_with_curated: Path, monkeypatch, capsys
+    ):
+        repo = tmp_skill_with_curated
+        assert self._run(monkeypatch, repo, "--skills", "test-skill") == 0
+        capsys.readouterr()
+
+        assert self._run(monkeypatch, repo, "--all", "--jobs", "2") == 1
+        captured = capsys.readouterr()
+        assert "! test-skill: Package already exists" in captured.out
+        assert "done: 1 archives" in captured.out
+        assert "1 skill(s) failed" in captured.err
+
+    def test_unknown_skill(self, tmp_skill: Path, monkeypatch, capsys):
+        assert self._run(monkeypatch, tmp_skill, "--skills", "nope") == 1
+        assert "Unknown skill(s): nope" in capsys.readouterr().err
+
+    def test_needs_exactly_one_selection(self, tmp_skill: Path, monkeypatch, capsys):
+        assert self._run(monkeypatch, tmp_skill, "test-skill", "--all") == 1
+        assert "Give one skill" in capsys.readouterr().err
+        assert self._run(monkeypatch, tmp_skill) == 1
+
+
+class TestCodecs:
+    @pytest.fixture()
+    def skill(self, tmp_skill: Path) -> Path:
+        skill_dir = tmp_skill / "skills" / "test-skill"
+        (skill_dir / "assets").mkdir()
+        (skill_dir / "assets" / "logo.PNG").write_bytes(b"\x89PNG" + b"x" * 4096)
+        (skill_dir / "assets" / "shell.html").write_text("<div></div>\n" * 500)
+        return skill_dir
+
+    def test_compressed_assets_are_stored(self, tmp_skill: Path, skill: Path):
+        archive, _, _ = package_skill("test-skill", tmp_skill)
+        with ZipFile(archive) as zf:
+            logo = zf.getinfo("test-skill/assets/logo.PNG")
+            shell = zf.getinfo("test-skill/assets/shell.html")
+        assert logo.compress_type == ZIP_STORED
+        assert shell.compress_type == ZIP_DEFLATED
+        assert shell.compress_size < shell.file_size
+
+    def test_level_is_applied(self, tmp_skill: Path, skill: Path):
+        text = "".join(f"line {i * 7919 % 10007}\n" for i in range(20000))
+        (skill / "assets" / "data.txt").write_text(text)
+        sizes = {}
+        for level in (0, 9):
+            archive, _, _ = package_skill(
+                "test-skill", tmp_skill, output_dir=f"l{level}", level=level
+            )
+            with ZipFile(archive) as zf:
+                info = zf.getinfo("test-skill/assets/data.txt")
+                sizes[level] = info.compress_size
+                assert zf.read(info).decode() == text
+        assert sizes[9] < sizes[0]
+
+    @pytest.mark.parametrize(
+        ("codec", "method"), [("bzip2", ZIP_BZIP2), ("lzma", ZIP_LZMA)]
+    )
+    def test_zip_codecs_install(
+        self, tmp_skill: Path, skill: Path, tmp_path: Path, codec: str, method: int
+    ):
+        archive, _, _ = package_skill("test-skill", tmp_skill, codec=codec)
+        assert archive.name == "test-skill-v1.0.0.skill"
+        with ZipFile(archive) as zf:
+            assert zf.getinfo("test-skill/SKILL.md").compress_type == method
+
+        extract_skill(archive, "test-skill", tmp_path / "installed")
+        html = tmp_path / "installed" / "test-skill" / "assets" / "shell.html"
+        assert html.read_bytes() == (skill / "assets" / "shell.html").read_bytes()
+
+    def test_tar_xz(self, tmp_skill: Path, skill: Path):
+        archive, _, _ = package_skill("test-skill", tmp_skill, codec="tar.xz")
+        assert archive.name == "test-skill-v1.0.0.tar.xz"
+        with tarfile.open(archive, "r:xz") as tar:
+            members = tar.getmembers()
+        names = [member.name for member in members]
+        assert names == sorted(names)
+        assert {member.mtime for member in members} == {315532800}
+        assert {member.uid for member in members} == {0}
+
+        before = archive.read_bytes()
+        digest = read_tree_hash(archive)
+        assert digest
+        archive.unlink()
+        package_skill("test-skill", tmp_skill, codec="tar.xz")
+        assert archive.read_bytes() == before
+
+        mtime = archive.stat().st_mtime_ns
+        package_skill("test-skill", tmp_skill, codec="tar.xz", overwrite=True)
+        assert archive.stat().st_mtime_ns == mtime
+
+    def test_codec_change_rewrites(self, tmp_skill: Path, skill: Path):
+        archive, _, _ = package_skill("test-skill", tmp_skill)
+        package_skill("test-skill", tmp_skill, overwrite=True, codec="lzma")
+        with ZipFile(archive) as zf:
+            assert zf.getinfo("test-skill/SKILL.md").compress_type == ZIP_LZMA
+
+    def test_codec_report(self, tmp_skill: Path, skill: Path, monkeypatch, capsys):
+        monkeypatch.setattr(
+            "sys.argv",
+            ["agentskills", "--repo-root", str(tmp_skill), "--all", "--codec-report"],
+        )
+        assert main() == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert [line.split()[0] for line in lines] == [
+            "codec",
+            "deflate",
+            "bzip2",
+            "lzma",
+            "tar.xz",
+        ]
+        assert not (tmp_skill / "dist").exists()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from agentskills.link import main
+from agentskills.reconcile import discover_projects
+
+HARNESS_LINKS = (".claude/skills", ".opencode/skills", ".amp/skills")
+
+
+def _project(path: Path) -> Path:
+    (path / ".agents" / "skills").mkdir(parents=True)
+    return path
+
+
+@pytest.fixture()
+def fleet(tmp_path: Path) -> Path:
+    """A root with three projects, a non-project and a hidden project."""
+    root = tmp_path / "fleet"
+    for name in ("api", "web", "group/worker"):
+        _project(root / name)
+    (root / "notes").mkdir()
+    _project(root / "node_modules" / "vendored")
+    _project(root / ".cache" / "hidden")
+    return root
+
+
+def _run(monkeypatch, *args: str) -> int:
+    monkeypatch.setattr("sys.argv", ["agentskills", *args])
+    return main()
+
+
+class TestDiscoverProjects:
+    def test_finds_projects_and_skips_hidden_and_vendored(self, fleet: Path):
+        found = discover_projects(fleet, ".agents/skills")
+        assert found == [fleet / "api", fleet / "group" / "worker", fleet / "web"]
+
+    def test_does_not_descend_into_projects(self, fleet: Path):
+        _project(fleet / "api" / "nested")
+        assert fleet / "api" / "nested" not in discover_projects(
+            fleet, ".agents/skills"
+        )
+
+
+class TestReconcile:
+    def test_links_every_project(self, fleet: Path, monkeypatch, capsys):
+        assert _run(monkeypatch, "--root", str(fleet)) == 0
+
+        for name in ("api", "web", "group/worker"):
+            for rel in HARNESS_LINKS:
+                link = fleet / name / rel
+                assert link.is_symlink()
+                assert link.resolve() == (fleet / name / ".agents" / "skills")
+        assert "9 created" in capsys.readouterr().out
+
+    def test_second_run_changes_nothing(self, fleet: Path, monkeypatch, capsys):
+        assert _run(monkeypatch, "--root", str(fleet)) == 0
+        link = fleet / "api" / ".claude" / "skills"
+        before = os.lstat(link).st_ino
+        capsys.readouterr()
+
+        assert _run(monkeypatch, "--root", str(fleet)) == 0
+        assert os.lstat(link).st_ino == before
+        assert "0 created, 0 replaced, 9 unchanged" in capsys.readouterr().out
+
+    def test_dry_run_prints_json_plan(self, fleet: Path, monkeypatch, capsys):
+        (fleet / "api" / ".claude").mkdir()
+        (fleet / "api" / ".claude" / "skills").symlink_to("elsewhere")
+        args = ("--root", str(fleet), "--harness", "anthropic", "--dry-run")
+        assert _run(monkeypatch, *args) == 1
+
+        plan = json.loads(capsys.readouterr().out)
+        assert plan["harnesses"] == ["anthropic"]
+        assert plan["summary"]["create"] == 2
+        assert plan["summary"]["conflict"] == 1
+        api = next(p for p in plan["projects"] if p["project"].endswith("api"))
+        step = api["links"]["anthropic"]
+        assert step["action"] == "conflict"
+        assert step["current"] == "symlink -> elsewhere"
+        assert step["target"] == os.path.join("..", ".agents", "skills")
+        assert not (fleet / "web" / ".claude").exists()
+
+    def test_conflict_needs_force(self, fleet: Path, monkeypatch, capsys):
+        (fleet / "web" / ".amp" / "skills").mkdir(parents=True)
+        assert _run(monkeypatch, "--root", str(fleet), "--harness", "amp") == 1
+        assert "use --force" in capsys.readouterr().out
+        assert (fleet / "api" / ".amp" / "skills").is_symlink()
+        assert not (fleet / "web" / ".amp" / "skills").is_symlink()
+
+        args = ("--root", str(fleet), "--harness", "amp", "--force")
+        assert _run(monkeypatch, *args) == 0
+        assert (fleet / "web" / ".amp" / "skills").is_symlink()
+
+    def test_repeated_project_and_missing_canonical(
+        self, fleet: Path, tmp_path: Path, monkeypatch, capsys
+    ):
+        bare = tmp_path / "bare"
+        bare.mkdir()
+        args = ("--project", str(fleet / "api"), "--project", str(bare))
+        assert _run(monkeypatch, *args) == 1
+        captured = capsys.readouterr()
+        assert "Canonical skills directory is missing" in captured.out
+        assert (fleet / "api" / ".claude" / "skills").is_symlink()
+
+    def test_projects_file(self, fleet: Path, tmp_path: Path, monkeypatch):
+        manifest = tmp_path / "projects.txt"
+        manifest.write_text(f"{fleet / 'api'}\n# comment\n{fleet / 'web'}\n")
+        assert _run(monkeypatch, "--projects-file", str(manifest)) == 0
+        assert (fleet / "web" / ".opencode" / "skills").is_symlink()
+        assert not (fleet / "group" / "worker" / ".opencode").exists()
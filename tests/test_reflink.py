@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import errno
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from agentskills.bootstrap import install_skill
+from agentskills.reflink import Cloner
+
+
+def _unsupported(*args, **kwargs):
+    raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+
+@pytest.fixture()
+def tree(tmp_path: Path) -> Path:
+    root = tmp_path / "src"
+    (root / "scripts").mkdir(parents=True)
+    (root / "SKILL.md").write_text("---\nname: demo\n---\n" + "x" * 100_000)
+    (root / "scripts" / "run.sh").write_text("#!/bin/sh\n")
+    (root / "scripts" / "run.sh").chmod(0o755)
+    return root
+
+
+class TestCloner:
+    def test_clone_tree_copies_content_and_mode(self, tree: Path, tmp_path: Path):
+        cloner = Cloner()
+        cloner.clone_tree(tree, tmp_path / "dst")
+        assert (tmp_path / "dst" / "SKILL.md").read_bytes() == (
+            tree / "SKILL.md"
+        ).read_bytes()
+        run = tmp_path / "dst" / "scripts" / "run.sh"
+        assert stat.S_IMODE(run.stat().st_mode) == 0o755
+        assert sum(cloner.methods.values()) == 2
+
+    def test_falls_back_to_copy_file_range(
+        self, tree: Path, tmp_path: Path, monkeypatch
+    ):
+        if not hasattr(os, "copy_file_range"):
+            pytest.skip("os.copy_file_range not available")
+        monkeypatch.setattr("agentskills.reflink._ficlone", _unsupported)
+        cloner = Cloner()
+        cloner.clone_tree(tree, tmp_path / "dst")
+        assert cloner.summary() == "copy_file_range=2"
+
+    def test_falls_back_to_plain_copy(self, tree: Path, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr("agentskills.reflink._ficlone", _unsupported)
+        monkeypatch.setattr("agentskills.reflink._copy_file_range", _unsupported)
+        cloner = Cloner()
+        cloner.clone_tree(tree, tmp_path / "dst")
+        assert cloner.summary() == "copy=2"
+        assert (tmp_path / "dst" / "SKILL.md").read_bytes() == (
+            tree / "SKILL.md"
+        ).read_bytes()
+
+    def test_unexpected_errors_propagate(self, tree: Path, tmp_path: Path, monkeypatch):
+        def no_space(*args, **kwargs):
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        monkeypatch.setattr("agentskills.reflink._ficlone", no_space)
+        cloner = Cloner()
+        cloner._disabled.discard("ficlone")
+        with pytest.raises(OSError, match="No space"):
+            cloner.clone_file(tree / "SKILL.md", tmp_path / "out")
+
+
+def test_install_skill_reflink_mode(tmp_skill: Path, tmp_path: Path):
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    cloner = Cloner()
+    result = install_skill(
+        "test-skill", tmp_skill / "skills", dest, "reflink", False, cloner=cloner
+    )
+    assert not result.is_symlink()
+    assert (result / "SKILL.md").read_text().startswith("---")
+    assert sum(cloner.methods.values()) == 1
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from agentskills import SkillCatalog
+from agentskills.search import (
+    index_path,
+    main,
+    open_index,
+    refresh_index,
+    search_index,
+    tokenize,
+)
+
+OLD_NS = 1_000_000_000_000_000_000
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    os.utime(path, ns=(OLD_NS, OLD_NS))
+
+
+def _age_dirs(root: Path, ns: int = OLD_NS) -> None:
+    """Backdate every directory under root out of the racy window."""
+    for dirpath, _dirnames, _filenames in os.walk(root):
+        os.utime(dirpath, ns=(ns, ns))
+
+
+@pytest.fixture()
+def search_repo(tmp_path: Path) -> Path:
+    skills = tmp_path / "skills"
+    _write(
+        skills / "architect" / "SKILL.md",
+        "---\nname: architect\ndescription: Clean architecture boundaries\n---\n"
+        "Keep dependencies pointing inward.\n",
+    )
+    _write(
+        skills / "architect" / "references" / "gateway.md",
+        "# Gateway\nA gateway abstraction hides the database.\n",
+    )
+    _write(
+        skills / "curated" / "tdd" / "SKILL.md",
+        "---\nname: tdd\ndescription: Test driven development\n---\n"
+        "Write the failing test first.\n",
+    )
+    return tmp_path
+
+
+def _index(repo: Path):
+    skills_root = repo / "skills"
+    conn = open_index(skills_root)
+    refresh_index(conn, SkillCatalog.scan(skills_root))
+    return conn
+
+
+class TestTokenize:
+    def test_lowercases_and_splits(self):
+        assert tokenize("Clean-Architecture, TDD!") == ["clean", "architecture", "tdd"]
+
+    def test_drops_stopwords_and_single_chars(self):
+        assert tokenize("a test of the x system") == ["test", "system"]
+
+
+class TestSearchIndex:
+    def test_ranks_matching_skill(self, search_repo: Path):
+        conn = _index(search_repo)
+        hits = search_index(conn, "test driven")
+        assert hits[0].skill == "tdd"
+        assert hits[0].path == os.path.join("curated", "tdd", "SKILL.md")
+
+    def test_indexes_references(self, search_repo: Path):
+        conn = _index(search_repo)
+        hits = search_index(conn, "database gateway")
+        assert hits[0].kind == "reference"
+        assert hits[0].skill == "architect"
+
+    def test_frontmatter_boost(self, search_repo: Path):
+        conn = _index(search_repo)
+        hits = search_index(conn, "architecture")
+        assert hits[0].kind == "skill"
+
+    def test_no_match(self, search_repo: Path):
+        conn = _index(search_repo)
+        assert search_index(conn, "kubernetes") == []
+
+    def test_incremental_refresh(self, search_repo: Path):
+        skills_root = search_repo / "skills"
+        conn = _index(search_repo)
+        catalog = SkillCatalog.scan(skills_root)
+        assert refresh_index(conn, catalog) == 0
+
+        gateway = skills_root / "architect" / "references" / "gateway.md"
+        _write(gateway, "# Gateway\nNow about kubernetes.\n")
+        os.utime(gateway, ns=(OLD_NS + 10**9, OLD_NS + 10**9))
+        assert refresh_index(conn, catalog) == 1
+        assert search_index(conn, "kubernetes")[0].kind == "reference"
+        assert search_index(conn, "database") == []
+
+    def test_removed_files_are_dropped(self, search_repo: Path):
+        skills_root = search_repo / "skills"
+        conn = _index(search_repo)
+        (skills_root / "architect" / "references" / "gateway.md").unlink()
+        assert refresh_index(conn, SkillCatalog.scan(skills_root)) == 1
+        assert search_index(conn, "gateway") == []
+
+    def test_index_persists(self, search_repo: Path):
+        _index(search_repo).close()
+        conn = open_index(search_repo / "skills")
+        assert search_index(conn, "failing test")[0].skill == "tdd"
+
+    def test_concurrent_refreshes(self, search_repo: Path):
+        skills_root = search_repo / "skills"
+        open_index(skills_root).close()
+        catalog = SkillCatalog.scan(skills_root)
+        barrier = threading.Barrier(4)
+
+        def refresh(_):
+            conn = open_index(skills_root)
+            try:
+                barrier.wait()
+                return refresh_index(conn, catalog)
+            finally:
+                conn.close()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            changed = list(pool.map(refresh, range(4), timeout=60))
+        assert sorted(changed) == [0, 0, 0, 3]
+        conn = open_index(skills_root)
+        assert search_index(conn, "gateway")[0].skill == "architect"
+
+    @pytest.mark.parametrize(
+        "content", [b"not a database" * 100, b"SQLite format 3\x00" + b"\xff" * 200]
+    )
+    def test_corrupt_index_is_rebuilt(self, search_repo: Path, content: bytes):
+        path = index_path(search_repo / "skills")
+        path.parent.mkdir(parents=True)
+        path.write_bytes(content)
+        conn = open_index(search_repo / "skills")
+        refresh_index(conn, SkillCatalog.scan(search_repo / "skills"))
+        assert search_index(conn, "gateway")[0].skill == "architect"
+
+
+class TestSearchCommand:
+    def test_prints_results(self, search_repo: Path, capsys, monkeypatch):
+        monkeypatch.setattr(
+            "sys.argv",
+            ["agentskills search", "gateway", "--repo-path", str(search_repo)],
+        )
+        assert main() == 0
+        assert "architect" in capsys.readouterr().out
+
+    def test_json_skills_only(self, search_repo: Path, capsys, monkeypatch):
+        monkeypatch.setattr(
+            "sys.argv",
+            [
+                "agentskills search",
+                "architecture gateway",
+                "--repo-path",
+                str(search_repo),
+                "--json",
+                "--skills-only",
+            ],
+        )
+        assert main() == 0
+        results = json.loads(capsys.readouterr().out)
+        assert [r["skill"] for r in results] == ["architect"]
+
+    def test_query_refreshes_only_on_change(
+        self, search_repo: Path, capsys, monkeypatch
+    ):
+        skills_root = search_repo / "skills"
+        _age_dirs(skills_root)
+        argv = ["agentskills search", "zebra", "--repo-path", str(search_repo)]
+        monkeypatch.setattr("sys.argv", argv)
+        assert main() == 1
+        refreshes: list[int] = []
+
+        def counting_refresh(conn, catalog):
+            refreshes.append(refresh_index(conn, catalog))
+            return refreshes[-1]
+
+        monkeypatch.setattr("agentskills.search.refresh_index", counting_refresh)
+        assert main() == 1
+        assert refreshes == []
+
+        skill_md = skills_root / "architect" / "SKILL.md"
+        _write(skill_md, "---\nname: architect\ndescription: zebra\n---\n")
+        os.utime(skill_md, ns=(OLD_NS + 10**9, OLD_NS + 10**9))
+        monkeypatch.setattr("sys.argv", [*argv, "--no-refresh"])
+        assert main() == 1
+        monkeypatch.setattr("sys.argv", argv)
+        assert main() == 0
+        assert refreshes == [1]
+
+        _write(skills_root / "tdd-extra" / "SKILL.md", "---\nname: x\n---\n")
+        _write(skills_root / "architect" / "references" / "new.md", "okapi\n")
+        _age_dirs(skills_root, OLD_NS + 10**9)
+        monkeypatch.setattr("sys.argv", [*argv[:1], "okapi", *argv[2:]])
+        capsys.readouterr()
+        assert main() == 0
+        assert "new.md" in capsys.readouterr().out
+        assert refreshes == [1, 2]
+
+    def test_no_match_returns_error(self, search_repo: Path, capsys, monkeypatch):
+        monkeypatch.setattr(
+            "sys.argv",
+            ["agentskills search", "zzz", "--repo-path", str(search_repo)],
+        )
+        assert main() == 1
+        assert "No matches" in capsys.readouterr().out
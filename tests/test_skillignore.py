@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from agentskills.skillignore import IgnoreRules, walk_files
+
+
+def _touch(root: Path, *paths: str) -> None:
+    for rel in paths:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+
+
+def _walk(root: Path) -> list[str]:
+    return [path.relative_to(root).as_posix() for path in walk_files(root)]
+
+
+class TestIgnoreRules:
+    @pytest.mark.parametrize(
+        ("pattern", "path", "is_dir", "expected"),
+        [
+            ("*.log", "debug.log", False, True),
+            ("*.log", "deep/nested/debug.log", False, True),
+            ("*.log", "debug.log.txt", False, False),
+            ("/build", "build", True, True),
+            ("/build", "src/build", True, False),
+            ("docs/*.md", "docs/a.md", False, True),
+            ("docs/*.md", "docs/sub/a.md", False, False),
+            ("docs/**/*.md", "docs/sub/deep/a.md", False, True),
+            ("docs/**/*.md", "docs/a.md", False, True),
+            ("**/fixtures", "a/b/fixtures", True, True),
+            ("tmp/", "tmp", True, True),
+            ("tmp/", "tmp", False, False),
+            ("data?.csv", "data1.csv", False, True),
+            ("data[0-9].csv", "datax.csv", False, False),
+            ("data[!0-9].csv", "datax.csv", False, True),
+            (r"\#notes", "#notes", False, True),
+        ],
+    )
+    def test_patterns(self, pattern: str, path: str, is_dir: bool, expected: bool):
+        assert IgnoreRules([pattern]).ignored(path, is_dir) is expected
+
+    def test_comments_and_blank_lines(self):
+        rules = IgnoreRules(["# *.md", "", "   "])
+        assert not rules.ignored("README.md", is_dir=False)
+
+    def test_last_match_wins(self):
+        rules = IgnoreRules(["*.md", "!keep.md"])
+        assert rules.ignored("drop.md", is_dir=False)
+        assert not rules.ignored("keep.md", is_dir=False)
+
+    def test_defaults(self):
+        rules = IgnoreRules([])
+        assert rules.ignored("node_modules", is_dir=True)
+        assert rules.ignored("scripts/.venv", is_dir=True)
+        assert rules.ignored("a/.DS_Store", is_dir=False)
+        assert rules.ignored(".skillignore", is_dir=False)
+        assert not rules.ignored("node_modules", is_dir=False)
+
+    def test_defaults_can_be_negated(self):
+        assert not IgnoreRules(["!node_modules/"]).ignored("node_modules", True)
+
+
+class TestWalkFiles:
+    def test_order_is_files_then_subdirectories(self, tmp_path: Path):
+        _touch(tmp_path, "b/z.md", "b/a.md", "c.md", "a/x.md", "SKILL.md")
+        assert _walk(tmp_path) == ["SKILL.md", "c.md", "a/x.md", "b/a.md", "b/z.md"]
+
+    def test_prunes_default_ignores(self, tmp_path: Path):
+        _touch(
+            tmp_path,
+            "SKILL.md",
+            "node_modules/pkg/index.js",
+            "scripts/.venv/bin/python",
+            "scripts/run.py",
+            "scripts/__pycache__/run.cpython-311.pyc",
+        )
+        assert _walk(tmp_path) == ["SKILL.md", "scripts/run.py"]
+
+    def test_ignored_directories_are_not_listed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        _touch(tmp_path, "SKILL.md", "node_modules/pkg/index.js")
+        opened: list[str] = []
+        real_scandir = os.scandir
+
+        def scandir(path):
+            opened.append(Path(path).name)
+            return real_scandir(path)
+
+        monkeypatch.setattr("agentskills.skillignore.os.scandir", scandir)
+        assert _walk(tmp_path) == ["SKILL.md"]
+        assert opened == [tmp_path.name]
+
+    def test_skillignore(self, tmp_path: Path):
+        _touch(
+            tmp_path,
+            "SKILL.md",
+            "build/out.js",
+            "notes/draft.md",
+            "notes/keep.md",
+            "references/api.md",
+        )
+        (tmp_path / ".skillignore").write_text(
+            "# authoring only\n/build/\nnotes/*.md\n!notes/keep.md\n"
+        )
+        assert _walk(tmp_path) == ["SKILL.md", "notes/keep.md", "references/api.md"]
+
+    def test_file_in_ignored_directory_cannot_be_reincluded(self, tmp_path: Path):
+        _touch(tmp_path, "SKILL.md", "vendor/keep.txt")
+        (tmp_path / ".skillignore").write_text("vendor/\n!vendor/keep.txt\n")
+        assert _walk(tmp_path) == ["SKILL.md"]
+
+    def test_symlinked_directories_are_not_followed(self, tmp_path: Path):
+        skill = tmp_path / "skill"
+        _touch(tmp_path, "outside/secret.txt", "skill/SKILL.md")
+        (skill / "linked").symlink_to(tmp_path / "outside", target_is_directory=True)
+        assert _walk(skill) == ["SKILL.md"]
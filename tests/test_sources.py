@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from agentskills import sources
+from agentskills.bootstrap import main
+from agentskills.sources import Source, parse_source, parse_sources
+
+
+def _git(*args: str, cwd: Path) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _make_repo(root: Path, skills: dict[str, str]) -> Path:
+    """Create a committed repo with one SKILL.md per {name: body}."""
+    for name, body in skills.items():
+        skill = root / "skills" / name
+        skill.mkdir(parents=True)
+        (skill / "SKILL.md").write_text(f"---\nname: {name}\n---\n{body}\n")
+    _git("init", "-q", "-b", "main", cwd=root)
+    _git("add", "-A", cwd=root)
+    _git("commit", "-q", "-m", "init", cwd=root)
+    return root
+
+
+@pytest.fixture()
+def internal(tmp_path: Path) -> Path:
+    return _make_repo(tmp_path / "internal", {"spec": "internal spec"})
+
+
+@pytest.fixture()
+def public(tmp_path: Path) -> Path:
+    return _make_repo(
+        tmp_path / "public", {"spec": "public spec", "release": "public release"}
+    )
+
+
+def _run(monkeypatch, project: Path, *args: str) -> int:
+    monkeypatch.setattr("sys.argv", ["agentskills", "--project", str(project), *args])
+    return main()
+
+
+class TestParseSource:
+    def test_url_with_ref(self):
+        source = parse_source("https://example.com/org/skills.git#v2", "main")
+        assert source == Source("https://example.com/org/skills.git", "v2", None)
+
+    def test_url_defaults_to_ref(self):
+        assert parse_source("git@example.com:org/skills.git", "main").ref == "main"
+
+    @pytest.mark.parametrize(
+        "spec",
+        ["deploy@git.internal:team/skills.git", "git-ro@host.example.com:skills"],
+    )
+    def test_scp_url_with_any_user(self, spec: str):
+        assert parse_source(f"{spec}#v1", "main") == Source(spec, "v1", None)
+
+    def test_scp_url_without_user(self):
+        spec = "git.internal:team/skills.git"
+        assert parse_source(spec, "main") == Source(spec, "main", None)
+
+    @pytest.mark.parametrize("spec", ["C:/skills", "nested/dir:name", "./a:b"])
+    def test_drive_letters_and_paths_are_local(self, spec: str):
+        with pytest.raises(RuntimeError, match="does not exist"):
+            parse_source(spec, "main")
+
+    def test_local_path(self, internal: Path):
+        assert parse_source(str(internal), "main") == Source(None, None, internal)
+
+    def test_missing_path(self, tmp_path: Path):
+        with pytest.raises(RuntimeError, match="does not exist"):
+            parse_source(str(tmp_path / "nope"), "main")
+
+    def test_duplicate(self, internal: Path):
+        with pytest.raises(RuntimeError, match="given twice"):
+            parse_sources([str(internal), str(internal)], "main")
+
+    def test_cache_name_clash(self):
+        with pytest.raises(RuntimeError, match="share a clone cache"):
+            parse_sources(
+                ["https://a.example/x/skills.git", "https://b.example/y/skills.git"],
+                "main",
+            )
+
+
+class TestFederatedBootstrap:
+    def test_earlier_source_wins(
+        self, internal: Path, public: Path, tmp_path: Path, monkeypatch
+    ):
+        project = tmp_path / "project"
+        args = ("--source", str(internal), "--source", str(public), "--all")
+        assert _run(monkeypatch, project, *args) == 0
+
+        skills = project / ".agents" / "skills"
+        assert "internal spec" in (skills / "spec" / "SKILL.md").read_text()
+        assert "public release" in (skills / "release" / "SKILL.md").read_text()
+
+    def test_lock_records_every_source(
+        self, internal: Path, public: Path, tmp_path: Path, monkeypatch, capsys
+    ):
+        project = tmp_path / "project"
+        args = ("--source", str(internal), "--source", str(public), "--all")
+        assert _run(monkeypatch, project, *args) == 0
+        lock = json.loads((project / ".agents" / "skills.lock").read_text())
+        paths = [record["path"] for record in lock["source"]["sources"]]
+        assert paths == [str(internal), str(public)]
+        assert all(record["commit"] for record in lock["source"]["sources"])
+
+        capsys.readouterr()
+        assert _run(monkeypatch, project, *args) == 0
+        assert "up to date" in capsys.readouterr().out
+
+        (project / ".agents" / "skills" / "spec" / "SKILL.md").write_text("drift\n")
+        assert _run(monkeypatch, project, "--frozen") == 0
+        spec = project / ".agents" / "skills" / "spec" / "SKILL.md"
+        assert "internal spec" in spec.read_text()
+
+    def test_rejects_repo_path_too(
+        self, internal: Path, tmp_path: Path, monkeypatch, capsys
+    ):
+        args = ("--source", str(internal), "--repo-path", str(internal), "--all")
+        assert _run(monkeypatch, tmp_path / "project", *args) == 1
+        assert "either --source or --repo-url/--repo-path" in capsys.readouterr().err
+
+    def test_sources_are_fetched_in_parallel(self, tmp_path: Path, monkeypatch):
+        delay = 0.3
+        urls = {
+            f"https://example.com/{name}/repo-{name}.git": _make_repo(
+                tmp_path / name, {f"skill-{name}": name}
+            )
+            for name in "abc"
+        }
+
+        def slow_clone(repo_url: str, **kwargs) -> Path:
+            time.sleep(delay)
+            return urls[repo_url]
+
+        monkeypatch.setattr(sources, "clone_or_update_repo", slow_clone)
+        args = [arg for url in urls for arg in ("--source", url)]
+
+        start = time.perf_counter()
+        assert _run(monkeypatch, tmp_path / "project", *args, "--all") == 0
+        assert time.perf_counter() - start < delay * len(urls)
+        installed = sorted(
+            p.name for p in (tmp_path / "project" / ".agents" / "skills").iterdir()
+        )
+        assert installed == ["skill-a", "skill-b", "skill-c"]
@@ -0,0 +1,111 @@
+"""Startup-time budget for the agentskills entry point.
+
+The CLI runs inside agent hooks many times per session, so these tests
+guard both which stdlib modules each subcommand pulls in at import time
+and how long `agentskills list` takes to import and run. Budgets can be
+raised on slow machines with AGENTSKILLS_IMPORT_BUDGET_MS and
+AGENTSKILLS_LIST_BUDGET_MS.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+IMPORT_BUDGET_MS = float(os.environ.get("AGENTSKILLS_IMPORT_BUDGET_MS", "60"))
+LIST_BUDGET_MS = float(os.environ.get("AGENTSKILLS_LIST_BUDGET_MS", "150"))
+RUNS = 5
+
+HEAVY_MODULES = (
+    "concurrent.futures",
+    "shutil",
+    "sqlite3",
+    "subprocess",
+    "tarfile",
+    "tempfile",
+    "zipfile",
+)
+
+
+def _python(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True
+    )
+
+
+def _import_time_ms(modules: list[str]) -> float:
+    """Return the cumulative -X importtime cost of importing modules, in ms."""
+    result = _python("-X", "importtime", "-c", f"import {', '.join(modules)}")
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        top_level = len(name) - len(name.lstrip()) == 1
+        if top_level and name.strip() in modules:
+            total_us += int(cumulative)
+    return total_us / 1000
+
+
+# Heavy modules a subcommand needs on its common path anyway.
+ALLOWED_MODULES = {
+    "search": {"sqlite3"},
+    "package": {"shutil", "zipfile"},
+    "release": {"shutil", "zipfile"},
+}
+
+
+@pytest.mark.parametrize(
+    "command", ["list", "link", "bootstrap", "search", "package", "release"]
+)
+def test_subcommand_avoids_heavy_imports(command: str):
+    script = (
+        "import sys\n"
+        f"import agentskills.cli, agentskills.{command}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    loaded = _python("-c", script).stdout.strip()
+    allowed = ALLOWED_MODULES.get(command, set())
+    assert set(filter(None, loaded.split(","))) <= allowed
+
+
+def test_reconcile_does_not_import_bootstrap():
+    script = (
+        "import sys\n"
+        "import agentskills.cli, agentskills.link, agentskills.reconcile\n"
+        "print('agentskills.bootstrap' in sys.modules)\n"
+    )
+    assert _python("-c", script).stdout.strip() == "False"
+
+
+def test_list_import_budget():
+    best = min(
+        _import_time_ms(["agentskills.cli", "agentskills.list"]) for _ in range(RUNS)
+    )
+    assert 0 < best <= IMPORT_BUDGET_MS, (
+        f"importing agentskills list took {best:.1f}ms "
+        f"(budget {IMPORT_BUDGET_MS:.0f}ms)"
+    )
+
+
+def test_list_wall_time_budget(tmp_skill: Path):
+    def best_of(*args: str) -> float:
+        timings = []
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            _python(*args)
+            timings.append((time.perf_counter() - start) * 1000)
+        return min(timings)
+
+    baseline = best_of("-c", "pass")
+    listed = best_of("-m", "agentskills.cli", "list", "--repo-path", str(tmp_skill))
+    overhead = listed - baseline
+    assert overhead <= LIST_BUDGET_MS, (
+        f"agentskills list added {overhead:.1f}ms over a bare interpreter "
+        f"(budget {LIST_BUDGET_MS:.0f}ms)"
+    )
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import errno
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from agentskills.store import ObjectStore
+
+OLD_NS = 1_577_836_800 * 10**9
+
+
+@pytest.fixture()
+def skill_tree(tmp_path: Path) -> Path:
+    """A small skill with a nested file and an executable script."""
+    root = tmp_path / "src" / "demo"
+    (root / "scripts").mkdir(parents=True)
+    (root / "SKILL.md").write_text("---\nname: demo\n---\n# Demo\n")
+    (root / "notes.md").write_text("# Demo\n")
+    script = root / "scripts" / "run.sh"
+    script.write_text("#!/bin/sh\necho hi\n")
+    script.chmod(0o755)
+    for path in (root / "SKILL.md", root / "notes.md", script):
+        os.utime(path, ns=(OLD_NS, OLD_NS))
+    return root
+
+
+class TestObjectStore:
+    def test_identical_content_is_stored_once(self, skill_tree: Path, tmp_path: Path):
+        store = ObjectStore(tmp_path / "objects")
+        first, new_first = store.add(skill_tree / "notes.md")
+        second, new_second = store.add(skill_tree / "notes.md")
+        assert first == second
+        assert (new_first, new_second) == (True, False)
+
+    def test_objects_are_read_only(self, skill_tree: Path, tmp_path: Path):
+        store = ObjectStore(tmp_path / "objects")
+        obj, _ = store.add(skill_tree / "SKILL.md")
+        assert stat.S_IMODE(obj.stat().st_mode) == 0o444
+
+    def test_exec_bit_is_part_of_the_key(self, skill_tree: Path, tmp_path: Path):
+        store = ObjectStore(tmp_path / "objects")
+        plain = skill_tree / "plain.sh"
+        plain.write_bytes((skill_tree / "scripts" / "run.sh").read_bytes())
+        exec_obj, _ = store.add(skill_tree / "scripts" / "run.sh")
+        plain_obj, _ = store.add(plain)
+        assert exec_obj != plain_obj
+        assert stat.S_IMODE(exec_obj.stat().st_mode) == 0o555
+
+
+class TestLinkTree:
+    def test_projects_share_inodes(self, skill_tree: Path, tmp_path: Path):
+        store = ObjectStore(tmp_path / "objects")
+        first = store.link_tree(skill_tree, tmp_path / "a" / "demo")
+        second = store.link_tree(skill_tree, tmp_path / "b" / "demo")
+        assert first.linked == 3
+        assert first.stored == 3
+        assert second.stored == 0
+        a = (tmp_path / "a" / "demo" / "scripts" / "run.sh").stat()
+        b = (tmp_path / "b" / "demo" / "scripts" / "run.sh").stat()
+        assert a.st_ino == b.st_ino
+        assert (tmp_path / "b" / "demo" / "SKILL.md").read_text().startswith("---")
+
+    def test_falls_back_to_copy_across_devices(
+        self, skill_tree: Path, tmp_path: Path, monkeypatch
+    ):
+        def cross_device(src, dst):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr("agentskills.store.os.link", cross_device)
+        store = ObjectStore(tmp_path / "objects")
+        stats = store.link_tree(skill_tree, tmp_path / "a" / "demo")
+        assert (stats.linked, stats.copied) == (0, 3)
+        assert (tmp_path / "a" / "demo" / "notes.md").read_text() == "# Demo\n"
+
+    def test_unchanged_files_are_not_rehashed(
+        self, skill_tree: Path, tmp_path: Path, monkeypatch
+    ):
+        store = ObjectStore(tmp_path / "objects")
+        store.link_tree(skill_tree, tmp_path / "a" / "demo")
+        store.save()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file was re-hashed")
+
+        monkeypatch.setattr("agentskills.store.hashlib.file_digest", fail)
+        reopened = ObjectStore(tmp_path / "objects")
+        stats = reopened.link_tree(skill_tree, tmp_path / "b" / "demo")
+        assert stats.linked == 3
+
+    def test_recent_files_are_rehashed(self, skill_tree: Path, tmp_path: Path):
+        store = ObjectStore(tmp_path / "objects")
+        fresh = skill_tree / "fresh.md"
+        fresh.write_text("v1\n")
+        store.add(fresh)
+        fresh.write_text("v2\n")
+        obj, _ = store.add(fresh)
+        assert obj.read_text() == "v2\n"
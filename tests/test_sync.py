@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from agentskills.bootstrap import main
+from agentskills.sync import sync_tree
+
+OLD_NS = 1_577_836_800 * 10**9
+
+
+@pytest.fixture()
+def source(tmp_path: Path) -> Path:
+    root = tmp_path / "src" / "demo"
+    (root / "references").mkdir(parents=True)
+    (root / "SKILL.md").write_text("---\nname: demo\n---\n")
+    (root / "references" / "a.md").write_text("a\n")
+    (root / "references" / "b.md").write_text("b\n")
+    return root
+
+
+def _snapshot(root: Path) -> dict[str, int]:
+    return {
+        str(path.relative_to(root)): path.stat().st_mtime_ns for path in root.rglob("*")
+    }
+
+
+class TestSyncTree:
+    def test_initial_sync_adds_everything(self, source: Path, tmp_path: Path):
+        report = sync_tree(source, tmp_path / "dest")
+        assert report.added == ["SKILL.md", "references/a.md", "references/b.md"]
+        assert (tmp_path / "dest" / "references" / "b.md").read_text() == "b\n"
+
+    def test_up_to_date_tree_is_untouched(self, source: Path, tmp_path: Path):
+        dest = tmp_path / "dest"
+        sync_tree(source, dest)
+        before = _snapshot(dest)
+        report = sync_tree(source, dest)
+        assert not report.changed
+        assert _snapshot(dest) == before
+
+    def test_only_changed_files_are_rewritten(self, source: Path, tmp_path: Path):
+        dest = tmp_path / "dest"
+        sync_tree(source, dest)
+        inode = (dest / "references" / "a.md").stat().st_ino
+        (source / "references" / "b.md").write_text("b changed\n")
+        (source / "references" / "c.md").write_text("c\n")
+        (source / "SKILL.md").unlink()
+
+        report = sync_tree(source, dest)
+        assert report.added == ["references/c.md"]
+        assert report.updated == ["references/b.md"]
+        assert report.removed == ["SKILL.md"]
+        assert (dest / "references" / "a.md").stat().st_ino == inode
+        assert (dest / "references" / "b.md").read_text() == "b changed\n"
+
+    @pytest.mark.parametrize("checksum", [False, True])
+    def test_mtime_only_changes_are_not_rewritten(
+        self, source: Path, tmp_path: Path, checksum: bool
+    ):
+        dest = tmp_path / "dest"
+        sync_tree(source, dest)
+        inode = (dest / "SKILL.md").stat().st_ino
+        os.utime(source / "SKILL.md", ns=(OLD_NS, OLD_NS))
+        assert not sync_tree(source, dest, checksum=checksum).changed
+        assert (dest / "SKILL.md").stat().st_ino == inode
+        assert (dest / "SKILL.md").stat().st_mtime_ns == OLD_NS
+
+    def test_same_size_edit_with_new_mtime_is_rewritten(
+        self, source: Path, tmp_path: Path
+    ):
+        dest = tmp_path / "dest"
+        sync_tree(source, dest)
+        (source / "references" / "a.md").write_text("z\n")
+        os.utime(source / "references" / "a.md", ns=(OLD_NS, OLD_NS))
+        assert sync_tree(source, dest).updated == ["references/a.md"]
+        assert (dest / "references" / "a.md").read_text() == "z\n"
+
+    def test_replaces_symlinked_install(self, source: Path, tmp_path: Path):
+        dest = tmp_path / "dest"
+        dest.symlink_to(source, target_is_directory=True)
+        report = sync_tree(source, dest)
+        assert not dest.is_symlink()
+        assert len(report.added) == 3
+
+
+class TestBootstrapSync:
+    def _run(self, monkeypatch, *args: str) -> int:
+        monkeypatch.setattr("sys.argv", ["agentskills", *args])
+        return main()
+
+    def test_sync_reports_changes(
+        self, tmp_skill: Path, tmp_path: Path, capsys, monkeypatch
+    ):
+        project = tmp_path / "project"
+        args = ("--project", str(project), "--repo-path", str(tmp_skill))
+        assert self._run(monkeypatch, *args, "--skill", "test-skill") == 0
+        assert self._run(monkeypatch, *args, "--skill", "test-skill", "--sync") == 0
+        assert "(up to date)" in capsys.readouterr().out
+
+        extra = tmp_skill / "skills" / "test-skill" / "extra.md"
+        extra.write_text("extra\n")
+        assert self._run(monkeypatch, *args, "--skill", "test-skill", "--sync") == 0
+        out = capsys.readouterr().out
+        assert "(+1 ~0 -0)" in out
+        assert "+ extra.md" in out
+
+    def test_sync_requires_copy_mode(
+        self, tmp_skill: Path, tmp_path: Path, capsys, monkeypatch
+    ):
+        result = self._run(
+            monkeypatch,
+            "--project",
+            str(tmp_path / "project"),
+            "--repo-path",
+            str(tmp_skill),
+            "--skill",
+            "test-skill",
+            "--sync",
+            "--mode",
+            "symlink",
+        )
+        assert result == 1
+        assert "--sync requires --mode copy" in capsys.readouterr().err
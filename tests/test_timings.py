@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import io
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from agentskills import cli, timings
+
+
+@pytest.fixture(autouse=True)
+def reset_timings():
+    yield
+    timings.disable()
+
+
+class TestSpans:
+    def test_disabled_span_is_shared_noop(self):
+        assert timings.span("a") is timings.span("b")
+        with timings.span("a"):
+            pass
+        out = io.StringIO()
+        timings.report(out)
+        assert out.getvalue() == ""
+
+    def test_tree_report_nests_children(self):
+        timings.enable("tree")
+        with timings.span("outer"), timings.span("inner", skill="x"):
+            pass
+        out = io.StringIO()
+        timings.report(out)
+        lines = out.getvalue().splitlines()
+        assert lines[0] == "timings:"
+        assert lines[1].split()[0] == "outer"
+        assert lines[2].startswith("    inner")
+        assert lines[2].rstrip().endswith("skill=x")
+
+    def test_json_lines(self):
+        timings.enable("json")
+        with timings.span("outer"), timings.span("inner", skill="x"):
+            pass
+        out = io.StringIO()
+        timings.report(out)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [r["name"] for r in records] == ["outer", "inner"]
+        assert records[1]["parent"] == "outer"
+        assert records[1]["depth"] == 1
+        assert records[1]["attrs"] == {"skill": "x"}
+        assert records[0]["duration_ms"] >= records[1]["duration_ms"]
+
+    def test_worker_thread_spans_attach_to_main(self):
+        timings.enable("json")
+        with timings.span("outer") as outer:
+            worker = threading.Thread(target=lambda: timings.span("work").__enter__())
+            worker.start()
+            worker.join()
+        assert [child.name for child in outer.children] == ["work"]
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError, match="Unknown timings format"):
+            timings.enable("xml")
+
+
+class TestTimingsFlag:
+    def test_pop_flag(self, monkeypatch):
+        monkeypatch.delenv(cli.TIMINGS_ENV, raising=False)
+        argv = ["--timings=json", "list", "--long"]
+        assert cli.pop_timings_flag(argv) == "json"
+        assert argv == ["list", "--long"]
+
+    def test_flag_after_command_is_left_alone(self, monkeypatch):
+        monkeypatch.delenv(cli.TIMINGS_ENV, raising=False)
+        argv = ["search", "--", "--timings"]
+        assert cli.pop_timings_flag(argv) is None
+        assert argv == ["search", "--", "--timings"]
+
+    def test_env_fallback(self, monkeypatch):
+        monkeypatch.setenv(cli.TIMINGS_ENV, "1")
+        assert cli.pop_timings_flag(["list"]) == "tree"
+
+    def test_no_flag(self, monkeypatch):
+        monkeypatch.delenv(cli.TIMINGS_ENV, raising=False)
+        assert cli.pop_timings_flag(["list"]) is None
+
+    def test_bootstrap_reports_spans(
+        self, tmp_skill: Path, tmp_path: Path, capsys, monkeypatch
+    ):
+        monkeypatch.delenv(cli.TIMINGS_ENV, raising=False)
+        monkeypatch.setattr(
+            "sys.argv",
+            [
+                "agentskills",
+                "--timings=json",
+                "bootstrap",
+                "--project",
+                str(tmp_path / "project"),
+                "--skill",
+                "test-skill",
+                "--repo-path",
+                str(tmp_skill),
+            ],
+        )
+        assert cli.main() == 0
+        err = capsys.readouterr().err
+        records = [json.loads(line) for line in err.splitlines()]
+        names = [r["name"] for r in records]
+        assert names[0] == "agentskills bootstrap"
+        assert "load_catalog" in names
+        assert "install_skill" in names